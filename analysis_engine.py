@@ -10,6 +10,13 @@ No Slack / no env dependency: importable by slack_bot.py and runnable standalone
 Because each dated file is a FULL snapshot (not a diff), we walk every snapshot
 in the window pairwise to capture true open/close churn — including roles that
 opened AND closed inside the window, which an endpoint-only diff would miss.
+The same day-by-day diffs are also logged at crawl time
+(data/<company>/events.jsonl, common/event_log.py); when the log covers the
+window, position events are read from it and only the two end snapshots load.
+
+Rebuild the event logs from the snapshot history:
+
+    .venv/bin/python analysis_engine.py --rebuild-events [company ...]
 """
 
 import json
@@ -20,10 +27,16 @@ from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+import snapshot_store
 from compare_utils import compare_positions, compare_blogs, load_snapshot
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Add company_crawler to path (common/event_log.py)
+sys.path.insert(0, str(BASE_DIR / "company_crawler"))
+
+from common import event_log
+
 # Data-only company config. slack_bot keeps its own COMPANIES and passes those
 # dicts into the engine functions; this map exists for the standalone CLI.
 COMPANIES = {
@@ -175,13 +188,8 @@ def extract_themes(posts):
 # ==========================================
 
 def list_snapshot_dates(data_dir, prefix, file_type):
-    data_dir = Path(data_dir)
-    dates = set()
-    for f in data_dir.glob(f"[0-9]*_{prefix}_{file_type}.json"):
-        d = f.name.split("_")[0]
-        if len(d) == 8 and d.isdigit():
-            dates.add(d)
-    return sorted(dates)
+    # Full / manifest / delta days alike (see snapshot_store).
+    return snapshot_store.list_dates(data_dir, prefix, file_type)
 
 
 def snapshots_in_range(data_dir, prefix, file_type, start, end):
@@ -227,7 +235,8 @@ def _norm_date(s):
 # ==========================================
 
 def build_position_events(company, start, end):
-    """Walk every positions snapshot in [start, end] pairwise to extract events."""
+    """Position events in [start, end] — from the event log when it covers the
+    window, otherwise by walking every positions snapshot pairwise."""
     snaps = snapshots_in_range(company["data_dir"], company["prefix"], "positions", start, end)
     result = {
         "snapshots": [d for d, _ in snaps],
@@ -240,6 +249,11 @@ def build_position_events(company, start, end):
     if not snaps:
         return result
 
+    logged = _events_from_log(company, snaps)
+    if logged is not None:
+        result.update(logged)
+        return result
+
     loaded = []
     for d, p in snaps:
         data = load_snapshot(p) or []
@@ -285,6 +299,112 @@ def build_position_events(company, start, end):
     return result
 
 
+def _events_from_log(company, snaps):
+    """build_position_events() fields from data/<company>/events.jsonl, or None.
+
+    Usable when the log has a snapshot marker for every snapshot in the window
+    (the events between two markers are that day's diff) and replaying them
+    from the first snapshot reproduces each marker's headcount and the last
+    snapshot's ids. Several compares before one snapshot (reruns, a missed
+    day) are netted per id, as the pairwise diff would see them — ids, dates
+    and hashes exactly; title / location are the ones the logging run saw.
+    """
+    dates = [d for d, _ in snaps]
+    log = event_log.read(company["data_dir"])
+    marks = [i for i, e in enumerate(log)
+             if e.get("event") == "snapshot" and dates[0] <= e.get("date", "") <= dates[-1]]
+    if [log[i]["date"] for i in marks] != dates:
+        return None
+
+    start_state = load_snapshot(snaps[0][1]) or []
+    end_state = (load_snapshot(snaps[-1][1]) or []) if len(snaps) > 1 else start_state
+    live = {p.get("id") for p in start_state}
+    if log[marks[0]].get("positions") != len(live):
+        return None
+
+    out = {
+        "headcount_series": [(dates[0], len(live))],
+        "opens": [], "closes": [], "modifies": [], "reopens": [],
+        "start_state": start_state, "end_state": end_state,
+    }
+    first_open = {}   # id -> first date it appeared (within window)
+    last_closed = {}  # id -> date it was last removed
+    for k in range(1, len(marks)):
+        d_curr = dates[k]
+        # id -> [before, after]; each (description_hash, event) or None (not posted)
+        net = {}
+        for e in log[marks[k - 1] + 1:marks[k]]:
+            kind = e.get("event")
+            if kind in ("open", "reopen"):
+                before, after = None, (e["hash"], e)
+            elif kind == "close":
+                before, after = (e["hash"], e), None
+            elif kind == "modify":
+                before, after = (e["before_hash"], e), (e["after_hash"], e)
+            else:
+                continue
+            entry = net.get(e["id"])
+            if entry is None:
+                net[e["id"]] = [before, after]
+            elif (entry[1] is None) != (before is None):
+                return None  # open 두 번 / close 두 번 — 로그가 끊김
+            else:
+                entry[1] = after
+        if any((before is not None) != (pid in live) for pid, (before, _) in net.items()):
+            return None
+
+        for pid, (before, after) in net.items():
+            if before is None and after is not None:
+                p = after[1]
+                if pid in last_closed:
+                    out["reopens"].append({"id": pid, "title": p.get("title", ""),
+                                           "closed": last_closed.pop(pid), "reopened": d_curr})
+                out["opens"].append({
+                    "id": pid, "title": p.get("title", ""), "location": p.get("location", ""),
+                    "date": d_curr, "function": classify_function(p.get("title", "")),
+                    "seniority": classify_seniority(p.get("title", "")),
+                })
+                first_open.setdefault(pid, d_curr)
+                live.add(pid)
+        for pid, (before, after) in net.items():
+            if before is not None and after is None:
+                p = before[1]
+                opened = first_open.get(pid)
+                out["closes"].append({
+                    "id": pid, "title": p.get("title", ""), "date": d_curr,
+                    "days_open": _days_between(opened, d_curr) if opened else None,
+                    "function": classify_function(p.get("title", "")),
+                })
+                last_closed[pid] = d_curr
+                live.discard(pid)
+        for pid, (before, after) in net.items():
+            if before is not None and after is not None and before[0] != after[0]:
+                out["modifies"].append({"id": pid, "title": after[1].get("title", ""), "date": d_curr})
+
+        if log[marks[k]].get("positions") != len(live):
+            return None
+        out["headcount_series"].append((d_curr, len(live)))
+
+    if live != {p.get("id") for p in end_state}:
+        return None
+    return out
+
+
+def rebuild_event_log(company):
+    """Rewrite data/<company>/events.jsonl from the positions snapshot history."""
+    events, prev, closed = [], None, {}
+    for d, path in snapshots_in_range(company["data_dir"], company["prefix"], "positions",
+                                      "00000000", "99999999"):
+        data = load_snapshot(path) or []
+        curr = {p["id"]: p for p in data}
+        if prev is not None:
+            events += event_log.changes(prev, curr, d, closed)
+        events.append({"date": d, "event": "snapshot", "positions": len({p.get("id") for p in data})})
+        prev = curr
+    event_log.rewrite(company["data_dir"], events)
+    return events
+
+
 def build_blog_metrics(company, start, end):
     """Posts published in window (by post date) + edits detected via snapshot walk."""
     snaps = snapshots_in_range(company["data_dir"], company["prefix"], "blog", start, end)
@@ -555,8 +675,19 @@ def render_card_text(m):
 
 
 def _main():
+    if sys.argv[1:2] == ["--rebuild-events"]:
+        keys = [resolve_company(t) for t in sys.argv[2:]] or list(COMPANIES)
+        for token, key in zip(sys.argv[2:] or keys, keys):
+            if not key:
+                print(f"unknown company: {token}")
+                continue
+            events = rebuild_event_log(COMPANIES[key])
+            days = sum(e["event"] == "snapshot" for e in events)
+            print(f"[INFO] {key}: {len(events) - days} event(s) over {days} snapshot(s)")
+        return
     if len(sys.argv) < 2:
         print("usage: python analysis_engine.py <company> [startYYYYMMDD] [endYYYYMMDD]")
+        print("       python analysis_engine.py --rebuild-events [company ...]")
         print("companies:", ", ".join(COMPANIES))
         sys.exit(1)
     key = resolve_company(sys.argv[1])
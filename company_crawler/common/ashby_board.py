@@ -0,0 +1,303 @@
+"""One crawler for every Ashby-hosted job board (DYNA, Sunday, Genesis, Rhoda).
+
+All four used to carry their own copy of the same crawl: the posting API
+first (common/ashby.py), and when that fails the rendered board plus every
+Ashby detail page through the tab pool, with the list digest / card cache /
+checkpoint / time budget plumbing around it. `AshbyBoard` is that crawl once,
+so a speedup lands on all four boards at the same time:
+
+    BOARD = AshbyBoard("dyna", "dyna-robotics", DATA_PATH, id_scheme="title_location")
+
+    def position_crawler(provider=None):
+        return BOARD.crawl(provider)
+
+Configuration:
+  org           Ashby org slug — API board and jobs.ashbyhq.com/<org> links
+  list_url      page the job links are collected from (default: the board)
+  id_scheme     "uuid" (Ashby posting id) or "title_location" (kebab-case
+                title + "__" + location, the id DYNA / Sunday history uses)
+  board_fields  records also carry department / workplace
+
+Per-company differences are hooks: subclass and override `collect()` (read
+the job list off another page — Genesis uses genesis.ai/careers) or
+`api_workplace()`. A card is a dict with `href` as linked, the absolute `url`,
+`title`, `department` / `location` / `workplace` as the listing shows them,
+and `key`, the card fields that go into its fingerprint (together with `href`).
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional
+
+from common import budget
+from common.ashby import ASHBY_HOST, DETAIL_READY, WORKPLACE_LABELS, fetch_board, posting_fields
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.incremental import REVALIDATE_DAYS, CardCache, card_fingerprint
+from common.page_pool import fetch_details
+from common.rate_limit import throttle
+from common.waits import wait_ready
+
+_EMPTY_DETAIL = {"location": "", "compensation": "", "description": ""}
+
+
+class AshbyBoard:
+    """회사 하나의 Ashby 채용 보드 — API 우선, 실패하면 렌더된 보드 + 상세 페이지."""
+
+    def __init__(self, company, org, data_path, list_url=None, id_scheme="uuid",
+                 board_fields=True, list_timeout=30000):
+        if id_scheme not in ("uuid", "title_location"):
+            raise ValueError(f"unknown Ashby id scheme {id_scheme!r}")
+        self.company = company
+        self.org = org
+        self.data_path = data_path
+        self.list_url = list_url or f"{ASHBY_HOST}/{org}"
+        self.id_scheme = id_scheme
+        self.board_fields = board_fields
+        self.list_timeout = list_timeout
+
+    def crawl(self, provider=None) -> Optional[List[Dict]]:
+        # 1순위: Ashby posting API (보드 전체 + JD + 보상을 한 번의 HTTP 호출로)
+        try:
+            return self.crawl_api()
+        except Exception as e:
+            print(f"[WARN] Ashby API fetch failed ({e}); falling back to browser crawl")
+
+        return self.crawl_browser(provider)
+
+    def crawl_api(self) -> List[Dict]:
+        positions = []
+        for job in fetch_board(self.org):
+            fields = posting_fields(self.org, job)
+            positions.append(self.record(
+                uuid=fields["uuid"],
+                title=fields["title"],
+                department=fields["department"],
+                location=fields["location"],
+                workplace=self.api_workplace(fields["workplace"]),
+                compensation=fields["compensation"],
+                description=fields["description"],
+                url=fields["url"],
+            ))
+
+        print(f"[INFO] Fetched {len(positions)} job postings from Ashby API")
+        return positions
+
+    def crawl_browser(self, provider) -> Optional[List[Dict]]:
+        positions = []
+
+        with open_browser(self.company, provider) as browser:
+            page = browser.new_page()
+            throttle(self.list_url)
+            page.goto(self.list_url, wait_until="domcontentloaded", timeout=self.list_timeout)
+            cards = [card for card in self.collect(page) if card["title"]]
+            print(f"[INFO] Found {len(cards)} job postings")
+
+            # 카드가 그대로인 공고는 이전 레코드 재사용, 나머지만 상세 페이지 로드
+            fingerprints = [card_fingerprint(card["href"], *card["key"]) for card in cards]
+            # 목록이 지난번과 같으면 (검증 기한 내) 상세 페이지를 하나도 열지 않음
+            digest = ListDigest(self.data_path)
+            if digest.unchanged(fingerprints):
+                return None
+            cache = CardCache(self.data_path, days=1 if digest.full else REVALIDATE_DAYS)
+            # 오늘 중단됐던 crawl의 재실행이면 이미 받은 공고는 체크포인트에서 이어받음
+            checkpoint = Checkpoint(self.data_path)
+            reused = [checkpoint.get(fp) or cache.reuse(fp) for fp in fingerprints]
+
+            details = iter(fetch_details(
+                browser,
+                [card for card, prev in zip(cards, reused) if prev is None],
+                url_of=lambda card: card["url"],
+                read=_read_detail,
+                ready=DETAIL_READY,
+                site=f"{self.company}/detail",
+            ))
+
+            failed = 0
+            for idx, (card, fp, prev) in enumerate(zip(cards, fingerprints, reused)):
+                if prev is not None:
+                    positions.append(prev)
+                    cache.remember(fp, prev)
+                    continue
+
+                detail = next(details)
+                if detail is None:
+                    failed += 1
+                    # 시간 예산 소진 / 로드 실패 → 알던 공고면 이전 레코드를 그대로 이어감
+                    # (삭제나 JD 변경으로 보고되지 않게)
+                    if cache.carry_into(positions, fp):
+                        continue
+                    if budget.partial():
+                        continue  # 새 공고는 다음 crawl에서
+                    if self.id_scheme == "title_location":
+                        # id가 상세 페이지의 location에 달려 있어 임시 레코드를 만들 수 없음
+                        print(f"[ERROR] Failed to process {card['title']}")
+                        continue
+                    print(f"[WARN] Empty description: {card['title']}")
+
+                print(f"[INFO] ({idx+1}/{len(cards)}) Processing: {card['title']}")
+                detail = detail or _EMPTY_DETAIL
+                location = detail["location"]
+                if self.id_scheme == "uuid":
+                    # id가 location과 무관한 보드만 목록 카드의 location으로 보충
+                    # (title_location id는 예전처럼 상세 페이지 location만 — id가 바뀌지 않게)
+                    location = location or card["location"]
+                position = self.record(
+                    uuid=card["url"].rstrip("/").split("/")[-1],
+                    title=card["title"],
+                    department=card["department"],
+                    location=location,
+                    workplace=card["workplace"],
+                    compensation=detail["compensation"],
+                    description=detail["description"],
+                    url=card["url"],
+                )
+                positions.append(position)
+                cache.remember(fp, position)
+                if detail["description"]:
+                    checkpoint.add(fp, position)
+
+            # 모든 카드가 상세까지 받아졌을 때만 digest 저장 (실패한 공고가 묻히지 않게)
+            if len(positions) == len(fingerprints) and not failed:
+                digest.save()
+            cache.save()
+
+        return positions
+
+    def collect(self, page) -> List[Dict]:
+        """보드 목록의 공고 카드 (UUID 상세 링크만)."""
+        # 공고 카드 수가 더 이상 늘지 않을 때까지 (고정 sleep 대신)
+        wait_ready(page, f'a[href*="/{self.org}/"]', f"{self.company}/list",
+                   timeout=30000, stable_ms=500)
+        links = page.evaluate(_BOARD_JS, self.org)
+
+        cards = []
+        for link in links:
+            # 목록 메타라인: "Department • Location • Full time • On-site"
+            parts = [s.strip() for s in (link["meta"] or "").split("•") if s.strip()]
+            cards.append({
+                "href": link["href"],
+                "url": f"{ASHBY_HOST}{link['href']}",
+                "title": link["title"],
+                "department": parts[0] if len(parts) > 0 else "",
+                "location": parts[1] if len(parts) > 1 else "",
+                "workplace": parts[3] if len(parts) > 3 else "",
+                "key": [link["title"], link["meta"]],
+            })
+        return cards
+
+    def api_workplace(self, value):
+        """API workplaceType enum → 보드 목록과 같은 표기 ("OnSite" → "On-site")."""
+        return WORKPLACE_LABELS.get(value, value)
+
+    def position_id(self, uuid, title, location):
+        if self.id_scheme == "uuid":
+            # Ashby UUID — 제목 중복 / location 변동에 견고
+            return uuid
+        return normalize_id(title + "__" + location)
+
+    def record(self, uuid, title, department, location, workplace, compensation,
+               description, url) -> Dict:
+        """position 레코드 (키 순서는 회사별 기존 *_positions.json과 동일)."""
+        position = {"id": self.position_id(uuid, title, location), "title": title}
+        if self.board_fields:
+            position["department"] = department
+        position["location"] = location
+        if self.board_fields:
+            position["workplace"] = workplace
+        position["compensation"] = compensation
+        position["description"] = description
+        position["description_hash"] = hash_text(description)
+        position["url"] = url
+        return position
+
+
+def normalize_id(title: str) -> str:
+    """
+    Title -> lowercase, kebab-case id
+    """
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def _read_detail(page, card):
+    """Ashby 상세 페이지(이미 로드됨)에서 location / compensation / description 추출.
+
+    description이 비었으면 None을 돌려 탭 풀이 재시도하게 한다.
+    """
+    data = page.evaluate(_DETAIL_JS)
+    if data["description"] and len(data["description"]) >= 30:
+        return data
+    return None
+
+
+# org 보드의 UUID 상세 링크 (목록/필터 링크 제외)
+_BOARD_JS = r"""
+    org => {
+        const pattern = new RegExp('/' + org.replace(/[.*+?^${}()|[\]\\]/g, '\\$&') + '/[a-f0-9-]{36}$');
+        const seen = new Set();
+        const out = [];
+        document.querySelectorAll(`a[href*="/${org}/"]`).forEach(a => {
+            const href = a.getAttribute('href') || '';
+            if (!pattern.test(href) || seen.has(href)) return;
+            seen.add(href);
+            const h3 = a.querySelector('h3');
+            const p = a.querySelector('p');
+            out.push({
+                href: href,
+                title: h3 ? h3.innerText.trim() : '',
+                meta: p ? p.innerText.trim() : '',
+            });
+        });
+        return out;
+    }
+"""
+
+# common.ashby.description_text()가 API 경로에서 그대로 재현하는 변환
+_DETAIL_JS = r"""
+    () => {
+        const result = { location: '', compensation: '', description: '' };
+
+        // Left pane: Location / Compensation
+        const sections = document.querySelectorAll('div[class*="section"]');
+        sections.forEach(section => {
+            const heading = section.querySelector('h2');
+            if (!heading) return;
+            const headingText = heading.innerText.trim().toLowerCase();
+            if (headingText === 'location') {
+                const content = section.querySelector('p');
+                if (content) result.location = content.innerText.trim();
+            } else if (headingText === 'compensation') {
+                const compSpan = section.querySelector('span[class*="compensationTierSummary"]');
+                if (compSpan) {
+                    result.compensation = compSpan.innerText.trim();
+                } else {
+                    const content = section.querySelector('p');
+                    if (content) result.compensation = content.innerText.trim();
+                }
+            }
+        });
+
+        // Description (HTML -> 읽기 좋은 텍스트)
+        const descEl = document.querySelector('div[class*="descriptionText"], .ashby-job-posting-description');
+        if (descEl) {
+            const clone = descEl.cloneNode(true);
+            clone.querySelectorAll('h2').forEach(h2 => {
+                h2.innerHTML = '\n\n## ' + h2.innerText + '\n';
+            });
+            clone.querySelectorAll('li').forEach(li => {
+                li.innerHTML = '• ' + li.innerText + '\n';
+            });
+            clone.querySelectorAll('p').forEach(p => {
+                if (p.innerText.trim()) p.innerHTML = p.innerText + '\n';
+            });
+            result.description = clone.innerText.trim();
+        }
+
+        return result;
+    }
+"""
@@ -0,0 +1,308 @@
+"""Shared Playwright browser setup for the crawlers.
+
+One `BrowserProvider` owns one Chromium for a whole run: daily_crawler
+creates it once and passes it through every `main.run()`, and each crawl
+gets a fresh BrowserContext from `open_browser(company, provider)` (clean
+cookies/storage, same process). Chromium is launched lazily — a run that is
+served entirely by the job-board APIs never starts it — and is relaunched
+between crawls once it has opened CRAWL_RECYCLE_PAGES pages, which caps the
+memory a long run can accumulate. Called with provider=None (standalone
+crawler / `python -m <company>.main`), `open_browser` makes its own.
+
+Every crawl only reads DOM text, but a default page still pulls hero images,
+web fonts, videos and third-party analytics. Each crawl context gets a route
+handler that aborts those requests before they hit the network. Stylesheets
+and scripts are left alone: the SPAs need their JS, and `innerText` depends
+on CSS layout (block/hidden elements), so dropping CSS would change the
+extracted text and its hashes.
+
+A site that misbehaves without one of the blocked types can be opted back in
+through ALLOWLIST (company key -> resource types / "tracker"). Setting
+CRAWL_BLOCK_RESOURCES=0 disables blocking entirely (e.g. to debug a page).
+
+Blocked requests never reach the network, so their exact size is unknown.
+The summary printed on close() therefore reports how many requests were
+blocked per type, next to the bytes actually transferred (Content-Length of
+the responses that did load). The same numbers go to common/metrics.py as a
+"browser" event, and every main-frame navigation is logged as a "nav" event
+with its network time.
+
+CRAWL_BROWSER_CACHE=1 (opt-in) switches the provider to a persistent profile
+under `data/.browser_cache/<profile>` (`launch_persistent_context`), so the
+Ashby / SvelteKit / Lovable / Webflow JS bundles come from the HTTP disk
+cache on warm runs. A persistent profile is a single context, so crawls then
+share it (each still gets its own pages, route handler and stats). The cache
+is capped at CRAWL_BROWSER_CACHE_MB: Chromium is told the limit, and before
+each launch the oldest cache entries are evicted until the profile fits.
+Parallel workers use one profile per company (a profile can only be open in
+one Chromium at a time). Fixture record/replay runs (common/replay.py) always
+use fresh contexts, so no response is served from the cache unseen.
+"""
+
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright.sync_api import sync_playwright
+
+from common import metrics, replay, waits
+
+RECYCLE_PAGES = int(os.environ.get("CRAWL_RECYCLE_PAGES", "200"))
+USE_CACHE = os.environ.get("CRAWL_BROWSER_CACHE", "0") == "1"
+CACHE_ROOT = Path("data/.browser_cache")
+CACHE_MAX_MB = int(os.environ.get("CRAWL_BROWSER_CACHE_MB", "300"))
+BLOCK_RESOURCES = os.environ.get("CRAWL_BLOCK_RESOURCES", "1") != "0"
+BLOCKED_TYPES = {"image", "media", "font"}
+
+# 읽지 않는 3rd-party 분석/광고/채팅 위젯 (hostname suffix)
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "amplitude.com",
+    "posthog.com",
+    "plausible.io",
+    "fullstory.com",
+    "intercom.io",
+    "hs-scripts.com",
+    "hs-analytics.net",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "va.vercel-scripts.com",
+)
+
+# company key (daily_crawler.COMPANIES) -> 차단하지 않을 resource type / "tracker"
+# 예) "sunday": {"font"}  — 아이콘 폰트가 없으면 카드가 렌더되지 않는 경우
+ALLOWLIST = {}
+
+
+@contextmanager
+def open_browser(company, provider=None):
+    """크롤 하나 동안 쓸 CrawlBrowser. provider가 없으면 이 크롤 전용으로 띄운다."""
+    own = provider is None
+    if own:
+        provider = BrowserProvider(profile=company)
+    metrics.set_company(company)
+    try:
+        browser = provider.session(company)
+        try:
+            yield browser
+        finally:
+            browser.close()
+    finally:
+        if own:
+            provider.close()
+
+
+class BrowserProvider:
+    """한 run 동안 공유하는 Chromium. 크롤마다 새 context를 내준다."""
+
+    def __init__(self, headless=True, recycle_after=RECYCLE_PAGES,
+                 profile="default", persistent=USE_CACHE):
+        self.headless = headless
+        self.recycle_after = recycle_after
+        self.profile = profile
+        self.persistent = persistent and not replay.mode()
+        self.pages = 0
+        self.launches = 0
+        self._playwright = None
+        self._browser = None
+
+    def session(self, company):
+        if self._browser is not None and self.pages >= self.recycle_after:
+            print(f"[INFO] Recycling Chromium after {self.pages} pages")
+            self._close_browser()
+        if self._browser is None:
+            self._launch()
+        try:
+            context = self._new_context()
+        except Exception as e:
+            # 이전 크롤에서 Chromium이 죽었으면 다시 띄워서 나머지 회사는 계속 진행
+            print(f"[WARN] Chromium unusable ({e}); relaunching")
+            self._close_browser()
+            self._launch()
+            context = self._new_context()
+        replay.attach(context)
+        return CrawlBrowser(self, context, company, shared=self.persistent)
+
+    def _new_context(self):
+        if self.persistent:
+            return self._browser
+        return self._browser.new_context()
+
+    def _launch(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        if self.persistent:
+            # persistent 모드에서는 _browser 자리에 (유일한) BrowserContext가 들어간다
+            user_dir = CACHE_ROOT / self.profile
+            max_bytes = CACHE_MAX_MB * 1024 * 1024
+            evict_cache(user_dir, max_bytes)
+            self._browser = self._playwright.chromium.launch_persistent_context(
+                str(user_dir),
+                headless=self.headless,
+                args=[f"--disk-cache-size={max_bytes}"],
+            )
+        else:
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+        self.pages = 0
+        self.launches += 1
+
+    def close(self):
+        self._close_browser()
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def _close_browser(self):
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CrawlBrowser:
+    """크롤 하나의 context. Browser 자리에 넘겨 쓴다 (page_pool 등은 `new_page()`만 필요)."""
+
+    def __init__(self, provider, context, company, shared=False):
+        self.provider = provider
+        self.company = company
+        self.context = context
+        self.shared = shared
+        self._pages = []
+        self.allowed = ALLOWLIST.get(company, set())
+        self.blocked = Counter()
+        self.bytes_loaded = 0
+        self.opened_at = time.monotonic()
+
+        if BLOCK_RESOURCES:
+            self.context.route("**/*", self._route)
+        self.context.on("response", self._count_bytes)
+        self.context.on("requestfinished", self._log_navigation)
+
+    def new_page(self):
+        self.provider.pages += 1
+        page = self.context.new_page()
+        self._pages.append(page)
+        return page
+
+    def close(self):
+        if self.context is None:
+            return
+        self.report()
+        waits.report()
+        metrics.record(f"{self.company}/browser", "browser",
+                       (time.monotonic() - self.opened_at) * 1000, pages=len(self._pages),
+                       bytes=self.bytes_loaded, blocked=sum(self.blocked.values()))
+        try:
+            if self.shared:
+                # persistent profile은 다음 크롤이 이어 쓰므로 이 크롤의 흔적만 정리
+                for page in self._pages:
+                    page.close()
+                if BLOCK_RESOURCES:
+                    self.context.unroute("**/*", self._route)
+                self.context.remove_listener("response", self._count_bytes)
+                self.context.remove_listener("requestfinished", self._log_navigation)
+            else:
+                self.context.close()
+        except Exception:
+            pass
+        self.context = None
+
+    def report(self):
+        blocked = sum(self.blocked.values())
+        kinds = ", ".join(f"{kind} {n}" for kind, n in self.blocked.most_common())
+        print(f"[INFO] {self.company}: blocked {blocked} requests"
+              f"{f' ({kinds})' if kinds else ''}, "
+              f"transferred {self.bytes_loaded / 1024 / 1024:.1f} MB")
+
+    def _route(self, route):
+        kind = _block_kind(route.request)
+        if kind and kind not in self.allowed:
+            self.blocked[kind] += 1
+            route.abort()
+        else:
+            route.fallback()
+
+    def _count_bytes(self, response):
+        try:
+            self.bytes_loaded += int(response.headers.get("content-length") or 0)
+        except ValueError:
+            pass
+
+    def _log_navigation(self, request):
+        # 메인 프레임 문서 요청만 (iframe / XHR 제외) — 시작부터 응답 끝까지의 네트워크 시간
+        try:
+            if not request.is_navigation_request() or request.frame.parent_frame is not None:
+                return
+            elapsed = request.timing.get("responseEnd", -1)
+        except Exception:
+            return
+        if elapsed >= 0:
+            host = urlparse(request.url).hostname or ""
+            metrics.record(f"{self.company}/{host}", "nav", elapsed, url=request.url)
+
+
+def evict_cache(user_dir, max_bytes):
+    """프로필이 max_bytes를 넘으면 오래된 캐시 파일부터 삭제 (프로필 설정은 유지)."""
+    files = []
+    for path in Path(user_dir).rglob("*"):
+        try:
+            if path.is_file():
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            continue
+
+    total = sum(size for _, size, _ in files)
+    if total <= max_bytes:
+        return
+
+    # Cache / Code Cache / GPUCache 등 "*Cache" 디렉터리 안의 엔트리만 대상.
+    # 인덱스 파일은 남겨두면 Chromium이 빠진 엔트리를 miss로 처리한다.
+    target = max_bytes * 0.8
+    evicted = 0
+    for _, size, path in sorted(files):
+        if total <= target:
+            break
+        if not any(part.endswith("Cache") for part in path.parent.parts):
+            continue
+        if path.name in ("index", "the-real-index"):
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        evicted += size
+
+    print(f"[INFO] Browser cache {user_dir}: evicted {evicted / 1024 / 1024:.1f} MB, "
+          f"now {total / 1024 / 1024:.1f} MB")
+
+
+def _block_kind(request):
+    """차단 대상이면 분류("image"/"media"/"font"/"tracker"), 아니면 None."""
+    if request.resource_type in BLOCKED_TYPES:
+        return request.resource_type
+    host = urlparse(request.url).hostname or ""
+    if any(host == t or host.endswith("." + t) for t in TRACKER_HOSTS):
+        return "tracker"
+    return None
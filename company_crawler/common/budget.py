@@ -0,0 +1,51 @@
+"""Per-company wall-clock crawl budget (cooperative cancellation).
+
+One slow or hung site — a render that never settles, 3 retries x 60s
+timeouts on every detail page — used to hold up the whole daily run and with
+it the Slack report. daily_crawler now calls `start()` before each company;
+once CRAWL_COMPANY_BUDGET seconds have passed, crawlers stop opening new
+detail pages:
+
+    if out_of_time("dyna/detail"):
+        break
+
+Nothing is interrupted mid-page. Postings / posts that were already known but
+not re-fetched are carried over from the previous snapshot
+(CardCache.carry / StoredPosts.carry), so position_compare does not see them as
+removed. New cards are simply left for the next run. `partial()` tells
+daily_crawler to mark the company as partial in the report, and a partial
+crawl never records a list digest (common/digest.py).
+
+Without `start()` (running a company's main.py directly) there is no budget.
+"""
+
+import os
+import time
+
+COMPANY_BUDGET = int(os.environ.get("CRAWL_COMPANY_BUDGET", "900"))
+
+_deadline = None
+_partial = False
+
+
+def start(seconds=COMPANY_BUDGET):
+    """회사 하나의 crawl 시작 — 0 이하/None이면 예산 없음."""
+    global _deadline, _partial
+    _deadline = time.monotonic() + seconds if seconds and seconds > 0 else None
+    _partial = False
+
+
+def out_of_time(site="") -> bool:
+    """예산이 다 됐으면 True — 호출자는 남은 상세 페이지를 건너뛴다 (partial로 기록)."""
+    global _partial
+    if _deadline is None or time.monotonic() < _deadline:
+        return False
+    if not _partial:
+        print(f"[WARN] {site or 'crawl'}: time budget exhausted, skipping remaining detail pages")
+    _partial = True
+    return True
+
+
+def partial() -> bool:
+    """이번 회사 crawl에서 예산 때문에 건너뛴 작업이 있었는지."""
+    return _partial
@@ -0,0 +1,105 @@
+"""List-page digests: skip a company's detail crawl when its list is unchanged.
+
+Right after reading a list page, a crawler hands its card fingerprints
+(common.incremental.card_fingerprint of href / title / date ...) to
+`ListDigest.unchanged()`. The sorted fingerprints are hashed and compared
+with the digest stored next to the data file
+(`data/<company>/.<prefix>_positions_digest.json` / `..._blog_digest.json`).
+On a match the crawler returns None without opening a single detail page,
+and `main.run()` reports `{"status": "checked"}`.
+
+JD / article edits do not show up on the list, so a match is only trusted for
+CRAWL_MAX_STALE_DAYS days after the last full verification. Past that — or
+when the run is started with `daily_crawler.py --force-full`
+(CRAWL_FORCE_FULL=1) — the crawl is "full": every detail page is re-fetched,
+bypassing the card/body reuse of common.incremental, and the verification
+date is reset.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+from common import budget, replay
+
+MAX_STALE_DAYS = int(os.environ.get("CRAWL_MAX_STALE_DAYS", "7"))
+
+
+def force_full() -> bool:
+    # 호출 시점에 읽음 — daily_crawler가 인자 파싱 후 설정한다.
+    # fixture record/replay는 매번 모든 상세 페이지를 거쳐야 의미가 있음
+    return os.environ.get("CRAWL_FORCE_FULL", "0") == "1" or bool(replay.mode())
+
+
+class ListDigest:
+    """목록 카드 지문들의 digest + 마지막 전체 검증일."""
+
+    def __init__(self, data_path, max_stale_days: int = MAX_STALE_DAYS):
+        data_path = Path(data_path)
+        self.path = data_path.with_name(f".{data_path.stem}_digest.json")
+        self.max_stale_days = max_stale_days
+        self.digest = ""
+        self.full = False
+
+        try:
+            self._stored = json.loads(self.path.read_text(encoding="utf-8"))
+            if not isinstance(self._stored, dict):
+                raise ValueError
+        except Exception:
+            self._stored = {}
+
+    def unchanged(self, fingerprints) -> bool:
+        """목록이 지난번과 같고 검증 기한도 남았으면 True (상세 크롤 생략 가능)."""
+        fingerprints = list(fingerprints)
+        if not fingerprints:
+            return False  # 빈 목록은 crawl/compare의 기존 빈-결과 처리에 맡김
+        self.digest = hashlib.sha256(
+            "\n".join(sorted(fingerprints)).encode("utf-8")
+        ).hexdigest()
+
+        if force_full():
+            print(f"[INFO] {self.path.name}: --force-full, re-fetching every detail page")
+            self.full = True
+            return False
+
+        age = self._age_days()
+        if age is not None and age >= self.max_stale_days:
+            print(f"[INFO] {self.path.name}: last full verification {age} days ago, "
+                  "re-fetching every detail page")
+            self.full = True
+            return False
+
+        if self.digest == self._stored.get("digest"):
+            print(f"[INFO] {self.path.name}: list unchanged, skipping detail crawl")
+            return True
+        return False
+
+    def save(self):
+        """크롤이 모든 카드를 레코드로 만들었을 때만 호출 (빠진 공고가 digest에 묻히지 않게)."""
+        # 시간 예산으로 잘린 crawl은 이어받은 레코드가 섞여 있으므로 기록하지 않음
+        # fixture record/replay 실행도 — 옛 fixture 내용으로 실제 crawl의 검증일을 갱신하지 않게
+        if not self.digest or budget.partial() or replay.mode():
+            return
+        verified = date.today().isoformat()
+        if not self.full and self._stored.get("verified"):
+            verified = self._stored["verified"]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps({"digest": self.digest, "verified": verified}, indent=2),
+            encoding="utf-8"
+        )
+
+    def _age_days(self):
+        try:
+            return (date.today() - date.fromisoformat(self._stored["verified"])).days
+        except Exception:
+            return None
+
+
+def compare_or_checked(items, compare):
+    """crawler가 None(목록 unchanged)을 돌려주면 compare 없이 "checked"로 보고."""
+    if items is None:
+        return {"status": "checked"}
+    return compare(items)
@@ -0,0 +1,131 @@
+"""Append-only position event log: `data/<company>/events.jsonl`.
+
+Each daily position_compare already knows what opened, closed and changed;
+instead of dropping that once the Slack report is out, it appends one line
+per change:
+
+    {"date": "20260612", "event": "open",   "id": ..., "title": ..., "location": ..., "hash": ...}
+    {"date": "20260612", "event": "reopen", ..., "closed": "20260530"}  # open of a closed id
+    {"date": "20260612", "event": "close",  "id": ..., "title": ..., "location": ..., "hash": ...}
+    {"date": "20260612", "event": "modify", "id": ..., "title": ..., "before_hash": ..., "after_hash": ...}
+
+and save_daily_snapshots() closes the day with a marker:
+
+    {"date": "20260612", "event": "snapshot", "positions": 27}
+
+The events between two markers are what changed from one dated snapshot to
+the next, so analysis_engine.build_position_events() reads them instead of
+diffing every snapshot pair, whenever the window's markers are all there
+(see analysis_engine._events_from_log). `hash` is the description_hash.
+Existing history is converted with `analysis_engine.py --rebuild-events`.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+LOG_NAME = "events.jsonl"
+
+
+def log_path(data_dir):
+    return Path(data_dir) / LOG_NAME
+
+
+def read(data_dir):
+    """Every logged line, in append order (a torn last line is skipped)."""
+    try:
+        lines = log_path(data_dir).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+    events = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return events
+
+
+def append(data_dir, events):
+    if not events:
+        return
+    path = log_path(data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events))
+
+
+def rewrite(data_dir, events):
+    """Replace the whole log (rebuild from snapshots), atomically."""
+    path = log_path(data_dir)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def description_hash(position):
+    # compare_utils.compare_positions와 같은 규칙 (없으면 description으로 계산)
+    if "description_hash" in position:
+        return position["description_hash"]
+    return hashlib.sha256((position.get("description") or "").encode("utf-8")).hexdigest()
+
+
+def changes(prev_map, curr_map, date, closed):
+    """Normalized events between two id -> position maps.
+
+    `closed` maps id -> date of its last close and is updated in place, so a
+    returning id is logged as "reopen".
+    """
+    events = []
+    for pid in curr_map.keys() - prev_map.keys():
+        p = curr_map[pid]
+        event = {"date": date, "event": "open", "id": pid, "title": p.get("title", ""),
+                 "location": p.get("location", ""), "hash": description_hash(p)}
+        if pid in closed:
+            event["event"] = "reopen"
+            event["closed"] = closed.pop(pid)
+        events.append(event)
+    for pid in prev_map.keys() - curr_map.keys():
+        p = prev_map[pid]
+        events.append({"date": date, "event": "close", "id": pid, "title": p.get("title", ""),
+                       "location": p.get("location", ""), "hash": description_hash(p)})
+        closed[pid] = date
+    for pid in prev_map.keys() & curr_map.keys():
+        before, after = description_hash(prev_map[pid]), description_hash(curr_map[pid])
+        if before != after:
+            events.append({"date": date, "event": "modify", "id": pid,
+                           "title": curr_map[pid].get("title", ""),
+                           "before_hash": before, "after_hash": after})
+    return events
+
+
+def last_closed(events):
+    """id -> date of its last close, for ids not open again since."""
+    closed = {}
+    for e in events:
+        if e.get("event") == "close":
+            closed[e["id"]] = e["date"]
+        elif e.get("event") in ("open", "reopen"):
+            closed.pop(e.get("id"), None)
+    return closed
+
+
+def record_compare(data_path, prev_map, curr_map):
+    """position_compare hook: log today's changes next to the company's data file."""
+    data_dir = Path(data_path).parent
+    try:
+        date = datetime.now().strftime("%Y%m%d")
+        append(data_dir, changes(prev_map, curr_map, date, last_closed(read(data_dir))))
+    except OSError as e:
+        print(f"[WARN] event log write failed for {data_dir}: {e}")
+
+
+def record_snapshot(data_dir, date, positions):
+    """save_daily_snapshots hook: mark that the dated snapshot now exists."""
+    try:
+        append(data_dir, [{"date": date, "event": "snapshot",
+                           "positions": len({p.get("id") for p in positions})}])
+    except OSError as e:
+        print(f"[WARN] event log write failed for {data_dir}: {e}")
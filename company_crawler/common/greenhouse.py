@@ -0,0 +1,45 @@
+"""Greenhouse job-board API client (used by the Skild AI position crawler).
+
+The public board API returns every job WITH its description in one request:
+
+    GET https://boards-api.greenhouse.io/v1/boards/<board>/jobs?content=true
+
+`content` is the HTML-escaped body that job-boards.greenhouse.io renders inside
+`div.job__description`; `description_text()` turns it into the same text the
+browser path read with `inner_text()`.
+
+GREENHOUSE_API_URL can be pointed at a local server replaying a recorded
+response, which keeps the mapping testable offline.
+"""
+
+import html
+import os
+
+from common.html_text import inner_text
+from common.http_fetch import session
+from common.rate_limit import throttle
+
+GREENHOUSE_API_URL = os.environ.get("GREENHOUSE_API_URL", "https://boards-api.greenhouse.io/v1/boards")
+
+
+def fetch_board(board, timeout=30):
+    """Return the jobs (with content) of a Greenhouse board; raises on any error."""
+    throttle(GREENHOUSE_API_URL)
+    resp = session().get(
+        f"{GREENHOUSE_API_URL}/{board}/jobs",
+        params={"content": "true"},
+        timeout=timeout,
+    )
+    resp.raise_for_status()
+
+    jobs = resp.json().get("jobs")
+    if not isinstance(jobs, list):
+        raise ValueError(f"unexpected Greenhouse response for {board!r}")
+    if not jobs:
+        raise ValueError(f"Greenhouse board {board!r} returned no jobs")
+    return jobs
+
+
+def description_text(job):
+    """Rendered text of a job's `content` (as `div.job__description` shows it)."""
+    return inner_text(html.unescape(job.get("content") or "")).strip()
@@ -0,0 +1,87 @@
+"""Server-side approximation of the DOM `innerText` getter.
+
+Crawlers that skip the browser (API / plain-HTTP paths) still have to produce
+the same text the Playwright path read with `element.inner_text()`, otherwise
+every body hash would change on the switch-over and the compare step would
+report the whole board as "updated". `inner_text()` follows the spec's
+rendered-text algorithm closely enough for the article/JD markup we scrape:
+
+  - whitespace runs collapse to one space and are trimmed at line edges,
+  - <br> is a hard line break,
+  - <p> is surrounded by 2 required line breaks, other block elements by 1,
+    and adjacent required breaks collapse to their maximum,
+  - <script>/<style>/<template>, comments and the doctype contribute nothing.
+"""
+
+import re
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.element import PreformattedString
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "caption", "dd", "details",
+    "dialog", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "hr", "li",
+    "main", "nav", "ol", "pre", "section", "summary", "table", "tr", "ul",
+}
+SKIP_TAGS = {"head", "script", "style", "template", "noscript", "svg"}
+
+_WS = re.compile(r"[ \t\n\r\f]+")
+
+
+def inner_text(node):
+    """innerText of a bs4 node (or an HTML string)."""
+    if isinstance(node, str):
+        node = BeautifulSoup(node, "html.parser")
+
+    items = []
+    _walk(node, items)
+
+    # Merge adjacent text, then trim collapsible spaces at line boundaries.
+    merged = []
+    for item in items:
+        if isinstance(item, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += item
+        else:
+            merged.append(item)
+
+    out = []
+    for item in merged:
+        if isinstance(item, str):
+            text = re.sub(r" {2,}", " ", item)
+            text = re.sub(r" *\n *", "\n", text).strip(" ")
+            if text:
+                out.append(text)
+        elif out and isinstance(out[-1], int):
+            out[-1] = max(out[-1], item)
+        else:
+            out.append(item)
+
+    while out and isinstance(out[0], int):
+        out.pop(0)
+    while out and isinstance(out[-1], int):
+        out.pop()
+    return "".join("\n" * item if isinstance(item, int) else item for item in out)
+
+
+def _walk(node, items):
+    for child in node.children:
+        if isinstance(child, PreformattedString):  # comments, doctype, ...
+            continue
+        if isinstance(child, NavigableString):
+            items.append(_WS.sub(" ", str(child)))
+            continue
+        if not isinstance(child, Tag) or child.name in SKIP_TAGS:
+            continue
+        if child.name == "br":
+            items.append("\n")
+        elif child.name == "p":
+            items.append(2)
+            _walk(child, items)
+            items.append(2)
+        elif child.name in BLOCK_TAGS:
+            items.append(1)
+            _walk(child, items)
+            items.append(1)
+        else:
+            _walk(child, items)
@@ -0,0 +1,106 @@
+"""Plain-HTTP fetch path with automatic escalation to the browser.
+
+Browser time is by far the biggest crawl cost, yet several detail pages are
+server-rendered: the Greenhouse job pages, the Rhoda / Genesis / Sunday
+article pages. `fetch_via_http()` GETs such a page over one pooled
+`requests.Session`, parses it with BeautifulSoup and hands the soup to the
+crawler's extractor:
+
+    body = fetch_via_http(url, "rhoda/article", _article_text)
+    if body:
+        return body
+    ... Playwright path as before ...
+
+The extractor returns None unless the selector it needs produced meaningful
+content (`selector_text()` checks a minimum text length, measured with the
+same innerText emulation as the API paths), in which case the caller falls
+back to Playwright. Client-rendered shells, bot walls and redesigns therefore
+cost one cheap GET, not a wrong record.
+
+Every page is counted under its `site` label as "http" or "browser"
+(escalated); `report()` prints the split, and each GET is logged as an "http"
+event (common/metrics.py). CRAWL_HTTP_FIRST=0 sends everything
+straight to the browser.
+"""
+
+import os
+import time
+from collections import defaultdict
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from common import metrics, replay
+from common.html_text import inner_text
+from common.rate_limit import throttle
+
+HTTP_FIRST = os.environ.get("CRAWL_HTTP_FIRST", "1") == "1"
+HTTP_TIMEOUT = 20
+
+_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_session = None
+_paths = defaultdict(lambda: {"http": 0, "browser": 0})
+
+
+def session():
+    """프로세스 전체에서 공유하는 keep-alive 세션 (호스트별 커넥션 풀).
+
+    API 클라이언트(common/ashby.py, common/greenhouse.py)도 이 세션을 쓴다.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(_HEADERS)
+        # fixture record/replay 모드면 같은 풀 설정의 FixtureAdapter (common/replay.py)
+        adapter_class = replay.FixtureAdapter if replay.mode() else HTTPAdapter
+        adapter = adapter_class(pool_connections=8, pool_maxsize=8)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def fetch_via_http(url, site, extract):
+    """GET + parse 후 `extract(soup)` 결과를 반환. 실패/빈 결과면 None (→ 브라우저로)."""
+    if not HTTP_FIRST:
+        _paths[site]["browser"] += 1
+        return None
+
+    result = None
+    size = 0
+    throttle(url)
+    start = time.monotonic()
+    try:
+        resp = session().get(url, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        size = len(resp.content)
+        result = extract(BeautifulSoup(resp.text, "html.parser"))
+    except Exception as e:
+        print(f"[WARN] {site}: plain HTTP failed for {url} ({e}); using the browser")
+
+    metrics.record(site, "http", (time.monotonic() - start) * 1000, ok=bool(result),
+                   bytes=size, empty=size > 0 and not result, url=url)
+    _paths[site]["http" if result else "browser"] += 1
+    return result or None
+
+
+def selector_text(soup, selector, min_text=1):
+    """selector 첫 요소의 innerText — `min_text`자 미만이면 None."""
+    el = soup.select_one(selector)
+    if el is None:
+        return None
+    text = inner_text(el).strip()
+    return text if len(text) >= min_text else None
+
+
+def report():
+    """사이트별 HTTP / 브라우저 경로 수를 출력하고 초기화."""
+    for site in sorted(_paths):
+        counts = _paths[site]
+        print(f"[INFO] Fetch path {site}: http={counts['http']} browser={counts['browser']}")
+    _paths.clear()
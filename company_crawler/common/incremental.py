@@ -0,0 +1,187 @@
+"""Incremental position crawling: only open detail pages for cards that changed.
+
+The list page already tells us which postings exist. Each card (href/UUID,
+title, department, location ...) is reduced to a fingerprint; if yesterday's
+crawl saw the same fingerprint, the stored record in `*_positions.json` is
+reused as-is instead of re-fetching the JD.
+
+JD edits do not show up on the card, so every fingerprint is still
+re-validated once every CRAWL_REVALIDATE_DAYS days. The rotation is spread
+by hash, so roughly 1/N of the unchanged cards are re-fetched each day
+instead of all of them on the same day.
+
+The fingerprint → id index lives next to the data file
+(`data/<company>/.<prefix>_positions_cards.json`); position_compare keeps
+owning `*_positions.json` itself.
+
+Blog crawlers use `StoredPosts` instead: a post's card (href, title, date) is
+compared directly against the stored `*_blog.json` record, and the body is
+re-verified on the same rotation every BLOG_REVALIDATE_DAYS days.
+
+Both also hand back the stored record on demand (`carry()`) when a known item
+could not be re-fetched — a failed detail load or an exhausted time budget
+(common/budget.py). Position crawlers go through `CardCache.carry_into()` so
+every company treats a still-listed card the same way.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+from common import replay, snapshot_io
+
+REVALIDATE_DAYS = int(os.environ.get("CRAWL_REVALIDATE_DAYS", "14"))
+BLOG_REVALIDATE_DAYS = int(os.environ.get("BLOG_REVALIDATE_DAYS", "7"))
+
+
+def card_fingerprint(*parts) -> str:
+    """목록 카드의 필드들로 만든 짧은 지문."""
+    joined = "\x1f".join((part or "").strip() for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+
+
+def is_due(key: str, days: int = REVALIDATE_DAYS, today: date = None) -> bool:
+    """key가 오늘 재검증 차례인지 (N일마다 한 번, key별로 요일이 분산됨)."""
+    if days <= 1:
+        return True
+    today = today or date.today()
+    bucket = int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:8], 16) % days
+    return bucket == today.toordinal() % days
+
+
+class CardCache:
+    """지난 crawl의 카드 지문 → 저장된 position 레코드 조회."""
+
+    def __init__(self, data_path, days: int = REVALIDATE_DAYS):
+        self.data_path = Path(data_path)
+        self.index_path = self.data_path.with_name(f".{self.data_path.stem}_cards.json")
+        self.days = days
+
+        self._prev = {p["id"]: p for p in _load(self.data_path, list) if "id" in p}
+        self._index = _load(self.index_path, dict)
+        self._seen = {}
+        self.reused = 0
+        self.revalidated = 0
+        self.fetched = 0
+        self.carried = 0
+
+    def reuse(self, fingerprint: str):
+        """변경 없는 카드면 이전 레코드(사본)를, 새 카드/재검증 차례면 None."""
+        prev = self._prev.get(self._index.get(fingerprint))
+        if prev is None:
+            self.fetched += 1
+            return None
+        if is_due(fingerprint, self.days):
+            self.revalidated += 1
+            return None
+        self.reused += 1
+        return dict(prev)
+
+    def carry(self, fingerprint: str):
+        """상세를 못 받은 카드의 이전 레코드(사본) — 처음 보는 카드면 None."""
+        prev = self._prev.get(self._index.get(fingerprint))
+        if prev is None:
+            return None
+        self.carried += 1
+        return dict(prev)
+
+    def carry_into(self, positions: list, fingerprint: str) -> bool:
+        """상세를 못 받은 카드(로드 실패 / 예산 소진): 이전 레코드를 positions에 이어붙임.
+
+        목록에 아직 있는 공고가 하루 삭제됐다가 다음 날 재오픈으로 보고되지 않게
+        한다. 처음 보는 카드면 아무것도 하지 않고 False.
+        """
+        prev = self.carry(fingerprint)
+        if prev is None:
+            return False
+        positions.append(prev)
+        self.remember(fingerprint, prev)
+        return True
+
+    def remember(self, fingerprint: str, record: dict):
+        # 본문 없이 저장된 레코드는 다음 날 다시 받아야 하므로 기억하지 않음
+        if record.get("description"):
+            self._seen[fingerprint] = record["id"]
+
+    def save(self):
+        total = self.reused + self.revalidated + self.fetched
+        print(f"[INFO] Incremental crawl: reused {self.reused}/{total} cards, "
+              f"re-validated {self.revalidated}, new/changed {self.fetched}")
+        if self.carried:
+            print(f"[WARN] Carried over {self.carried} stored record(s) without re-fetching")
+
+        # 빈 crawl(사이트/셀렉터 고장)로 인덱스를 날리지 않음
+        # fixture record/replay 실행은 실제 crawl의 카드 인덱스를 건드리지 않음 (Checkpoint와 같게)
+        if not self._seen or replay.mode():
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path.write_text(
+            json.dumps(self._seen, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+
+
+class StoredPosts:
+    """지난 *_blog.json — 카드(href / title / date)가 그대로인 글은 본문 재사용."""
+
+    def __init__(self, data_path, days: int = BLOG_REVALIDATE_DAYS):
+        self._prev = {p["id"]: p for p in _load(Path(data_path), list) if "id" in p}
+        self.days = days
+        self.reused = 0
+        self.revalidated = 0
+        self.fetched = 0
+        self.carried = 0
+
+    def content(self, href: str, title: str, date: str):
+        """저장된 본문(재사용 가능할 때) 또는 None (새 글/카드 변경/재검증 차례)."""
+        prev = self._prev.get(href)
+        if (not prev or not prev.get("content")
+                or prev.get("title") != title or prev.get("date") != date):
+            self.fetched += 1
+            return None
+        if is_due(href, self.days):
+            self.revalidated += 1
+            return None
+        self.reused += 1
+        return prev["content"]
+
+    def source(self, href: str) -> str:
+        """저장된 글의 본문 경로 ("http" / 브라우저면 "") — 재사용한 본문에 그대로 붙인다."""
+        return (self._prev.get(href) or {}).get("source", "")
+
+    def carry(self, href: str):
+        """본문을 못 받은 글의 저장된 항목(사본) — 본문이 없어도, 처음 보는 글이면 None."""
+        prev = self._prev.get(href)
+        if prev is None:
+            return None
+        self.carried += 1
+        return dict(prev)
+
+    def carry_into(self, items: list, href: str) -> bool:
+        """본문을 못 받은 글(예산 소진): 저장된 항목을 items에 그대로 이어붙임.
+
+        목록에 아직 있는 글이 삭제로 보고되지 않게 한다 (CardCache.carry_into와 같음).
+        처음 보는 글이면 아무것도 하지 않고 False — 다음 run에서 받는다.
+        """
+        prev = self.carry(href)
+        if prev is None:
+            return False
+        items.append(prev)
+        return True
+
+    def report(self):
+        total = self.reused + self.revalidated + self.fetched
+        print(f"[INFO] Incremental blog crawl: reused {self.reused}/{total} bodies, "
+              f"re-validated {self.revalidated}, new/changed {self.fetched}")
+        if self.carried:
+            print(f"[WARN] Carried over {self.carried} stored posts without re-fetching")
+
+
+def _load(path: Path, kind):
+    try:
+        data = snapshot_io.read_json(path)  # *_positions.json may be stored compressed
+        return data if isinstance(data, kind) else kind()
+    except Exception:
+        return kind()
@@ -0,0 +1,162 @@
+"""Structured crawl timings: `logs/metrics/<YYYY-MM-DD>.jsonl`.
+
+`[INFO] Processing: ...` lines say what happened, not where the crawl window
+went. The crawlers now also emit one JSON event per timed step:
+
+    {"ts": "2026-10-17T09:00:12", "company": "dyna", "site": "dyna/detail",
+     "phase": "nav", "ms": 812.4, "ok": true}
+
+Phases:
+  nav      network time of a main-frame document request (site = company/host)
+  wait     common/waits.py readiness wait (ok=false on timeout)
+  eval     reading a loaded detail page (common/page_pool.py)
+  page     one detail / article page in the browser, retries included, with
+           `attempts` (and `empty` when it loaded without content)
+  http     plain-HTTP fetch (common/http_fetch.py), with `bytes`
+  browser  one browser context (company crawl), with `bytes` / `blocked`
+  company  a whole company run (daily_crawler), with `partial`
+
+`company` is the one set by `set_company()` (daily_crawler / open_browser),
+falling back to the site prefix. CRAWL_METRICS=0 turns logging off and
+CRAWL_METRICS_DIR moves it.
+
+Summary + regression check (today vs. the trailing 7-day median of the
+daily p50s):
+
+    python company_crawler/common/metrics.py       # from the repo root
+    python company_crawler/common/metrics.py --date 2026-10-16 --days 7 --threshold 1.5
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from statistics import median
+
+ENABLED = os.environ.get("CRAWL_METRICS", "1") != "0"
+METRICS_DIR = Path(os.environ.get("CRAWL_METRICS_DIR", "logs/metrics"))
+
+_company = ""
+
+
+def set_company(company):
+    """이후 이벤트의 company 필드 (프로세스당 한 번에 한 회사만 크롤한다)."""
+    global _company
+    _company = company or ""
+
+
+def record(site, phase, ms, ok=True, **fields):
+    """이벤트 한 줄을 오늘 파일에 추가. 로깅 실패가 크롤을 멈추게 하지는 않는다."""
+    if not ENABLED:
+        return
+    event = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "company": _company or site.split("/")[0],
+        "site": site,
+        "phase": phase,
+        "ms": round(ms, 1),
+        "ok": bool(ok),
+        **fields,
+    }
+    try:
+        METRICS_DIR.mkdir(parents=True, exist_ok=True)
+        # 병렬 worker들이 같은 파일에 append — 한 줄짜리 write라 섞이지 않음
+        with (METRICS_DIR / f"{date.today().isoformat()}.jsonl").open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"[WARN] metrics write failed: {e}")
+
+
+@contextmanager
+def timed(site, phase, **fields):
+    """with 블록의 소요 시간을 기록. 예외가 나면 ok=false로 남기고 다시 던진다."""
+    start = time.monotonic()
+    ok = False
+    try:
+        yield fields
+        ok = True
+    finally:
+        record(site, phase, (time.monotonic() - start) * 1000, ok=ok, **fields)
+
+
+def load(day):
+    path = METRICS_DIR / f"{day.isoformat()}.jsonl"
+    events = []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return events
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return events
+
+
+def summarize(events):
+    """(company, phase) -> {"n", "p50", "p95", "failed"}."""
+    groups = defaultdict(list)
+    failed = defaultdict(int)
+    for event in events:
+        key = (event.get("company", ""), event.get("phase", ""))
+        groups[key].append(event.get("ms", 0.0))
+        if not event.get("ok", True):
+            failed[key] += 1
+    return {
+        key: {"n": len(ms), "p50": _percentile(ms, 50), "p95": _percentile(ms, 95),
+              "failed": failed[key]}
+        for key, ms in groups.items()
+    }
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    idx = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize crawl metrics and flag regressions")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(),
+                        help="day to summarize (YYYY-MM-DD, default today)")
+    parser.add_argument("--days", type=int, default=7, help="trailing days for the baseline")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="flag when p50 exceeds baseline median by this factor")
+    args = parser.parse_args()
+
+    today = summarize(load(args.date))
+    if not today:
+        print(f"[INFO] No metrics for {args.date} in {METRICS_DIR}")
+        return
+
+    history = defaultdict(list)
+    for back in range(1, args.days + 1):
+        for key, stats in summarize(load(args.date - timedelta(days=back))).items():
+            history[key].append(stats["p50"])
+
+    print(f"Crawl metrics {args.date} (baseline: median p50 of the previous {args.days} days)")
+    print(f"{'company':<22}{'phase':<9}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}"
+          f"{'failed':>8}{'base ms':>10}  flag")
+    regressions = 0
+    for key in sorted(today):
+        stats = today[key]
+        base = median(history[key]) if history[key] else None
+        flag = ""
+        if base and stats["p50"] > base * args.threshold:
+            flag = f"REGRESSION x{stats['p50'] / base:.1f}"
+            regressions += 1
+        print(f"{key[0]:<22}{key[1]:<9}{stats['n']:>6}{stats['p50']:>10.0f}{stats['p95']:>10.0f}"
+              f"{stats['failed']:>8}{base if base is not None else float('nan'):>10.0f}  {flag}")
+
+    if regressions:
+        print(f"[WARN] {regressions} phase(s) slower than {args.threshold}x their "
+              f"{args.days}-day median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Bounded-concurrency detail-page fetching shared by the position crawlers.
+
+The crawlers used to walk detail pages one by one on a single tab
+(goto -> networkidle -> fixed sleep -> evaluate), so a 50-role board cost 50x
+the slowest page. `fetch_details()` keeps a small pool of tabs instead and
+processes the items in waves: every tab in a wave starts its navigation
+(`wait_until="commit"` returns as soon as the response begins), so Chromium
+loads them side by side while we wait on + read the first one. Each tab is
+read as soon as its `ready` selector shows up (see common/waits.py) rather
+than after a fixed settle time. Still the plain sync Playwright API — no
+threads, so it works on any browser/context object. Every item is logged to
+common/metrics.py: "eval" per read and one "page" event with its attempts.
+
+The number of tabs aimed at one hostname in a wave is capped by `per_host`,
+and every navigation takes a token from that host's bucket first
+(common/rate_limit.py), so a board on a shared host (jobs.ashbyhq.com) is
+paced with the other companies' traffic instead of by a fixed pause.
+"""
+
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from common import metrics
+from common.budget import out_of_time
+from common.rate_limit import throttle
+from common.waits import DEFAULT_TIMEOUT, wait_ready
+
+DEFAULT_TABS = 4
+DEFAULT_PER_HOST = 4
+
+
+def fetch_details(browser, items, url_of, read, tabs=DEFAULT_TABS, per_host=DEFAULT_PER_HOST,
+                  wait_until="domcontentloaded", ready=None, ready_text=0, site="detail",
+                  ready_timeout=DEFAULT_TIMEOUT, retries=3, timeout=60000):
+    """
+    Visit `url_of(item)` for every item over a pool of `tabs` pages and return
+    `[read(page, item), ...]` in the same order as `items`.
+
+    Args:
+        browser:    anything with `new_page()` (Browser or BrowserContext).
+        url_of:     item -> absolute URL of its detail page.
+        read:       (page, item) -> result, called once the page has loaded.
+                    Returning None (or raising) marks the attempt as failed.
+        wait_until: load state awaited on each tab before `read`.
+        ready:      selector the extractor needs; `read` runs as soon as it is
+                    visible (or has `ready_text` chars of text), capped at
+                    `ready_timeout` ms. Latency is recorded under `site`.
+        retries:    attempts per item; an item that never succeeds yields None.
+                    Items not started before the company's time budget runs
+                    out (common/budget.py) also yield None.
+    """
+    results = [None] * len(items)
+    attempts = [0] * len(items)
+    started_at = {}
+    pending = deque(range(len(items)))
+    pages = [browser.new_page() for _ in range(max(1, min(tabs, len(items))))]
+
+    try:
+        while pending:
+            if out_of_time(site):
+                break
+            wave = _next_wave(pending, items, url_of, len(pages), per_host)
+
+            # 1️⃣ 모든 탭에서 동시에 네비게이션 시작
+            started = []
+            for page, idx in zip(pages, wave):
+                url = url_of(items[idx])
+                attempts[idx] += 1
+                started_at.setdefault(idx, time.monotonic())
+                try:
+                    throttle(url)
+                    page.goto(url, wait_until="commit", timeout=timeout)
+                    started.append((page, idx))
+                except Exception as e:
+                    if _failed(pending, results, attempts, idx, retries, url, e):
+                        _page_event(site, url, started_at[idx], attempts[idx])
+
+            # 2️⃣ 탭별로 로드 완료를 기다린 뒤 추출
+            for page, idx in started:
+                url = url_of(items[idx])
+                try:
+                    if wait_until != "commit":
+                        page.wait_for_load_state(wait_until, timeout=timeout)
+                    if ready:
+                        wait_ready(page, ready, site, timeout=ready_timeout, min_text=ready_text)
+                    with metrics.timed(site, "eval"):
+                        result = read(page, items[idx])
+                except Exception as e:
+                    if _failed(pending, results, attempts, idx, retries, url, e):
+                        _page_event(site, url, started_at[idx], attempts[idx])
+                    continue
+                if result is None:
+                    if _failed(pending, results, attempts, idx, retries, url, "no content"):
+                        _page_event(site, url, started_at[idx], attempts[idx], empty=True)
+                    continue
+                results[idx] = result
+                _page_event(site, url, started_at[idx], attempts[idx], ok=True)
+    finally:
+        for page in pages:
+            try:
+                page.close()
+            except Exception:
+                pass
+
+    return results
+
+
+def _next_wave(pending, items, url_of, size, per_host):
+    """Pop up to `size` pending indexes, at most `per_host` per hostname."""
+    wave, deferred, hosts = [], [], {}
+    while pending and len(wave) < size:
+        idx = pending.popleft()
+        host = urlparse(url_of(items[idx])).hostname or ""
+        if hosts.get(host, 0) >= per_host:
+            deferred.append(idx)
+            continue
+        hosts[host] = hosts.get(host, 0) + 1
+        wave.append(idx)
+    # Deferred items keep their place at the front of the queue.
+    pending.extendleft(reversed(deferred))
+    return wave
+
+
+def _failed(pending, results, attempts, idx, retries, url, reason):
+    """Requeue a failed attempt; returns True once the item has used up its retries."""
+    print(f"[WARN] Attempt {attempts[idx]}/{retries} failed for {url}: {reason}")
+    if attempts[idx] < retries:
+        pending.append(idx)
+        return False
+    results[idx] = None
+    return True
+
+
+def _page_event(site, url, start, attempts, ok=False, empty=False):
+    """One detail page end to end (first goto -> result or final failure)."""
+    metrics.record(site, "page", (time.monotonic() - start) * 1000, ok=ok,
+                   attempts=attempts, empty=empty, url=url)
@@ -0,0 +1,184 @@
+"""Per-host token-bucket rate limiting shared by every crawler.
+
+Politeness used to be a fixed `time.sleep(0.5)` / `time.sleep(0.3)` after each
+detail page, however fast or slow the host was — and DYNA, Sunday and Genesis
+all land on jobs.ashbyhq.com without knowing about each other. Every page
+navigation and HTTP call now goes through `throttle(url)` first:
+
+    throttle(url)
+    page.goto(url, ...)
+
+Each hostname has its own bucket (CRAWL_HOST_RATE requests/sec, bursts of up
+to CRAWL_HOST_BURST), so different hosts never wait on each other while one
+host is never hit faster than its rate. `throttle()` reserves a slot and
+sleeps only for as long as that host's bucket needs.
+
+Sequential runs keep the buckets in this process. For `--max-workers > 1`,
+daily_crawler creates them in a multiprocessing.Manager (`shared_state()`)
+and hands them to each worker (`install()`), so Ashby traffic from all
+companies is throttled together. `report()` prints the effective
+requests/sec per host for the run summary.
+
+`python -m common.rate_limit` (from company_crawler/) is a self-check: it
+starts parallel worker processes against a local HTTP server through the
+same shared buckets and fails if the server ever sees more requests than
+the configured rate and burst allow.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Manager
+from urllib.parse import urlparse
+
+DEFAULT_RATE = float(os.environ.get("CRAWL_HOST_RATE", "2"))
+DEFAULT_BURST = int(os.environ.get("CRAWL_HOST_BURST", "4"))
+
+# 호스트별 예외 (requests/sec, burst). 여러 회사가 함께 쓰는 호스트는 보수적으로.
+HOST_LIMITS = {
+    "jobs.ashbyhq.com": (2.0, 4),
+    "api.ashbyhq.com": (1.0, 2),
+    "boards-api.greenhouse.io": (1.0, 2),
+}
+
+# host -> (tokens, updated_at) / host -> (count, first, last, waited)
+_buckets = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def shared_state(manager):
+    """병렬 모드용: Manager 위에 bucket/통계/lock을 만들어 반환 (install()에 전달)."""
+    return manager.dict(), manager.dict(), manager.Lock()
+
+
+def install(state=None):
+    """ProcessPoolExecutor initializer — 이 프로세스가 공유 bucket을 쓰게 한다.
+
+    state 없이 부르면 프로세스 로컬 bucket으로 되돌림 (Manager 종료 후).
+    """
+    global _buckets, _stats, _lock
+    _buckets, _stats, _lock = state or ({}, {}, threading.Lock())
+
+
+def throttle(url):
+    """url의 호스트 bucket에서 토큰 하나를 예약하고, 필요한 만큼만 대기."""
+    host = urlparse(url).hostname or ""
+    rate, burst = HOST_LIMITS.get(host, (DEFAULT_RATE, DEFAULT_BURST))
+
+    with _lock:
+        # time.time(): 병렬 worker 프로세스끼리도 같은 시계를 써야 함
+        now = time.time()
+        tokens, updated = _buckets.get(host, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate) - 1
+        _buckets[host] = (tokens, now)
+
+        wait = -tokens / rate if tokens < 0 else 0.0
+        count, first, _, waited = _stats.get(host, (0, now + wait, 0, 0.0))
+        _stats[host] = (count + 1, first, now + wait, waited + wait)
+
+    if wait:
+        time.sleep(wait)
+
+
+def report():
+    """호스트별 요청 수 / 실효 requests/sec / 누적 대기 시간을 출력하고 초기화."""
+    with _lock:
+        stats = dict(_stats)
+        _stats.clear()
+
+    for host in sorted(stats):
+        count, first, last, waited = stats[host]
+        span = last - first
+        rps = f"{(count - 1) / span:.2f} req/s" if count > 1 and span > 0 else "n/a"
+        print(f"[INFO] Rate {host or '(no host)'}: {count} requests, {rps} effective, "
+              f"waited {waited:.1f}s")
+
+
+# ---------- self-check ----------
+
+def _check_worker_init(state, host, rate, burst):
+    install(state)
+    HOST_LIMITS[host] = (rate, burst)
+
+
+def _check_fetch(url):
+    throttle(url)
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        resp.read()
+
+
+def _violations(arrivals, rate, burst, slack):
+    """token bucket 보장: 어떤 구간 [t_i, t_j]에서도 요청 수 <= burst + rate * 길이."""
+    bad = []
+    for i in range(len(arrivals)):
+        for j in range(i + burst, len(arrivals)):
+            allowed = burst + rate * (arrivals[j] - arrivals[i] + slack)
+            if j - i + 1 > allowed:
+                bad.append((j - i + 1, arrivals[j] - arrivals[i]))
+    return bad
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        description="Check that parallel workers sharing the buckets stay within the host rate")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=24)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE)
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST)
+    args = parser.parse_args()
+
+    arrivals = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            arrivals.append(time.time())
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    url = f"http://{host}:{port}/"
+
+    try:
+        with Manager() as manager:
+            state = shared_state(manager)
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_check_worker_init,
+                                     initargs=(state, host, args.rate, args.burst)) as pool:
+                list(pool.map(_check_fetch, [url] * args.requests))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    arrivals.sort()
+    span = arrivals[-1] - arrivals[0] if len(arrivals) > 1 else 0.0
+    # burst 이후의 요청만으로 본 지속 속도
+    rps = (len(arrivals) - args.burst) / span if span > 0 and len(arrivals) > args.burst else 0.0
+    print(f"[INFO] {len(arrivals)} requests from {args.workers} workers in {span:.2f}s, "
+          f"{rps:.2f} req/s after the burst (limit {args.rate:g} req/s, burst {args.burst})")
+
+    # 프로세스 간 전달 + 서버 도착까지의 지연만큼 여유를 둠
+    bad = _violations(arrivals, args.rate, args.burst, slack=0.05)
+    if bad:
+        count, window = max(bad)
+        print(f"[ERROR] Rate limit exceeded: {count} requests within {window:.2f}s")
+        sys.exit(1)
+    if len(arrivals) != args.requests:
+        print(f"[ERROR] Server saw {len(arrivals)}/{args.requests} requests")
+        sys.exit(1)
+    print("[INFO] Rate limit held")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,192 @@
+"""Record / replay crawls against local fixtures (offline, reproducible runs).
+
+    CRAWL_FIXTURE_MODE=record  every response a crawl receives is saved
+    CRAWL_FIXTURE_MODE=replay  responses come from the saved files only;
+                               anything not recorded fails like a dead network
+
+Both the browser and the plain-HTTP paths go through it. Playwright contexts
+get a route handler (`attach()`, registered before the resource-blocking
+route) that either fetches + saves or fulfills from disk. The shared
+requests.Session of common/http_fetch.py mounts `FixtureAdapter`, which does
+the same for the Ashby / Greenhouse APIs and the server-rendered pages.
+
+Fixtures are plain files under CRAWL_FIXTURE_DIR (default `fixtures/`), one
+JSON per request: `<host>/<sha1(method, url, body)[:16]>.json` with status,
+headers and the body as text (base64 for binary). Redirects are stored hop
+by hop. A fixture mode always crawls in full — recording has to touch every
+detail page, and a replay must not be short-circuited by the list digest or
+a same-day checkpoint — and never uses the persistent browser profile.
+
+The CLI records a company once and then replays it as often as needed, which
+makes crawl-speed changes measurable without the network:
+
+    python -m common.replay record dyna
+    python -m common.replay replay dyna --runs 3
+    python -m common.replay replay rhoda --blog
+"""
+
+import argparse
+import base64
+import hashlib
+import importlib
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 버린다
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding",
+                 "connection", "keep-alive", "set-cookie"}
+
+_counts = {"recorded": 0, "replayed": 0, "missing": 0}
+
+
+def mode() -> str:
+    """"record" / "replay" / "" (호출 시점의 환경변수 기준)."""
+    value = os.environ.get("CRAWL_FIXTURE_MODE", "").lower()
+    return value if value in ("record", "replay") else ""
+
+
+def fixture_dir() -> Path:
+    return Path(os.environ.get("CRAWL_FIXTURE_DIR", "fixtures"))
+
+
+def save(method, url, status, headers, body, post=b""):
+    entry = {
+        "method": method,
+        "url": url,
+        "status": status,
+        "headers": {k.lower(): v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+    }
+    try:
+        entry["body"] = body.decode("utf-8")
+    except UnicodeDecodeError:
+        entry["body_b64"] = base64.b64encode(body).decode("ascii")
+
+    path = _path(method, url, post)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entry, ensure_ascii=False, indent=1), encoding="utf-8")
+    _counts["recorded"] += 1
+
+
+def load(method, url, post=b""):
+    """저장된 응답 {"status", "headers", "body": bytes} 또는 None."""
+    try:
+        entry = json.loads(_path(method, url, post).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        _counts["missing"] += 1
+        return None
+    if "body_b64" in entry:
+        entry["body"] = base64.b64decode(entry["body_b64"])
+    else:
+        entry["body"] = entry.get("body", "").encode("utf-8")
+    _counts["replayed"] += 1
+    return entry
+
+
+def attach(context):
+    """fixture 모드면 Playwright context에 record/replay route를 건다."""
+    if mode():
+        context.route("**/*", _route)
+
+
+def _route(route):
+    request = route.request
+    post = request.post_data_buffer or b""
+    if mode() == "replay":
+        entry = load(request.method, request.url, post)
+        if entry is None:
+            route.abort("internetdisconnected")
+            return
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+        return
+
+    # redirect는 hop 단위로 저장 (브라우저가 Location을 따라 다시 요청한다)
+    response = route.fetch(max_redirects=0)
+    save(request.method, request.url, response.status, response.headers, response.body(), post)
+    route.fulfill(response=response)
+
+
+class FixtureAdapter(HTTPAdapter):
+    """requests용: record면 실제로 보내고 저장, replay면 파일에서 응답을 만든다."""
+
+    def send(self, request, **kwargs):
+        post = request.body or b""
+        if isinstance(post, str):
+            post = post.encode("utf-8")
+
+        if mode() == "replay":
+            entry = load(request.method, request.url, post)
+            if entry is None:
+                raise requests.ConnectionError(
+                    f"no fixture for {request.method} {request.url}", request=request)
+            return self._build(request, entry)
+
+        response = super().send(request, **kwargs)
+        save(request.method, request.url, response.status_code, response.headers,
+             response.content, post)
+        return response
+
+    def _build(self, request, entry):
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def report():
+    print(f"[INFO] Fixtures ({mode() or 'off'}, {fixture_dir()}): "
+          f"recorded {_counts['recorded']}, replayed {_counts['replayed']}, "
+          f"missing {_counts['missing']}")
+    for key in _counts:
+        _counts[key] = 0
+
+
+def _path(method, url, post):
+    digest = hashlib.sha1(f"{method} {url}\n".encode("utf-8") + post).hexdigest()[:16]
+    return fixture_dir() / (urlparse(url).hostname or "_") / f"{digest}.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record / replay a company crawl")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("company", help="crawler package, e.g. dyna, rhoda, physical_intelligence")
+    parser.add_argument("--blog", action="store_true", help="run blog_crawler instead of position_crawler")
+    parser.add_argument("--runs", type=int, default=1, help="repeat the crawl (replay benchmarks)")
+    args = parser.parse_args()
+
+    os.environ["CRAWL_FIXTURE_MODE"] = args.mode
+    name = "blog_crawler" if args.blog else "position_crawler"
+    crawler = getattr(importlib.import_module(f"{args.company}.{name}"), name)
+
+    timings = []
+    for run in range(args.runs):
+        start = time.monotonic()
+        items = crawler()
+        timings.append(time.monotonic() - start)
+        print(f"[INFO] {args.company}.{name} run {run + 1}/{args.runs}: "
+              f"{len(items or [])} items in {timings[-1]:.2f}s")
+        report()
+
+    if len(timings) > 1:
+        timings.sort()
+        print(f"[INFO] min {timings[0]:.2f}s  median {timings[len(timings) // 2]:.2f}s  "
+              f"max {timings[-1]:.2f}s")
+
+
+if __name__ == "__main__":
+    # `python -m`으로 실행된 이 모듈(__main__)이 아니라, 크롤러들이 import하는
+    # common.replay의 카운터로 집계되도록 그쪽 main()을 호출
+    from common.replay import main as _main
+    _main()
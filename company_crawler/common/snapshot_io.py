@@ -0,0 +1,154 @@
+"""Snapshot / data file I/O with transparent compression.
+
+Everybody keeps using the plain name — `data/dyna/dyna_positions.json`,
+`data/dyna/20260301_dyna_positions.json`, a body blob `<sha>.txt` — and the
+file on disk may carry an extra `.gz` or `.zst` suffix. Readers pick up
+whichever form exists; writers use SNAPSHOT_COMPRESSION:
+
+    none   plain JSON (default)
+    gzip   .gz, level 9, no timestamp in the header (same bytes for same data)
+    zstd   .zst via the optional `zstandard` package (gzip when it is missing)
+
+and delete the other forms, so a name never exists twice. JD / post text
+compresses 5-10x, which shrinks both cold reads and what the nightly commit
+pushes.
+
+Converting existing files (data files, dated snapshots and body blobs; the
+dot-file caches next to them stay plain):
+
+    python company_crawler/common/snapshot_io.py gzip data
+    python company_crawler/common/snapshot_io.py none data/dyna
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+SNAPSHOT_COMPRESSION = os.environ.get("SNAPSHOT_COMPRESSION", "none")
+
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def resolve(path):
+    """The file actually stored for `path` (plain / .gz / .zst), or None."""
+    path = Path(path)
+    for suffix in SUFFIXES.values():
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def exists(path) -> bool:
+    return resolve(path) is not None
+
+
+def nominal(path):
+    """`x.json.gz` -> `x.json` (plain names pass through)."""
+    path = Path(path)
+    for suffix in (".gz", ".zst"):
+        if path.name.endswith(suffix):
+            return path.with_name(path.name[:-len(suffix)])
+    return path
+
+
+def read_text(path) -> str:
+    stored = resolve(path)
+    if stored is None:
+        raise FileNotFoundError(f"no such snapshot file: {path}")
+    data = stored.read_bytes()
+    if stored.name.endswith(".gz"):
+        data = gzip.decompress(data)
+    elif stored.name.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{stored} is zstd-compressed; install the `zstandard` package")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data.decode("utf-8")
+
+
+def read_json(path):
+    return json.loads(read_text(path))
+
+
+def write_text(path, text, compression=None):
+    """Write `text` under `path` (+ suffix of the chosen compression), atomically."""
+    path = Path(path)
+    method = _method(compression)
+    data = text.encode("utf-8")
+    if method == "gzip":
+        data = gzip.compress(data, compresslevel=9, mtime=0)
+    elif method == "zstd":
+        data = zstandard.ZstdCompressor(level=19).compress(data)
+
+    target = path.with_name(path.name + SUFFIXES[method])
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # 쓰다 죽으면 잘린 파일이 남지 않게 임시 파일에 쓰고 교체
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+    for suffix in SUFFIXES.values():
+        other = path.with_name(path.name + suffix)
+        if other != target:
+            other.unlink(missing_ok=True)
+
+
+def write_json(path, data, compression=None):
+    write_text(path, json.dumps(data, ensure_ascii=False, indent=2), compression)
+
+
+def unlink(path):
+    """Delete every stored form of `path`."""
+    path = Path(path)
+    for suffix in SUFFIXES.values():
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def _method(compression):
+    method = compression or SNAPSHOT_COMPRESSION
+    if method not in SUFFIXES:
+        raise ValueError(f"unknown snapshot compression {method!r}")
+    if method == "zstd" and zstandard is None:
+        return "gzip"
+    return method
+
+
+def convert(root, compression):
+    """Rewrite every data file / snapshot / blob under `root` with `compression`.
+
+    Returns (files, bytes_before, bytes_after).
+    """
+    files, before, after = 0, 0, 0
+    method = _method(compression)
+    for stored in sorted(Path(root).rglob("*")):
+        if not stored.is_file() or stored.name.startswith("."):
+            continue
+        path = nominal(stored)
+        if path.suffix not in (".json", ".txt") or stored == path.with_name(path.name + SUFFIXES[method]):
+            continue
+        before += stored.stat().st_size
+        write_text(path, read_text(stored), method)
+        after += resolve(path).stat().st_size
+        files += 1
+    return files, before, after
+
+
+def _main():
+    if len(sys.argv) < 3 or sys.argv[1] not in SUFFIXES:
+        print(f"usage: snapshot_io.py {{{'|'.join(SUFFIXES)}}} <dir> [<dir> ...]")
+        return
+    for root in sys.argv[2:]:
+        files, before, after = convert(root, sys.argv[1])
+        print(f"[INFO] {root}: converted {files} file(s) to {_method(sys.argv[1])}, "
+              f"{before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,92 @@
+"""Condition-based waits shared by the crawlers.
+
+Pages used to be given fixed sleeps (`time.sleep(2)`, `wait_for_timeout(3000)`)
+whether they needed them or not. `wait_ready()` instead returns as soon as the
+element an extractor reads is actually there, with a hard timeout as the cap:
+
+    wait_ready(page, ".careers-detail", "generalist/detail", min_text=50)
+    wait_ready(page, "div.news-card", "rhoda/list", stable_ms=500)
+
+- selector only:  the element is visible (works on pages, frames and element
+                  handles).
+- min_text:       the first match has at least that many characters of text.
+- stable_ms:      the number of matches has stopped changing for that long —
+                  for list pages whose cards stream / fade in.
+
+Every wait records how long the page took to become ready, per `site` label.
+`report()` prints p50 / p95 / max per site (the browser wrapper calls it on
+close), so the timeouts can be tuned from real numbers instead of guesses.
+Each wait is also logged as a "wait" event in common/metrics.py.
+"""
+
+import time
+from collections import defaultdict
+
+from playwright.sync_api import TimeoutError
+
+from common import metrics
+
+DEFAULT_TIMEOUT = 15000
+
+_latency = defaultdict(list)
+_timeouts = defaultdict(int)
+
+_TEXT_JS = """([sel, n]) => {
+    const el = document.querySelector(sel);
+    return !!el && (el.innerText || '').trim().length >= n;
+}"""
+
+_STABLE_JS = """([sel, quiet]) => {
+    const n = document.querySelectorAll(sel).length;
+    const seen = (window.__crawlWait = window.__crawlWait || {});
+    const now = performance.now();
+    const prev = seen[sel];
+    if (!prev || prev.n !== n) {
+        seen[sel] = { n: n, t: now };
+        return false;
+    }
+    return n > 0 && now - prev.t >= quiet;
+}"""
+
+
+def wait_ready(target, selector, site, timeout=DEFAULT_TIMEOUT, min_text=0, stable_ms=0):
+    """`selector` 조건이 충족될 때까지 대기. 충족되면 True, timeout이면 False."""
+    start = time.monotonic()
+    try:
+        if stable_ms:
+            target.wait_for_function(_STABLE_JS, arg=[selector, stable_ms],
+                                     polling=100, timeout=timeout)
+        elif min_text:
+            target.wait_for_function(_TEXT_JS, arg=[selector, min_text],
+                                     polling=100, timeout=timeout)
+        else:
+            target.wait_for_selector(selector, state="visible", timeout=timeout)
+    except TimeoutError:
+        _timeouts[site] += 1
+        metrics.record(site, "wait", (time.monotonic() - start) * 1000, ok=False)
+        print(f"[WARN] {site}: '{selector}' not ready within {timeout / 1000:.0f}s")
+        return False
+
+    _latency[site].append(time.monotonic() - start)
+    metrics.record(site, "wait", _latency[site][-1] * 1000)
+    return True
+
+
+def report():
+    """사이트별 readiness latency 요약을 출력하고 초기화."""
+    for site in sorted(set(_latency) | set(_timeouts)):
+        samples = sorted(_latency[site])
+        if samples:
+            stats = (f"p50={_percentile(samples, 50):.2f}s "
+                     f"p95={_percentile(samples, 95):.2f}s max={samples[-1]:.2f}s")
+        else:
+            stats = "no successful waits"
+        print(f"[INFO] Ready latency {site}: n={len(samples)} {stats} "
+              f"timeouts={_timeouts[site]}")
+    _latency.clear()
+    _timeouts.clear()
+
+
+def _percentile(samples, pct):
+    idx = min(len(samples) - 1, max(0, round(pct / 100 * len(samples)) - 1))
+    return samples[idx]
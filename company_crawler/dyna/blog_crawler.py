@@ -1,7 +1,9 @@
-from playwright.sync_api import sync_playwright, TimeoutError
 import hashlib
 import re
-import time
+
+from common.browser import open_browser
+from common.rate_limit import throttle
+from common.waits import wait_ready
 
 BASE_URL = "https://www.dyna.co"
 
@@ -41,20 +43,19 @@ def parse_date(raw: str) -> str:
     return raw
 
 
-def blog_crawler():
+def blog_crawler(provider=None):
     results = []
     seen = set()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("dyna", provider) as browser:
         page = browser.new_page()
 
         for section, url in LIST_PAGES:
-            try:
-                page.goto(url, wait_until="networkidle", timeout=60000)
-            except TimeoutError:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(3)  # SPA cards fade in after load
+            throttle(url)
+            page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            # SPA cards fade in after load — wait until the card count settles
+            wait_ready(page, "div.cursor-pointer h2, div.cursor-pointer h3", f"dyna/{section}",
+                       timeout=30000, stable_ms=800)
 
             cards = page.evaluate(r"""
                 () => {
@@ -95,8 +96,6 @@ def blog_crawler():
                     "url": url,   # per-post URLs aren't exposed (router-driven cards)
                 })
 
-        browser.close()
-
     print(f"[INFO] Found {len(results)} research/blog posts")
     return results
 
@@ -3,10 +3,14 @@ from dyna.blog_compare import blog_compare
 from dyna.position_crawler import position_crawler
 from dyna.position_compare import position_compare
 
-def run(purpose):
+from common.browser import BrowserProvider
+from common.digest import compare_or_checked
+
+
+def run(purpose, provider=None):
     # Crawl and Compare Researches
     if purpose == "blog" or purpose == "all":
-        blogs = blog_crawler()
+        blogs = blog_crawler(provider)
         blog_result = blog_compare(blogs)
         if purpose == "blog":
             return {
@@ -16,8 +20,8 @@ def run(purpose):
 
     # Crawl and Compare Positions
     if purpose == "career" or purpose == "all":
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
         if purpose == "career":
             return {
                 "company": "DYNA",
@@ -31,4 +35,5 @@ def run(purpose):
     }
 
 if __name__ == "__main__":
-    print(run())
\ No newline at end of file
+    with BrowserProvider() as provider:
+        print(run("all", provider))
@@ -1,14 +1,15 @@
 # position_compare.py
 
-import json
 from pathlib import Path
 from typing import List, Dict
 
+from common import event_log, snapshot_io
+
 DATA_PATH = Path("data/dyna/dyna_positions.json")
 
 
 def position_compare(curr_items: List[Dict]) -> Dict:
-    if not DATA_PATH.exists():
+    if not snapshot_io.exists(DATA_PATH):
         _save(curr_items)
         return {
             "status": "initialized",
@@ -18,7 +19,7 @@ def position_compare(curr_items: List[Dict]) -> Dict:
         }
 
     try:
-        prev_items = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+        prev_items = snapshot_io.read_json(DATA_PATH)
         if not isinstance(prev_items, list):
             raise ValueError
     except Exception:
@@ -64,6 +65,7 @@ def position_compare(curr_items: List[Dict]) -> Dict:
             "status": "checked"
         }
 
+    event_log.record_compare(DATA_PATH, prev_map, curr_map)
     _save(curr_items)
 
     return {
@@ -75,11 +77,7 @@ def position_compare(curr_items: List[Dict]) -> Dict:
 
 
 def _save(items: List[Dict]):
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    DATA_PATH.write_text(
-        json.dumps(items, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    snapshot_io.write_json(DATA_PATH, items)
 
 
 if __name__ == "__main__":
@@ -88,8 +86,13 @@ if __name__ == "__main__":
     print("[INFO] Crawling DYNA positions...")
     positions = position_crawler()
 
-    print(f"[INFO] Comparing {len(positions)} positions...")
-    result = position_compare(positions)
+    if positions is None:
+        # 목록 digest가 같아 상세 crawl을 건너뜀 (main.run의 compare_or_checked와 같은 처리)
+        print("[INFO] Position list unchanged since last crawl — nothing to compare")
+        result = {"status": "checked"}
+    else:
+        print(f"[INFO] Comparing {len(positions)} positions...")
+        result = position_compare(positions)
 
     print(f"\n[RESULT] Status: {result['status']}")
 
@@ -1,18 +1,21 @@
-from playwright.sync_api import sync_playwright
 from datetime import datetime
 
+from common.browser import open_browser
+from common.rate_limit import throttle
+from common.waits import wait_ready
+
 GENERALIST_URL = "https://generalistai.com"
 BLOG_URL = "https://generalistai.com/blog"
 
 
-def blog_crawler():
+def blog_crawler(provider=None):
     items = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("generalist_ai", provider) as browser:
         page = browser.new_page()
+        throttle(BLOG_URL)
         page.goto(BLOG_URL, wait_until="domcontentloaded", timeout=60000)
-        page.wait_for_timeout(3000)
+        wait_ready(page, "a.blog-menu-article-link", "generalist/blog", timeout=30000, stable_ms=500)
 
         posts = page.eval_on_selector_all(
             "a.blog-menu-article-link",
@@ -26,8 +29,6 @@ def blog_crawler():
             })""",
         )
 
-        browser.close()
-
     for post in posts:
         href = post["href"]
         lines = post["lines"]
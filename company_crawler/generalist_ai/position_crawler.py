@@ -1,9 +1,18 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+from pathlib import Path
 from urllib.parse import quote
 import hashlib
-import time
+
+from common import budget
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.incremental import REVALIDATE_DAYS, CardCache, card_fingerprint
+from common.page_pool import fetch_details
+from common.rate_limit import throttle
+from common.waits import wait_ready
 
 CAREERS_URL = "https://generalistai.com/careers"
+DATA_PATH = Path("data/generalist_ai/generalist_positions.json")
 
 # 상세 설명에서 제거할 공통 텍스트
 _BOILERPLATE_MARKERS = [
@@ -13,14 +22,14 @@ _BOILERPLATE_MARKERS = [
 ]
 
 
-def position_crawler():
+def position_crawler(provider=None):
     positions = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("generalist_ai", provider) as browser:
         page = browser.new_page()
+        throttle(CAREERS_URL)
         page.goto(CAREERS_URL, wait_until="domcontentloaded", timeout=60000)
-        page.wait_for_timeout(3000)
+        wait_ready(page, 'a[href*="/careers?posting="]', "generalist/list", timeout=30000, stable_ms=500)
 
         # 1️⃣ 채용 공고 목록 수집
         jobs = page.eval_on_selector_all(
@@ -42,19 +51,60 @@ def position_crawler():
 
         print(f"[INFO] Found {len(jobs)} position links")
 
-        # 2️⃣ 각 공고 상세 페이지에서 JD 추출
-        for idx, job in enumerate(jobs):
+        # 2️⃣ 각 공고의 JD 추출
+        #     카드(posting / title / department / location)가 그대로면 이전 레코드 재사용
+        fingerprints = [
+            card_fingerprint(job["posting_id"], job["title"], job["department"], job["location"])
+            for job in jobs
+        ]
+        # 목록이 지난번과 같으면 (검증 기한 내) 상세 페이지를 하나도 열지 않음
+        digest = ListDigest(DATA_PATH)
+        if digest.unchanged(fingerprints):
+            return None
+        cache = CardCache(DATA_PATH, days=1 if digest.full else REVALIDATE_DAYS)
+        # 오늘 중단됐던 crawl의 재실행이면 이미 받은 공고는 체크포인트에서 이어받음
+        checkpoint = Checkpoint(DATA_PATH)
+        reused = [checkpoint.get(fp) or cache.reuse(fp) for fp in fingerprints]
+        pending = [job for job, prev in zip(jobs, reused) if prev is None]
+
+        #     이미 떠 있는 SPA 안에서 클릭 → 읽기 → 뒤로 (공고마다 앱을 다시 부팅하지 않음)
+        descriptions = _read_in_app(page, pending)
+
+        #     앱 내 이동으로 못 읽은 공고만 ?posting= URL을 탭 풀에서 직접 로드
+        missing = [job for job in pending if job["posting_id"] not in descriptions]
+        if missing:
+            print(f"[INFO] Loading {len(missing)} postings by URL")
+            fetched = fetch_details(
+                browser,
+                missing,
+                url_of=lambda job: f"{CAREERS_URL}?posting={job['posting_id']}",
+                read=_read_description,
+                ready=".careers-detail",
+                ready_text=50,
+                site="generalist/detail",
+            )
+            descriptions.update((job["posting_id"], d) for job, d in zip(missing, fetched))
+
+        failed = 0
+        for idx, (job, fp, prev) in enumerate(zip(jobs, fingerprints, reused)):
+            if prev is not None:
+                positions.append(prev)
+                cache.remember(fp, prev)
+                continue
+
+            description = descriptions.get(job["posting_id"])
             title = job["title"]
+            if not description:
+                # 로드 실패 / 시간 예산 소진 → 알던 공고면 이전 레코드를 그대로 이어감 (삭제로 보지 않음)
+                failed += 1
+                if not cache.carry_into(positions, fp):
+                    print(f"[WARN] Empty description: {title}")
+                continue
             posting_id = job["posting_id"]
             location = job["location"]
             print(f"[INFO] ({idx+1}/{len(jobs)}) Processing: {title}")
 
-            description = _extract_description(page, posting_id)
-            if not description:
-                print(f"[WARN] Empty description: {title}")
-                continue
-
-            positions.append({
+            position = {
                 # Use the unique Ashby posting UUID as id, not a title slug —
                 # two postings can share a title (e.g. "Office Manager" SFO + BOS),
                 # and a slug collision silently merges them (one role becomes
@@ -66,39 +116,92 @@ def position_crawler():
                 "description": description,
                 "description_hash": _hash_text(description),
                 "url": f"{CAREERS_URL}?posting={posting_id}",
-            })
+            }
+            positions.append(position)
+            cache.remember(fp, position)
+            checkpoint.add(fp, position)
 
-            time.sleep(0.5)
-
-        browser.close()
+        # 모든 카드가 상세까지 받아졌을 때만 digest 저장 (실패한 공고가 묻히지 않게)
+        if len(positions) == len(fingerprints) and not failed:
+            digest.save()
+        cache.save()
 
     return positions
 
 
-def _extract_description(page, posting_id, retries=3):
-    url = f"{CAREERS_URL}?posting={posting_id}"
+def _read_in_app(page, jobs, max_misses=2):
+    """목록 페이지에서 공고 링크를 클릭해 .careers-detail을 읽고 뒤로 돌아온다.
 
-    for attempt in range(retries):
-        try:
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+    {posting_id: description}을 반환. 연속으로 `max_misses`번 실패하거나 (사이트
+    구조 변경 등) 목록 페이지 복구가 실패하면 남은 공고는 호출자가 URL 로드로
+    처리하도록 중단한다 — 예외는 밖으로 던지지 않는다.
+    """
+    found = {}
+    misses = 0
 
-            detail = page.query_selector(".careers-detail")
-            if not detail:
-                continue
-
-            raw_text = detail.inner_text().strip()
-            if not raw_text or len(raw_text) < 50:
-                continue
-
-            return _clean_description(raw_text)
+    for job in jobs:
+        if budget.out_of_time("generalist/in-app"):
+            break
+        if misses >= max_misses:
+            print("[WARN] In-app navigation keeps failing; loading the rest by URL")
+            break
 
-        except TimeoutError:
-            print(f"[WARN] Attempt {attempt+1}/{retries} timeout for {posting_id}")
+        description = None
+        try:
+            link = page.query_selector(f'a[href*="posting={job["posting_id"]}"]')
+            if link:
+                link.click()
+                # 이전 공고 내용이 아니라 클릭한 공고가 렌더됐는지 제목으로 확인
+                if (wait_ready(page, ".careers-detail", "generalist/in-app", timeout=5000, min_text=50)
+                        and job["title"] in page.inner_text(".careers-detail")):
+                    description = _read_description(page, job)
+                _back_to_list(page)
         except Exception as e:
-            print(f"[WARN] Attempt {attempt+1}/{retries} error: {e}")
-
-    return ""
+            print(f"[WARN] In-app read failed for {job['title']}: {e}")
+            try:
+                _back_to_list(page, reload=True)
+            except Exception as e:
+                # 목록으로도 못 돌아오면 앱 내 읽기는 여기까지 — 나머지는 호출자가 URL로 로드
+                print(f"[WARN] Could not return to the list ({e}); loading the rest by URL")
+                break
+
+        if description:
+            found[job["posting_id"]] = description
+            misses = 0
+        else:
+            misses += 1
+
+    if jobs:
+        print(f"[INFO] Read {len(found)}/{len(jobs)} postings in-app")
+    return found
+
+
+def _back_to_list(page, reload=False):
+    """상세 → 목록 복귀. history back이 안 먹으면 목록을 다시 로드."""
+    if not reload:
+        try:
+            page.go_back(wait_until="commit", timeout=10000)
+            page.wait_for_selector(".careers-detail", state="detached", timeout=5000)
+            wait_ready(page, 'a[href*="/careers?posting="]', "generalist/back", timeout=10000)
+            return
+        except Exception:
+            pass
+    throttle(CAREERS_URL)
+    page.goto(CAREERS_URL, wait_until="domcontentloaded", timeout=60000)
+    wait_ready(page, 'a[href*="/careers?posting="]', "generalist/list", timeout=30000, stable_ms=500)
+
+
+def _read_description(page, job):
+    """로드된 공고 페이지의 .careers-detail 텍스트를 정리해서 반환 (없으면 None)."""
+    detail = page.query_selector(".careers-detail")
+    if not detail:
+        return None
+
+    raw_text = detail.inner_text().strip()
+    if not raw_text or len(raw_text) < 50:
+        return None
+
+    return _clean_description(raw_text)
 
 
 def _clean_description(text):
@@ -1,9 +1,20 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+from playwright.sync_api import TimeoutError
 from datetime import datetime
+from pathlib import Path
 import hashlib
 import time
 
+from common import budget, metrics
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.http_fetch import fetch_via_http, selector_text
+from common.incremental import BLOG_REVALIDATE_DAYS, StoredPosts, card_fingerprint
+from common.rate_limit import throttle
+from common.waits import wait_ready
+
 GENESIS_URL = "https://www.genesis.ai"
+DATA_PATH = Path("data/genesis/genesis_blog.json")
 
 # Genesis splits long-form writing across two list pages that share an
 # identical card + article template:
@@ -16,7 +27,7 @@ LIST_PAGES = [
 ]
 
 
-def blog_crawler():
+def blog_crawler(provider=None):
     """
     Genesis /blog + /press 카드를 수집하고, 각 글의 상세 페이지에 재귀적으로
     들어가 본문(content)까지 추출한다.
@@ -27,15 +38,16 @@ def blog_crawler():
     """
     items = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("genesis", provider) as browser:
         page = browser.new_page()
 
         # 1️⃣ blog/press 목록에서 카드 수집
         cards = []
         for section, url in LIST_PAGES:
+            throttle(url)
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+            wait_ready(page, 'a[href^="/blog/"], a[href^="/press/"]', f"genesis/{section}",
+                       timeout=30000, stable_ms=500)
 
             found = page.eval_on_selector_all(
                 'a[href^="/blog/"], a[href^="/press/"]',
@@ -83,31 +95,62 @@ def blog_crawler():
               f"({sum(c['section'] == 'blog' for c in parsed)} blog, "
               f"{sum(c['section'] == 'press' for c in parsed)} press)")
 
-        # 2️⃣ 각 글 상세 페이지에서 본문 추출
+        # 목록(카드)이 지난번과 같으면 본문 페이지를 열지 않고 종료 (main.run → "checked")
+        digest = ListDigest(DATA_PATH)
+        fingerprints = [card_fingerprint(c["href"], c["title"], c["category"], c["date_raw"])
+                        for c in parsed]
+        if digest.unchanged(fingerprints):
+            return None
+
+        # 2️⃣ 각 글 상세 페이지에서 본문 추출 (카드가 그대로인 글은 저장된 본문 재사용)
+        stored = StoredPosts(DATA_PATH, days=1 if digest.full else BLOG_REVALIDATE_DAYS)
+        checkpoint = Checkpoint(DATA_PATH)
+        failed = 0
         for idx, card in enumerate(parsed):
             title = card["title"]
-            print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
-
-            content = _extract_article_body(page, card["url"])
-            if not content:
-                print(f"[WARN] Empty body: {title}")
-            time.sleep(0.5)
+            date = _normalize_date(card["date_raw"])
+
+            done = checkpoint.get(card["href"])
+            content = done["content"] if done else stored.content(card["href"], title, date)
+            source = done.get("source", "") if done else stored.source(card["href"])
+            if done:
+                print(f"[INFO] ({idx+1}/{len(parsed)}) Already fetched today: {title}")
+            elif content is not None:
+                print(f"[INFO] ({idx+1}/{len(parsed)}) Unchanged (stored body): {title}")
+            elif budget.out_of_time("genesis/article"):
+                # 예산 소진: 알던 글은 저장된 항목 그대로 (본문이 없어도) 이어가고, 처음 보는 글은 다음 run으로
+                stored.carry_into(items, card["href"])
+                continue
+            else:
+                print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
+                content, source = _extract_article_body(page, card["url"])
+                if not content:
+                    print(f"[WARN] Empty body: {title}")
+                    failed += 1
+                else:
+                    checkpoint.add(card["href"], {"content": content, "source": source})
 
             excerpt = content[:280].strip() if content else ""
 
-            items.append({
+            item = {
                 "id": card["href"],
                 "title": title,
-                "date": _normalize_date(card["date_raw"]),
+                "date": date,
                 "category": card["category"],
                 "type": _type_of(card["category"], card["section"]),
                 "excerpt": excerpt,
                 "content": content,
                 "content_hash": _hash_text(content),
                 "url": card["url"],
-            })
+            }
+            # plain HTTP로 받은 본문 표시 (브라우저 본문에는 source가 없음) — blog_compare 참고
+            if source:
+                item["source"] = source
+            items.append(item)
 
-        browser.close()
+        if not failed:
+            digest.save()
+        stored.report()
 
     return items
 
@@ -117,11 +160,18 @@ def _extract_article_body(page, url, retries=3):
 
     section.article-block 안의 p.description(서브타이틀) + .blocks(본문) 텍스트를
     합쳐서 반환한다. 헤더/푸터/Related 섹션은 자연스럽게 제외된다.
+    (본문, source) — plain HTTP로 받았으면 source는 "http", 브라우저면 "".
     """
+    body = fetch_via_http(url, "genesis/article", _article_text)
+    if body:
+        return body, "http"
+
+    start = time.monotonic()
     for attempt in range(retries):
         try:
+            throttle(url)
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+            wait_ready(page, ".article-block", "genesis/article", timeout=10000, min_text=30)
 
             body = page.evaluate("""
                 () => {
@@ -140,14 +190,28 @@ def _extract_article_body(page, url, retries=3):
             """)
 
             if body and len(body) >= 30:
-                return body
+                metrics.record("genesis/article", "page", (time.monotonic() - start) * 1000,
+                               attempts=attempt + 1, url=url)
+                return body, ""
 
         except TimeoutError:
             print(f"[WARN] Attempt {attempt+1}/{retries} timeout for {url}")
         except Exception as e:
             print(f"[WARN] Attempt {attempt+1}/{retries} error: {e}")
 
-    return ""
+    metrics.record("genesis/article", "page", (time.monotonic() - start) * 1000, ok=False,
+                   attempts=retries, url=url)
+    return "", ""
+
+
+def _article_text(soup):
+    """정적 HTML에서 같은 본문 추출 — .article-block이 없으면 None (브라우저로)."""
+    if soup.select_one(".article-block") is None:
+        return None
+    parts = [text for text in (selector_text(soup, ".article-block p.description"),
+                               selector_text(soup, ".article-block .blocks")) if text]
+    body = "\n\n".join(parts) if parts else selector_text(soup, ".article-block")
+    return body if body and len(body) >= 30 else None
 
 
 def _type_of(category, section):
@@ -177,8 +241,12 @@ def _hash_text(text):
 
 if __name__ == "__main__":
     data = blog_crawler()
-    print(f"\n[RESULT] Total {len(data)} posts:\n")
-    for item in data:
-        print(f"  - [{item['type']}] {item['title']} ({item['date']})")
-        print(f"    URL: {item['url']}")
-        print(f"    body: {len(item['content'])} chars")
+    # 목록 digest가 같으면 crawler는 None (상세 crawl 생략) — CRAWL_FORCE_FULL=1이면 다시 받음
+    if data is None:
+        print("\n[RESULT] Blog list unchanged since last crawl (CRAWL_FORCE_FULL=1 to re-crawl)")
+    else:
+        print(f"\n[RESULT] Total {len(data)} posts:\n")
+        for item in data:
+            print(f"  - [{item['type']}] {item['title']} ({item['date']})")
+            print(f"    URL: {item['url']}")
+            print(f"    body: {len(item['content'])} chars")
@@ -1,11 +1,14 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from common.http_fetch import HTTP_TIMEOUT, session
+from common.rate_limit import throttle
+
 def blog_crawler():
     PI_URL = "https://www.pi.website"
     url = "https://www.pi.website/blog"
-    resp = requests.get(url)
+    throttle(url)
+    resp = session().get(url, timeout=HTTP_TIMEOUT)
     soup = BeautifulSoup(resp.text, "html.parser")
     container = soup.select_one("div.relative.flex.flex-col.space-y-4")
 
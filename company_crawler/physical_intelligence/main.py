@@ -3,15 +3,19 @@ from physical_intelligence.blog_compare import blog_compare
 from physical_intelligence.position_crawler import position_crawler
 from physical_intelligence.position_compare import position_compare
 
-def run(purpose):
+from common.browser import BrowserProvider
+from common.digest import compare_or_checked
+
+
+def run(purpose, provider=None):
     if purpose == "all":
         # Crawl and Compare Researches
         blogs = blog_crawler()
         research_result = blog_compare(blogs)
 
         # Crawl and Compare Positions
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
 
         return {
             "company": "Physical Intelligence",
@@ -31,8 +35,8 @@ def run(purpose):
 
     # Crawl and Compare Positions
     if purpose == "career":
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
 
         return {
             "company": "Physical Intelligence",
@@ -40,4 +44,5 @@ def run(purpose):
         }
 
 if __name__ == "__main__":
-    print(run("all"))
\ No newline at end of file
+    with BrowserProvider() as provider:
+        print(run("all", provider))
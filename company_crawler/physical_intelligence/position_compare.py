@@ -1,7 +1,8 @@
-import json
 import hashlib
 from pathlib import Path
 
+from common import event_log, snapshot_io
+
 DATA_PATH = Path("data/physical_intelligence/pi_positions.json")
 
 
@@ -23,7 +24,7 @@ def position_compare(curr_positions):
         pos["description_hash"] = _hash_text(pos.get("description", ""))
 
     # 1️⃣ 최초 실행
-    if not DATA_PATH.exists():
+    if not snapshot_io.exists(DATA_PATH):
         _save(curr_positions)
         return {
             "status": "initialized",
@@ -33,7 +34,7 @@ def position_compare(curr_positions):
         }
 
     # 2️⃣ 이전 데이터 로드
-    prev_positions = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    prev_positions = snapshot_io.read_json(DATA_PATH)
 
     # Guard: a completely empty crawl almost always means the crawler broke
     # (selector/site change, network) — not that every posting truly vanished.
@@ -59,10 +60,16 @@ def position_compare(curr_positions):
 
     # 4️⃣ JD 변경 감지
     updated = []
+    rebased = []
     common_ids = prev_ids & curr_ids
 
     for pid in common_ids:
         if prev_map[pid].get("description_hash") != curr_map[pid].get("description_hash"):
+            # API ↔ 브라우저 경로가 바뀌면 같은 JD도 본문 모양이 달라짐
+            # → 이번 한 번은 변경으로 보지 않고 새 본문을 기준으로 삼는다
+            if prev_map[pid].get("source") != curr_map[pid].get("source"):
+                rebased.append(pid)
+                continue
             updated.append({
                 "id": pid,
                 "title": curr_map[pid]["title"],
@@ -71,12 +78,20 @@ def position_compare(curr_positions):
                 "after": curr_map[pid].get("description", "")
             })
     
+    if rebased:
+        print(f"[INFO] Rebaselined {len(rebased)} descriptions after a crawl source change")
+        # 이벤트 로그에도 modify로 남기지 않음
+        prev_map.update((pid, curr_map[pid]) for pid in rebased)
+
     if not added and not removed and not updated:
+        if rebased:
+            _save(curr_positions)
         return {
             "status": "checked"
         }
     
-    # 5️⃣ 현재 상태 저장
+    # 5️⃣ 이벤트 로그 기록 + 현재 상태 저장
+    event_log.record_compare(DATA_PATH, prev_map, curr_map)
     _save(curr_positions)
 
     return {
@@ -90,11 +105,7 @@ def position_compare(curr_positions):
 # ---------- helpers ----------
 
 def _save(positions):
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    DATA_PATH.write_text(
-        json.dumps(positions, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    snapshot_io.write_json(DATA_PATH, positions)
 
 
 def _hash_text(text):
@@ -1,9 +1,27 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+from playwright.sync_api import TimeoutError
+from pathlib import Path
 from urllib.parse import quote
 import hashlib
-import time
+import re
+
+from common.ashby import ASHBY_HOST, fetch_board
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.http_fetch import session
+from common.incremental import REVALIDATE_DAYS, CardCache, card_fingerprint
+from common.page_pool import fetch_details
+from common.rate_limit import throttle
+from common.waits import wait_ready
 
 JOIN_US_URL = "https://www.pi.website/join-us"
+DATA_PATH = Path("data/physical_intelligence/pi_positions.json")
+
+# API 경로 레코드 표시 (브라우저 경로 레코드에는 source가 없음)
+API_SOURCE = "ashby_api"
+
+# join-us 페이지가 심어 두는 Ashby embed (스크립트/iframe src)에서 org 이름을 찾는다
+_ASHBY_ORG_RE = re.compile(re.escape(ASHBY_HOST.split("//")[1]) + r"/([A-Za-z0-9._-]+)")
 
 # Ashby iframe에서 제외할 텍스트 (지원 폼 필드 등)
 _BLACKLIST = {
@@ -16,7 +34,64 @@ _FORM_FIELDS = {
 }
 
 
-def position_crawler():
+def position_crawler(provider=None):
+    # 1순위: join-us가 임베드한 Ashby 보드를 posting API로 한 번에
+    try:
+        return _crawl_api()
+    except Exception as e:
+        print(f"[WARN] Ashby API fetch failed ({e}); falling back to browser crawl")
+
+    return _crawl_browser(provider)
+
+
+def _crawl_api():
+    """
+    join-us HTML에서 Ashby org를 한 번 찾고, 보드 전체(JD 포함)를 API로 받는다.
+
+    id는 브라우저 경로와 같은 `_make_job_id(title)`, 본문도 iframe 텍스트와 같은
+    모양(제목 + 비어 있지 않은 줄, `_clean_ashby_text` 정리)으로 만들어
+    기존 이력/해시와 이어지게 한다. location / compensation도 기존 스키마대로 비워 둔다.
+
+    descriptionPlain은 iframe 렌더링과 줄바꿈/목록 표기가 조금씩 달라 해시가
+    그대로 이어지지는 않는다 — 그래서 레코드에 `source`를 남기고,
+    position_compare가 경로가 바뀐 날의 본문 차이는 변경으로 보지 않는다.
+    """
+    org = _resolve_ashby_org()
+    positions = []
+
+    for job in fetch_board(org):
+        title = (job.get("title") or "").strip()
+        description = _clean_ashby_text(title + "\n" + (job.get("descriptionPlain") or ""))
+        if not title or description == title:
+            print(f"[WARN] Empty JD: {title}")
+            continue
+
+        positions.append({
+            "id": _make_job_id(title),
+            "title": title,
+            "location": "",
+            "compensation": "",
+            "description": description,
+            "description_hash": _hash_text(description),
+            "url": JOIN_US_URL,
+            "source": API_SOURCE,
+        })
+
+    print(f"[INFO] Fetched {len(positions)} positions from Ashby API (org: {org})")
+    return positions
+
+
+def _resolve_ashby_org():
+    throttle(JOIN_US_URL)
+    resp = session().get(JOIN_US_URL, timeout=30)
+    resp.raise_for_status()
+    for org in _ASHBY_ORG_RE.findall(resp.text):
+        if org not in ("api", "embed"):
+            return org
+    raise ValueError("no Ashby embed found on join-us page")
+
+
+def _crawl_browser(provider):
     """
     PI 채용 페이지 스크래퍼.
 
@@ -27,45 +102,68 @@ def position_crawler():
     """
     positions = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("physical_intelligence", provider) as browser:
         page = browser.new_page()
-        page.goto(JOIN_US_URL, timeout=30000)
-        page.wait_for_load_state("networkidle")
+        throttle(JOIN_US_URL)
+        page.goto(JOIN_US_URL, wait_until="domcontentloaded", timeout=30000)
+        wait_ready(page, "section button", "pi/list", timeout=30000, stable_ms=500)
 
         # 1️⃣ 모든 부서 섹션을 펼쳐서 job 링크 수집
         jobs = _collect_all_job_links(page)
         print(f"[INFO] Found {len(jobs)} position links")
 
-        # 2️⃣ 각 job 클릭 → iframe에서 JD 추출
-        for idx, job in enumerate(jobs):
-            title = job["title"]
-            ashby_jid = job["ashby_jid"]
-            print(f"[INFO] ({idx+1}/{len(jobs)}) Processing: {title}")
+        # 2️⃣ 각 job 페이지 → iframe에서 JD 추출 (탭 풀에서 병렬 로드)
+        #     링크(title + ashby_jid)가 그대로인 공고는 이전 레코드 재사용
+        fingerprints = [card_fingerprint(job["ashby_jid"], job["title"]) for job in jobs]
+        # 목록이 지난번과 같으면 (검증 기한 내) 상세 페이지를 하나도 열지 않음
+        digest = ListDigest(DATA_PATH)
+        if digest.unchanged(fingerprints):
+            return None
+        cache = CardCache(DATA_PATH, days=1 if digest.full else REVALIDATE_DAYS)
+        # 오늘 중단됐던 crawl의 재실행이면 이미 받은 공고는 체크포인트에서 이어받음
+        checkpoint = Checkpoint(DATA_PATH)
+        reused = [checkpoint.get(fp) or cache.reuse(fp) for fp in fingerprints]
+        descriptions = iter(fetch_details(
+            browser,
+            [job for job, prev in zip(jobs, reused) if prev is None],
+            url_of=lambda job: f"{JOIN_US_URL}?ashby_jid={job['ashby_jid']}",
+            read=_read_job_description,
+        ))
+
+        failed = 0
+        for idx, (job, fp, prev) in enumerate(zip(jobs, fingerprints, reused)):
+            if prev is not None:
+                positions.append(prev)
+                cache.remember(fp, prev)
+                continue
 
-            try:
-                description = _extract_job_description(page, ashby_jid)
-                if not description:
+            description = next(descriptions)
+            title = job["title"]
+            if not description:
+                # 로드 실패 / 시간 예산 소진 → 알던 공고면 이전 레코드를 그대로 이어감 (삭제로 보지 않음)
+                failed += 1
+                if not cache.carry_into(positions, fp):
                     print(f"[WARN] Empty JD: {title}")
-                    continue
-
-                positions.append({
-                    "id": _make_job_id(title),
-                    "title": title,
-                    "location": "",
-                    "compensation": "",
-                    "description": description,
-                    "description_hash": _hash_text(description),
-                    "url": JOIN_US_URL,
-                })
-
-            except Exception as e:
-                print(f"[ERROR] Failed position {title}: {e}")
                 continue
+            print(f"[INFO] ({idx+1}/{len(jobs)}) Processing: {title}")
 
-            time.sleep(0.5)
-
-        browser.close()
+            position = {
+                "id": _make_job_id(title),
+                "title": title,
+                "location": "",
+                "compensation": "",
+                "description": description,
+                "description_hash": _hash_text(description),
+                "url": JOIN_US_URL,
+            }
+            positions.append(position)
+            cache.remember(fp, position)
+            checkpoint.add(fp, position)
+
+        # 모든 카드가 상세까지 받아졌을 때만 digest 저장 (실패한 공고가 묻히지 않게)
+        if len(positions) == len(fingerprints) and not failed:
+            digest.save()
+        cache.save()
 
     return positions
 
@@ -84,7 +182,7 @@ def _collect_all_job_links(page):
         expanded = btn.get_attribute("aria-expanded")
         if expanded != "true":
             btn.click()
-            page.wait_for_timeout(400)
+            wait_ready(section, "ul li a", "pi/accordion", timeout=2000)
 
         links = section.query_selector_all("ul li a")
         for link in links:
@@ -97,43 +195,28 @@ def _collect_all_job_links(page):
     return all_jobs
 
 
-def _extract_job_description(page, ashby_jid, retries=3):
-    """ashby_jid로 JD 페이지를 열고 iframe 본문을 추출."""
-    url = f"{JOIN_US_URL}?ashby_jid={ashby_jid}"
+def _read_job_description(page, job):
+    """로드된 ?ashby_jid= 페이지의 Ashby iframe 본문을 추출 (없으면 None)."""
+    iframe_el = page.wait_for_selector(
+        "iframe#ashby_embed_iframe", state="attached", timeout=15000
+    )
+    frame = iframe_el.content_frame()
+    if not frame:
+        return None
 
-    for attempt in range(retries):
-        try:
-            page.goto(url, timeout=30000)
-            page.wait_for_load_state("networkidle")
-
-            iframe_el = page.wait_for_selector(
-                "iframe#ashby_embed_iframe", state="attached", timeout=15000
-            )
-            time.sleep(2)
-
-            frame = iframe_el.content_frame()
-            if not frame:
-                continue
-
-            try:
-                frame.wait_for_selector("p, h1, h2", state="visible", timeout=10000)
-            except TimeoutError:
-                continue
-
-            time.sleep(1)
-            raw_text = frame.locator("body").inner_text()
-
-            if not raw_text or len(raw_text.strip()) < 50:
-                continue
+    try:
+        frame.wait_for_selector("p, h1, h2", state="visible", timeout=10000)
+    except TimeoutError:
+        return None
 
-            return _clean_ashby_text(raw_text)
+    # 본문 문단 수가 더 늘지 않을 때까지 (고정 1초 대기 대신)
+    wait_ready(frame, "p, li", "pi/iframe", timeout=5000, stable_ms=300)
+    raw_text = frame.locator("body").inner_text()
 
-        except TimeoutError:
-            print(f"[WARN] Attempt {attempt+1}/{retries} timeout for {ashby_jid}")
-        except Exception as e:
-            print(f"[WARN] Attempt {attempt+1}/{retries} error: {e}")
+    if not raw_text or len(raw_text.strip()) < 50:
+        return None
 
-    return ""
+    return _clean_ashby_text(raw_text)
 
 
 # ---------- helpers ----------
@@ -1,12 +1,13 @@
-import json
 from pathlib import Path
 
+from common import snapshot_io
+
 DATA_PATH = Path("data/rhoda/rhoda_blog.json")
 
 
 def blog_compare(curr_items):
     # 최초 실행
-    if not DATA_PATH.exists():
+    if not snapshot_io.exists(DATA_PATH):
         _save(curr_items)
         return {
             "status": "initialized",
@@ -16,7 +17,7 @@ def blog_compare(curr_items):
         }
 
     # 이전 데이터 로드
-    prev_items = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    prev_items = snapshot_io.read_json(DATA_PATH)
 
     # Guard: an empty crawl is treated as a crawl failure, not a real wipe —
     # don't overwrite good data or report a false mass-removal.
@@ -37,8 +38,14 @@ def blog_compare(curr_items):
 
     # 본문(content_hash) 변경 감지. 구 스냅샷에 content_hash가 없으면 excerpt로 폴백.
     updated = []
+    rebased = 0
     for pid in prev_ids & curr_ids:
         prev, curr = prev_map[pid], curr_map[pid]
+        # plain HTTP ↔ 브라우저로 본문 경로가 바뀌면 같은 글도 공백/줄바꿈이 달라짐
+        # → 이번 한 번은 변경으로 보지 않고 새 본문을 기준으로 삼는다
+        if prev.get("source", "") != curr.get("source", ""):
+            rebased += _changed(prev, curr)
+            continue
         if _changed(prev, curr):
             updated.append({
                 "id": pid,
@@ -48,7 +55,12 @@ def blog_compare(curr_items):
                 "after": curr.get("content") or curr.get("excerpt", ""),
             })
 
+    if rebased:
+        print(f"[INFO] Rebaselined {rebased} post bodies after a fetch path change")
+
     if not added and not removed and not updated:
+        if rebased:
+            _save(curr_items)
         return {"status": "checked"}
 
     _save(curr_items)
@@ -67,8 +79,4 @@ def _changed(prev, curr):
 
 
 def _save(items):
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    DATA_PATH.write_text(
-        json.dumps(items, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    snapshot_io.write_json(DATA_PATH, items)
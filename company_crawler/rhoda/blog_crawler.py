@@ -1,9 +1,21 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+from playwright.sync_api import TimeoutError
 from datetime import datetime
+from pathlib import Path
 import hashlib
 import time
 
+from common import budget, metrics
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.html_text import inner_text
+from common.http_fetch import fetch_via_http, selector_text
+from common.incremental import BLOG_REVALIDATE_DAYS, StoredPosts, card_fingerprint
+from common.rate_limit import throttle
+from common.waits import wait_ready
+
 RHODA_URL = "https://www.rhoda.ai"
+DATA_PATH = Path("data/rhoda/rhoda_blog.json")
 
 # Rhoda's "research" stream is currently sourced from the News page only.
 # The site keeps research behind a single hard-coded article (no /research
@@ -15,7 +27,7 @@ LIST_PAGES = [
 ]
 
 
-def blog_crawler():
+def blog_crawler(provider=None):
     """
     Rhoda News(/research) 카드를 수집하고, 내부 글(/news/<slug>)은 상세 페이지에
     재귀적으로 들어가 본문(content)까지 추출한다. 외부 기사(Bloomberg 등)는
@@ -30,15 +42,15 @@ def blog_crawler():
     """
     items = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("rhoda", provider) as browser:
         page = browser.new_page()
 
         # 1️⃣ 목록에서 카드 수집
         cards = []
         for section, url in LIST_PAGES:
+            throttle(url)
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+            wait_ready(page, "div.news-card", f"rhoda/{section}", timeout=30000, stable_ms=500)
 
             found = page.eval_on_selector_all(
                 "div.news-card",
@@ -76,38 +88,70 @@ def blog_crawler():
               f"({sum(_is_internal(c['href']) for c in parsed)} internal, "
               f"{sum(not _is_internal(c['href']) for c in parsed)} external)")
 
+        # 목록(카드)이 지난번과 같으면 본문 페이지를 열지 않고 종료 (main.run → "checked")
+        digest = ListDigest(DATA_PATH)
+        fingerprints = [card_fingerprint(c["href"], c["title"], c["category"], c["date_raw"])
+                        for c in parsed]
+        if digest.unchanged(fingerprints):
+            return None
+
         # 2️⃣ 내부 글은 상세 페이지에서 본문 추출, 외부는 발췌만
+        #     (카드가 그대로인 내부 글은 저장된 본문 재사용)
+        stored = StoredPosts(DATA_PATH, days=1 if digest.full else BLOG_REVALIDATE_DAYS)
+        checkpoint = Checkpoint(DATA_PATH)
+        failed = 0
         for idx, card in enumerate(parsed):
             title = card["title"]
             href = card["href"]
             internal = _is_internal(href)
             url = href if href.startswith("http") else f"{RHODA_URL}{href}"
+            date = _normalize_date(card["date_raw"])
 
-            content = ""
+            content = source = ""
             if internal:
-                print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
-                content = _extract_article_body(page, url)
-                if not content:
-                    print(f"[WARN] Empty body: {title}")
-                time.sleep(0.5)
+                done = checkpoint.get(href)
+                content = done["content"] if done else stored.content(href, title, date)
+                source = done.get("source", "") if done else stored.source(href)
+                if done:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Already fetched today: {title}")
+                elif content is not None:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Unchanged (stored body): {title}")
+                elif budget.out_of_time("rhoda/article"):
+                    # 예산 소진: 알던 글은 저장된 항목 그대로 (본문이 없어도) 이어가고, 처음 보는 글은 다음 run으로
+                    stored.carry_into(items, href)
+                    continue
+                else:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
+                    content, source = _extract_article_body(page, url)
+                    if not content:
+                        print(f"[WARN] Empty body: {title}")
+                        failed += 1
+                    else:
+                        checkpoint.add(href, {"content": content, "source": source})
             else:
                 print(f"[INFO] ({idx+1}/{len(parsed)}) External (no body): {title}")
 
             excerpt = card.get("excerpt", "") or (content[:280].strip() if content else "")
 
-            items.append({
+            item = {
                 "id": href,
                 "title": title,
-                "date": _normalize_date(card["date_raw"]),
+                "date": date,
                 "category": card["category"],
                 "type": _type_of(card["category"]),
                 "excerpt": excerpt,
                 "content": content,
                 "content_hash": _hash_text(content),
                 "url": url,
-            })
+            }
+            # plain HTTP로 받은 본문 표시 (브라우저 본문에는 source가 없음) — blog_compare 참고
+            if source:
+                item["source"] = source
+            items.append(item)
 
-        browser.close()
+        if not failed:
+            digest.save()
+        stored.report()
 
     return items
 
@@ -122,11 +166,22 @@ def _is_internal(href):
 
 
 def _extract_article_body(page, url, retries=3):
-    """상세 페이지 본문 추출. press 템플릿(.press-card/.press-copy/#about) 우선."""
+    """상세 페이지 본문 추출. press 템플릿(.press-card/.press-copy/#about) 우선.
+
+    (본문, source) — plain HTTP로 받았으면 source는 "http", 브라우저면 "".
+    """
+    # 서버 렌더링 페이지 — plain HTTP로 먼저, 본문이 안 잡힐 때만 브라우저
+    body = fetch_via_http(url, "rhoda/article", _article_text)
+    if body:
+        return body, "http"
+
+    start = time.monotonic()
     for attempt in range(retries):
         try:
+            throttle(url)
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+            wait_ready(page, ".press-card, .press-copy, #about, article", "rhoda/article",
+                       timeout=10000, min_text=30)
 
             body = page.evaluate(r"""
                 () => {
@@ -148,14 +203,32 @@ def _extract_article_body(page, url, retries=3):
             """)
 
             if body and len(body) >= 30:
-                return body
+                metrics.record("rhoda/article", "page", (time.monotonic() - start) * 1000,
+                               attempts=attempt + 1, url=url)
+                return body, ""
 
         except TimeoutError:
             print(f"[WARN] Attempt {attempt+1}/{retries} timeout for {url}")
         except Exception as e:
             print(f"[WARN] Attempt {attempt+1}/{retries} error: {e}")
 
-    return ""
+    metrics.record("rhoda/article", "page", (time.monotonic() - start) * 1000, ok=False,
+                   attempts=retries, url=url)
+    return "", ""
+
+
+def _article_text(soup):
+    """_extract_article_body의 브라우저 추출 로직을 정적 HTML에 그대로 적용."""
+    for sel in (".press-card", ".press-copy", "#about", "article"):
+        text = selector_text(soup, sel, min_text=30)
+        if text:
+            return text
+    main = soup.select_one("main")
+    if main is None:
+        return None
+    nav_words = {"Home", "Research", "News", "Team", "Careers", "Contact"}
+    body = "\n".join(l for l in inner_text(main).split("\n") if l.strip() not in nav_words).strip()
+    return body if len(body) >= 30 else None
 
 
 def _type_of(category):
@@ -183,8 +256,12 @@ def _hash_text(text):
 
 if __name__ == "__main__":
     data = blog_crawler()
-    print(f"\n[RESULT] Total {len(data)} posts:\n")
-    for item in data:
-        print(f"  - [{item['type']}] {item['title']} ({item['date']}) | src={item['category']}")
-        print(f"    URL: {item['url']}")
-        print(f"    body: {len(item['content'])} chars")
+    # 목록 digest가 같으면 crawler는 None (상세 crawl 생략) — CRAWL_FORCE_FULL=1이면 다시 받음
+    if data is None:
+        print("\n[RESULT] Blog list unchanged since last crawl (CRAWL_FORCE_FULL=1 to re-crawl)")
+    else:
+        print(f"\n[RESULT] Total {len(data)} posts:\n")
+        for item in data:
+            print(f"  - [{item['type']}] {item['title']} ({item['date']}) | src={item['category']}")
+            print(f"    URL: {item['url']}")
+            print(f"    body: {len(item['content'])} chars")
@@ -1,11 +1,12 @@
-import json
 from pathlib import Path
 from typing import List, Dict
 
+from common import snapshot_io
+
 DATA_PATH = Path("data/skild_ai/skild_blog.json")
 
 def blog_compare(curr_items):
-    if not DATA_PATH.exists():
+    if not snapshot_io.exists(DATA_PATH):
         _save(curr_items)
         return {
             "status": "initialized",
@@ -14,7 +15,7 @@ def blog_compare(curr_items):
             "updated": []
         }
 
-    prev_items = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    prev_items = snapshot_io.read_json(DATA_PATH)
 
     # Guard: an empty crawl is treated as a crawl failure, not a real wipe —
     # don't overwrite good data or report a false mass-removal.
@@ -64,8 +65,4 @@ def blog_compare(curr_items):
 
 
 def _save(items):
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    DATA_PATH.write_text(
-        json.dumps(items, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    snapshot_io.write_json(DATA_PATH, items)
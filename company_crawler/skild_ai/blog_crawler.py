@@ -1,8 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict
 
+from common.http_fetch import HTTP_TIMEOUT, session
+from common.rate_limit import throttle
+
 SKILD_URL = "https://www.skild.ai"
 
 def parse_date(raw: str) -> str:
@@ -21,7 +23,8 @@ def parse_date(raw: str) -> str:
 
 def blog_crawler():
     url = "https://www.skild.ai/blogs"
-    resp = requests.get(url)
+    throttle(url)
+    resp = session().get(url, timeout=HTTP_TIMEOUT)
     soup = BeautifulSoup(resp.text, "html.parser")
     blogs: List[Dict] = []
     featured = soup.select_one("div.featured-content")
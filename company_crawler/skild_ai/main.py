@@ -3,7 +3,11 @@ from skild_ai.blog_compare import blog_compare
 from skild_ai.position_crawler import position_crawler
 from skild_ai.position_compare import position_compare
 
-def run(purpose):
+from common.browser import BrowserProvider
+from common.digest import compare_or_checked
+
+
+def run(purpose, provider=None):
     # Crawl and Compare Researches
     if purpose == "blog" or purpose == "all":
         blogs = blog_crawler()
@@ -16,8 +20,8 @@ def run(purpose):
 
     # Crawl and Compare Positions
     if purpose == "career" or purpose == "all":
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
         if purpose == "career":
             return {
                 "company": "Skild AI",
@@ -31,4 +35,5 @@ def run(purpose):
     }
 
 if __name__ == "__main__":
-    print(run())
\ No newline at end of file
+    with BrowserProvider() as provider:
+        print(run("all", provider))
@@ -1,23 +1,73 @@
-from playwright.sync_api import sync_playwright, TimeoutError
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional
 import hashlib
-import time
 import re
 
+from common import budget
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.greenhouse import description_text, fetch_board
+from common.http_fetch import fetch_via_http, selector_text
+from common.incremental import REVALIDATE_DAYS, CardCache, card_fingerprint
+from common.page_pool import fetch_details
+from common.rate_limit import throttle
+from common.waits import wait_ready
+
 SKILD_CAREER_URL = "https://www.skild.ai/career"
-JOB_BOARD_URL = "https://job-boards.greenhouse.io/skildai-careers"
+GREENHOUSE_BOARD = "skildai-careers"
+JOB_BOARD_URL = f"https://job-boards.greenhouse.io/{GREENHOUSE_BOARD}"
+DATA_PATH = Path("data/skild_ai/skild_positions.json")
+
+
+def position_crawler(provider=None):
+    # 1순위: Greenhouse board API (전체 공고 + 본문을 한 번의 요청으로)
+    try:
+        return _crawl_api()
+    except Exception as e:
+        print(f"[WARN] Greenhouse API fetch failed ({e}); falling back to browser crawl")
+
+    return _crawl_browser(provider)
+
+
+def _crawl_api() -> List[Dict]:
+    positions: List[Dict] = []
+
+    for job in fetch_board(GREENHOUSE_BOARD):
+        title = (job.get("title") or "").strip()
+        location = ((job.get("location") or {}).get("name") or "").strip()
+        if not title:
+            continue
+
+        # 브라우저 경로와 같은 id 규칙 (title + "__" + location) — 이력 연속성 유지
+        description = description_text(job)
+        positions.append(
+            {
+                "id": normalize_id(title + "__" + location),
+                "title": title,
+                "location": location,
+                "compensation": "",
+                "description": description,
+                "description_hash": hash_text(description),
+                "url": f"{JOB_BOARD_URL}/jobs/{job['id']}",
+            }
+        )
+
+    print(f"[INFO] Fetched {len(positions)} positions from Greenhouse API")
+    return positions
 
 
-def position_crawler():
+def _crawl_browser(provider) -> Optional[List[Dict]]:
     positions: List[Dict] = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("skild_ai", provider) as browser:
         page = browser.new_page()
-        page.goto(JOB_BOARD_URL, timeout=30000)
-        page.wait_for_selector("div.job-posts")
+        throttle(JOB_BOARD_URL)
+        page.goto(JOB_BOARD_URL, wait_until="domcontentloaded", timeout=30000)
+        wait_ready(page, "div.job-posts", "skild/list", timeout=30000)
 
-        # 모든 부서 블록
+        # 모든 부서 블록에서 (상세 링크, location) 수집
+        jobs = []
         departments = page.query_selector_all(
             "div.job-posts--table--department"
         )
@@ -32,47 +82,105 @@ def position_crawler():
                 if not (location_el and href):
                     continue
 
-                location = location_el.inner_text().strip()
-
-                # === 상세 페이지 새 탭 열기 ===
-                detail_page = browser.new_page()
-                detail_page.goto(href, timeout=60_000)
-                detail_page.wait_for_selector("div.job__description")
-
-                # Get title from detail page (more accurate, excludes tags)
-                title_el = detail_page.query_selector("h1.section-header")
-                if not title_el:
-                    detail_page.close()
-                    continue
+                jobs.append({
+                    "href": href,
+                    "card": link.inner_text().strip(),
+                    "location": location_el.inner_text().strip(),
+                })
+
+        # 카드(링크 / 카드 텍스트 / location)가 그대로인 공고는 이전 레코드 재사용
+        fingerprints = [card_fingerprint(job["href"], job["card"], job["location"]) for job in jobs]
+        # 목록이 지난번과 같으면 (검증 기한 내) 상세 페이지를 하나도 열지 않음
+        digest = ListDigest(DATA_PATH)
+        if digest.unchanged(fingerprints):
+            return None
+        cache = CardCache(DATA_PATH, days=1 if digest.full else REVALIDATE_DAYS)
+        # 오늘 중단됐던 crawl의 재실행이면 이미 받은 공고는 체크포인트에서 이어받음
+        checkpoint = Checkpoint(DATA_PATH)
+        reused = [checkpoint.get(fp) or cache.reuse(fp) for fp in fingerprints]
+
+        # === Greenhouse 상세는 서버 렌더링: plain HTTP 먼저, 실패한 것만 탭 풀에서 로드 ===
+        pending = [job for job, prev in zip(jobs, reused) if prev is None]
+        details = {}
+        for job in pending:
+            if budget.out_of_time("skild/detail"):
+                break
+            detail = fetch_via_http(job["href"], "skild/detail", _read_detail_html)
+            if detail:
+                details[job["href"]] = detail
+
+        missing = [job for job in pending if job["href"] not in details]
+        if missing:
+            fetched = fetch_details(
+                browser,
+                missing,
+                url_of=lambda job: job["href"],
+                read=_read_detail,
+                ready="div.job__description",
+                site="skild/detail",
+            )
+            details.update((job["href"], d) for job, d in zip(missing, fetched))
+
+        failed = 0
+        for job, fp, prev in zip(jobs, fingerprints, reused):
+            if prev is not None:
+                positions.append(prev)
+                cache.remember(fp, prev)
+                continue
+
+            detail = details.get(job["href"])
+            # Get title from detail page (more accurate, excludes tags)
+            if not detail or not detail["title"]:
+                # 로드 실패 / 시간 예산 소진 → 알던 공고면 이전 레코드를 그대로 이어감 (삭제로 보지 않음)
+                failed += 1
+                cache.carry_into(positions, fp)
+                continue
+
+            title = detail["title"]
+            location = job["location"]
+            job_id = normalize_id(title + "__" + location)
+            description = detail["description"]
+
+            description_hash = hash_text(description)
+
+            position = {
+                "id": job_id,
+                "title": title,
+                "location": location,
+                "compensation": "",
+                "description": description,
+                "description_hash": description_hash,
+                "url": job["href"],
+            }
+            positions.append(position)
+            cache.remember(fp, position)
+            checkpoint.add(fp, position)
+
+        # 모든 카드가 상세까지 받아졌을 때만 digest 저장 (실패한 공고가 묻히지 않게)
+        if len(positions) == len(fingerprints) and not failed:
+            digest.save()
+        cache.save()
 
-                title = title_el.inner_text().strip()
-                job_id = normalize_id(title + "__" + location)
-
-                desc_el = detail_page.query_selector(
-                    "div.job__description"
-                )
-                description = desc_el.inner_text().strip()
-
-                description_hash = hash_text(description)
+    return positions
 
-                positions.append(
-                    {
-                        "id": job_id,
-                        "title": title,
-                        "location": location,
-                        "compensation": "",
-                        "description": description,
-                        "description_hash": description_hash,
-                        "url": href,
-                    }
-                )
+def _read_detail(page, job) -> Dict:
+    """Greenhouse 상세 페이지(이미 로드됨)에서 title / description 추출."""
+    title_el = page.query_selector("h1.section-header")
+    desc_el = page.query_selector("div.job__description")
+    return {
+        "title": title_el.inner_text().strip() if title_el else "",
+        "description": desc_el.inner_text().strip(),
+    }
 
-                detail_page.close()
-                time.sleep(0.3)  # polite delay
 
-        browser.close()
+def _read_detail_html(soup) -> Optional[Dict]:
+    """같은 추출을 정적 HTML에 — 제목이나 JD 본문이 비었으면 None (브라우저로)."""
+    title = selector_text(soup, "h1.section-header")
+    description = selector_text(soup, "div.job__description", min_text=50)
+    if not (title and description):
+        return None
+    return {"title": title, "description": description}
 
-    return positions
 
 def normalize_id(title: str) -> str:
     """
@@ -86,6 +194,10 @@ def hash_text(text: str) -> str:
 
 if __name__ == "__main__":
     data = position_crawler()
-    print(f"[INFO] Crawled {len(data)} positions")
-    for p in data[:3]:
-        print(p["title"], "->", p["location"])
\ No newline at end of file
+    # 목록 digest가 같으면 crawler는 None (상세 crawl 생략) — CRAWL_FORCE_FULL=1이면 다시 받음
+    if data is None:
+        print("\n[RESULT] Position list unchanged since last crawl (CRAWL_FORCE_FULL=1 to re-crawl)")
+    else:
+        print(f"[INFO] Crawled {len(data)} positions")
+        for p in data[:3]:
+            print(p["title"], "->", p["location"])
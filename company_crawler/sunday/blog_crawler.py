@@ -1,11 +1,23 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+from playwright.sync_api import TimeoutError
 from datetime import datetime
+from pathlib import Path
 import hashlib
-import re
 import time
+import re
+
+from common import budget, metrics
+from common.browser import open_browser
+from common.checkpoint import Checkpoint
+from common.digest import ListDigest
+from common.html_text import inner_text
+from common.http_fetch import fetch_via_http
+from common.incremental import BLOG_REVALIDATE_DAYS, StoredPosts, card_fingerprint
+from common.rate_limit import throttle
+from common.waits import wait_ready
 
 SUNDAY_URL = "https://www.sunday.ai"
 JOURNAL_URL = f"{SUNDAY_URL}/journal"
+DATA_PATH = Path("data/sunday/sunday_blog.json")
 
 # 카드 메타에서 무시할 CTA 텍스트
 _CTA_PREFIXES = ("Read article", "Read more")
@@ -13,7 +25,7 @@ _CTA_PREFIXES = ("Read article", "Read more")
 _DATE_RE = re.compile(r"^[A-Z][a-z]+\s+\d{1,2},\s+\d{4}$")
 
 
-def blog_crawler():
+def blog_crawler(provider=None):
     """
     Sunday 'Journal' 페이지를 크롤링한다.
 
@@ -23,11 +35,11 @@ def blog_crawler():
     """
     items = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with open_browser("sunday", provider) as browser:
         page = browser.new_page()
+        throttle(JOURNAL_URL)
         page.goto(JOURNAL_URL, wait_until="domcontentloaded", timeout=60000)
-        page.wait_for_timeout(3000)
+        wait_ready(page, "article", "sunday/journal", timeout=30000, stable_ms=500)
 
         # 1️⃣ 저널 카드 목록 수집 (내부 글 + 외부 Stories)
         cards = page.eval_on_selector_all(
@@ -73,36 +85,67 @@ def blog_crawler():
               f"({sum(c['is_internal'] for c in parsed)} internal, "
               f"{sum(not c['is_internal'] for c in parsed)} external)")
 
-        # 2️⃣ 내부 글은 상세 페이지에서 본문 추출
+        # 목록(카드)이 지난번과 같으면 본문 페이지를 열지 않고 종료 (main.run → "checked")
+        digest = ListDigest(DATA_PATH)
+        fingerprints = [card_fingerprint(c["href"], c["title"], c["category"], c["date_raw"])
+                        for c in parsed]
+        if digest.unchanged(fingerprints):
+            return None
+
+        # 2️⃣ 내부 글은 상세 페이지에서 본문 추출 (카드가 그대로인 글은 저장된 본문 재사용)
+        stored = StoredPosts(DATA_PATH, days=1 if digest.full else BLOG_REVALIDATE_DAYS)
+        checkpoint = Checkpoint(DATA_PATH)
+        failed = 0
         for idx, card in enumerate(parsed):
             title = card["title"]
             category = card["category"]
-            content = ""
+            date = _normalize_date(card["date_raw"])
+            content = source = ""
 
             if card["is_internal"]:
-                print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
-                content = _extract_article_body(page, card["url"])
-                if not content:
-                    print(f"[WARN] Empty body: {title}")
-                time.sleep(0.5)
+                done = checkpoint.get(card["href"])
+                content = done["content"] if done else stored.content(card["href"], title, date)
+                source = done.get("source", "") if done else stored.source(card["href"])
+                if done:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Already fetched today: {title}")
+                elif content is not None:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Unchanged (stored body): {title}")
+                elif budget.out_of_time("sunday/article"):
+                    # 예산 소진: 알던 글은 저장된 항목 그대로 (본문이 없어도) 이어가고, 처음 보는 글은 다음 run으로
+                    stored.carry_into(items, card["href"])
+                    continue
+                else:
+                    print(f"[INFO] ({idx+1}/{len(parsed)}) Fetching body: {title}")
+                    content, source = _extract_article_body(page, card["url"])
+                    if not content:
+                        print(f"[WARN] Empty body: {title}")
+                        failed += 1
+                    else:
+                        checkpoint.add(card["href"], {"content": content, "source": source})
             else:
                 print(f"[INFO] ({idx+1}/{len(parsed)}) External story (no body): {title}")
 
             excerpt = content[:280].strip() if content else ""
 
-            items.append({
+            item = {
                 "id": card["href"],
                 "title": title,
-                "date": _normalize_date(card["date_raw"]),
+                "date": date,
                 "category": category,
                 "type": _type_of(category),
                 "excerpt": excerpt,
                 "content": content,
                 "content_hash": _hash_text(content),
                 "url": card["url"],
-            })
+            }
+            # plain HTTP로 받은 본문 표시 (브라우저 본문에는 source가 없음) — blog_compare 참고
+            if source:
+                item["source"] = source
+            items.append(item)
 
-        browser.close()
+        if not failed:
+            digest.save()
+        stored.report()
 
     return items
 
@@ -111,11 +154,18 @@ def _extract_article_body(page, url, retries=3):
     """저널 상세 페이지에서 본문 컨테이너(p.body-1의 부모)의 텍스트를 추출.
 
     하단 'Related articles' / 'Recent entries' 캐러셀과 헤더/푸터는 제외된다.
+    (본문, source) — plain HTTP로 받았으면 source는 "http", 브라우저면 "".
     """
+    body = fetch_via_http(url, "sunday/article", _article_text)
+    if body:
+        return body, "http"
+
+    start = time.monotonic()
     for attempt in range(retries):
         try:
+            throttle(url)
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(3000)
+            wait_ready(page, ".body-1", "sunday/article", timeout=10000)
 
             body = page.evaluate("""
                 () => {
@@ -130,14 +180,27 @@ def _extract_article_body(page, url, retries=3):
             """)
 
             if body and len(body) >= 50:
-                return body
+                metrics.record("sunday/article", "page", (time.monotonic() - start) * 1000,
+                               attempts=attempt + 1, url=url)
+                return body, ""
 
         except TimeoutError:
             print(f"[WARN] Attempt {attempt+1}/{retries} timeout for {url}")
         except Exception as e:
             print(f"[WARN] Attempt {attempt+1}/{retries} error: {e}")
 
-    return ""
+    metrics.record("sunday/article", "page", (time.monotonic() - start) * 1000, ok=False,
+                   attempts=retries, url=url)
+    return "", ""
+
+
+def _article_text(soup):
+    """정적 HTML에서 p.body-1 부모의 텍스트 — 없거나 짧으면 None (브라우저로)."""
+    first_body = soup.select_one(".body-1")
+    if first_body is None or first_body.parent is None:
+        return None
+    body = inner_text(first_body.parent).strip()
+    return body if len(body) >= 50 else None
 
 
 def _parse_meta(lines):
@@ -182,9 +245,13 @@ def _hash_text(text):
 
 if __name__ == "__main__":
     data = blog_crawler()
-    print(f"\n[RESULT] Total {len(data)} journal items:\n")
-    for item in data:
-        print(f"  - [{item['type']}] {item['title']} ({item['date']})")
-        print(f"    URL: {item['url']}")
-        print(f"    body: {len(item['content'])} chars")
-        print()
+    # 목록 digest가 같으면 crawler는 None (상세 crawl 생략) — CRAWL_FORCE_FULL=1이면 다시 받음
+    if data is None:
+        print("\n[RESULT] Journal list unchanged since last crawl (CRAWL_FORCE_FULL=1 to re-crawl)")
+    else:
+        print(f"\n[RESULT] Total {len(data)} journal items:\n")
+        for item in data:
+            print(f"  - [{item['type']}] {item['title']} ({item['date']})")
+            print(f"    URL: {item['url']}")
+            print(f"    body: {len(item['content'])} chars")
+            print()
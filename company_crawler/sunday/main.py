@@ -3,14 +3,18 @@ from sunday.blog_compare import blog_compare
 from sunday.position_crawler import position_crawler
 from sunday.position_compare import position_compare
 
+from common.browser import BrowserProvider
+from common.digest import compare_or_checked
 
-def run(purpose):
+
+
+def run(purpose, provider=None):
     if purpose == "all":
-        blogs = blog_crawler()
-        research_result = blog_compare(blogs)
+        blogs = blog_crawler(provider)
+        research_result = compare_or_checked(blogs, blog_compare)
 
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
 
         return {
             "company": "Sunday Robotics",
@@ -19,8 +23,8 @@ def run(purpose):
         }
 
     if purpose == "blog":
-        blogs = blog_crawler()
-        research_result = blog_compare(blogs)
+        blogs = blog_crawler(provider)
+        research_result = compare_or_checked(blogs, blog_compare)
 
         return {
             "company": "Sunday Robotics",
@@ -28,8 +32,8 @@ def run(purpose):
         }
 
     if purpose == "career":
-        positions = position_crawler()
-        position_result = position_compare(positions)
+        positions = position_crawler(provider)
+        position_result = compare_or_checked(positions, position_compare)
 
         return {
             "company": "Sunday Robotics",
@@ -38,4 +42,5 @@ def run(purpose):
 
 
 if __name__ == "__main__":
-    print(run("all"))
+    with BrowserProvider() as provider:
+        print(run("all", provider))
@@ -1,7 +1,8 @@
-import json
 import hashlib
 from pathlib import Path
 
+from common import event_log, snapshot_io
+
 DATA_PATH = Path("data/sunday/sunday_positions.json")
 
 
@@ -11,7 +12,7 @@ def position_compare(curr_positions):
         pos["description_hash"] = _hash_text(pos.get("description", ""))
 
     # 최초 실행
-    if not DATA_PATH.exists():
+    if not snapshot_io.exists(DATA_PATH):
         _save(curr_positions)
         return {
             "status": "initialized",
@@ -21,7 +22,7 @@ def position_compare(curr_positions):
         }
 
     # 이전 데이터 로드
-    prev_positions = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    prev_positions = snapshot_io.read_json(DATA_PATH)
 
     # Guard: a completely empty crawl almost always means the crawler broke
     # (selector/site change, network) — not that every posting truly vanished.
@@ -56,6 +57,7 @@ def position_compare(curr_positions):
     if not added and not removed and not updated:
         return {"status": "checked"}
 
+    event_log.record_compare(DATA_PATH, prev_map, curr_map)
     _save(curr_positions)
     return {
         "status": "updated",
@@ -66,11 +68,7 @@ def position_compare(curr_positions):
 
 
 def _save(positions):
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    DATA_PATH.write_text(
-        json.dumps(positions, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    snapshot_io.write_json(DATA_PATH, positions)
 
 
 def _hash_text(text):
@@ -3,10 +3,11 @@ Unified comparison utilities for snapshot data.
 Used by both daily crawler (yesterday vs today) and /analyze command (date A vs date B).
 """
 
-import json
 import hashlib
 from pathlib import Path
 
+import snapshot_store
+
 
 def compare_positions(prev_data, curr_data):
     """
@@ -101,11 +102,11 @@ def compare_blogs(prev_data, curr_data):
 
 
 def load_snapshot(file_path):
-    """Load a JSON snapshot file."""
+    """Load a JSON snapshot file (blob manifests are rehydrated, see snapshot_store)."""
     path = Path(file_path)
-    if not path.exists():
+    if not snapshot_store.exists(path):
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return snapshot_store.read(path)
 
 
 def _hash_text(text):
@@ -7,7 +7,10 @@ Automatically runs the crawler and sends formatted results to Slack
 import sys
 import json
 import os
-import shutil
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
 from datetime import datetime
 from io import StringIO
 import requests
@@ -16,6 +19,8 @@ from dotenv import load_dotenv
 from slack_sdk import WebClient
 
 from claude_cli import run_claude
+import history_db
+from snapshot_store import exists as snapshot_exists, write_snapshot
 
 load_dotenv()
 
@@ -29,6 +34,9 @@ from generalist_ai.main import run as run_generalist
 from sunday.main import run as run_sunday
 from genesis.main import run as run_genesis
 from rhoda.main import run as run_rhoda
+from common import budget, event_log, http_fetch, metrics, rate_limit, snapshot_io
+from common.browser import BrowserProvider
+from common.checkpoint import discard as discard_checkpoints
 
 COMPANIES = {
     "physical_intelligence": ("Physical Intelligence", run_pi, "pi"),
@@ -86,35 +94,131 @@ DATA_FILES = {
 
 
 def save_daily_snapshots():
-    """Copy each latest data file to a date-prefixed snapshot."""
+    """Save each latest data file as a date-prefixed snapshot.
+
+    The snapshot is a manifest whose JD / post bodies point into the company's
+    content-addressed blob store (snapshot_store.py), so unchanged bodies are
+    not stored again every day. With SNAPSHOT_MODE=delta most days are stored
+    as a delta against the previous snapshot instead. Each new positions
+    snapshot also closes the day in the company's event log (common/event_log.py),
+    and the positions history is brought up to date in the SQLite history DB
+    (history_db.py).
+    """
     date_str = datetime.now().strftime("%Y%m%d")
 
     for company_key, file_paths in DATA_FILES.items():
         for file_path in file_paths:
             src = Path(file_path)
-            if not src.exists():
+            if not snapshot_io.exists(src):
                 continue
 
             snapshot_name = f"{date_str}_{src.name}"
             snapshot_path = src.parent / snapshot_name
 
-            if snapshot_path.exists():
+            if snapshot_exists(snapshot_path):
                 print(f"[INFO] Snapshot already exists: {snapshot_path}")
                 continue
 
-            shutil.copy2(str(src), str(snapshot_path))
+            records = snapshot_io.read_json(src)
+            write_snapshot(records, snapshot_path)
             print(f"[INFO] Saved snapshot: {snapshot_path}")
+            if src.name.endswith("_positions.json"):
+                # 이벤트 로그의 하루 마감 표시 (analysis_engine이 로그를 믿어도 되는 구간)
+                event_log.record_snapshot(src.parent, date_str, records)
 
+        history_db.record_snapshot(company_key)
 
-def crawl_all_companies(purpose="all"):
-    """Run crawler for all companies"""
-    results = []
 
+def _run_company(key, purpose, provider=None, budget_s=budget.COMPANY_BUDGET):
+    """Crawl one company and return its result dict (or an error entry).
+
+    Module-level so it can be shipped to a ProcessPoolExecutor worker. A worker
+    gets no provider and starts its own Chromium (shared by that company's
+    blog + position crawls); sequential runs pass the one run-wide provider.
+
+    `budget_s` caps the company's wall-clock crawl time: past it the crawlers
+    stop opening detail pages, carry the rest over from the last snapshot and
+    the result is flagged `partial`. Only a complete crawl drops the day's
+    checkpoints; after a crash or a partial crawl a rerun resumes from them.
+    The run's total time is logged as a "company" event (common/metrics.py).
+    """
+    name, runner, _ = COMPANIES[key]
+    own = provider is None
+    if own:
+        provider = BrowserProvider(profile=key)
+    budget.start(budget_s)
+    metrics.set_company(key)
+    start = time.monotonic()
+    ok = False
+    try:
+        result = runner(purpose, provider)
+        ok = True
+        if budget.partial():
+            result["partial"] = True
+            print(f"[WARN] {name} completed partially (time budget of {budget_s}s exhausted)")
+        else:
+            discard_checkpoints(Path("data") / key)
+            print(f"[INFO] {name} completed")
+        return result
+    except Exception as e:
+        print(f"[ERROR] {name} failed: {e}")
+        return {"company": name, "error": str(e)}
+    finally:
+        metrics.record(key, "company", (time.monotonic() - start) * 1000, ok=ok,
+                       partial=budget.partial(), purpose=purpose)
+        http_fetch.report()
+        if own:
+            provider.close()
+
+
+def crawl_all_companies(purpose="all", max_workers=1, budget_s=budget.COMPANY_BUDGET):
+    """Run crawler for all companies.
+
+    max_workers > 1 crawls companies concurrently in a bounded process pool;
+    the workers share one set of per-host rate-limit buckets, so hosts used by
+    several companies (jobs.ashbyhq.com) are throttled across all of them.
+    Results always come back in COMPANIES order, and the (Claude) position
+    analysis still runs afterwards in this process, one company at a time.
+    Each company gets `budget_s` seconds of crawling (0 = unlimited).
+    """
+    keys = list(COMPANIES)
+    crawled = {}
+
+    if max_workers > 1:
+        workers = min(max_workers, len(keys))
+        print(f"\n[INFO] Crawling {len(keys)} companies with {workers} parallel workers...")
+        with Manager() as manager:
+            limits = rate_limit.shared_state(manager)
+            rate_limit.install(limits)
+            with ProcessPoolExecutor(max_workers=workers, initializer=rate_limit.install,
+                                     initargs=(limits,)) as pool:
+                futures = {key: pool.submit(_run_company, key, purpose, None, budget_s) for key in keys}
+                for key, future in futures.items():
+                    try:
+                        crawled[key] = future.result()
+                    except Exception as e:
+                        # The worker process itself died (e.g. Chromium OOM-killed it).
+                        name = COMPANIES[key][0]
+                        print(f"[ERROR] {name} failed: {e}")
+                        crawled[key] = {"company": name, "error": str(e)}
+            rate_limit.report()
+            rate_limit.install()
+    else:
+        # One Chromium for the whole run; each crawl gets a fresh context on it.
+        with BrowserProvider() as provider:
+            for key in keys:
+                print(f"\n[INFO] Crawling {COMPANIES[key][0]}...")
+                crawled[key] = _run_company(key, purpose, provider, budget_s)
+            print(f"[INFO] Chromium launched {provider.launches} time(s) for {len(keys)} companies")
+        rate_limit.report()
+
+    results = []
     for key, (name, runner, file_prefix) in COMPANIES.items():
-        print(f"\n[INFO] Crawling {name}...")
+        result = crawled[key]
+        if result and "error" in result:
+            results.append(result)
+            continue
         try:
-            result = runner(purpose)
-
             # Analyze position changes if there are updates
             position_data = result.get("position", {})
             if position_data and position_data.get("status") == "updated":
@@ -132,7 +236,6 @@ def crawl_all_companies(purpose="all"):
                     print(f"[WARN] AI analysis unavailable for {name}; report will note the failure")
 
             results.append(result)
-            print(f"[INFO] {name} completed")
         except Exception as e:
             print(f"[ERROR] {name} failed: {e}")
             results.append({"company": name, "error": str(e)})
@@ -161,12 +264,11 @@ def analyze_position_changes(company_name, company_key, file_prefix, position_da
 
     # Read full position data
     data_file = Path(f"data/{company_key}/{file_prefix}_positions.json")
-    if not data_file.exists():
+    if not snapshot_io.exists(data_file):
         return None
 
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            full_positions = json.load(f)
+        full_positions = snapshot_io.read_json(data_file)
     except Exception as e:
         print(f"[ERROR] Failed to read position data for {company_name}: {e}")
         return None
@@ -408,6 +510,10 @@ def format_slack_message(results):
                 has_updates = True
             company_text += _render_section(_label("Career", links.get("career")), pos_data)
 
+        if result.get("partial"):
+            company_text += ("⏳ *Partial:* 크롤 시간 예산 초과 — 확인하지 못한 항목은 "
+                             "이전 스냅샷 그대로 유지했습니다.\n")
+
         # Split into multiple blocks if it exceeds Slack's 3000-char per-block
         # limit (e.g. a brand-new company whose whole list lands in "Added").
         for chunk in _chunk_mrkdwn(company_text):
@@ -522,6 +628,18 @@ def send_slack_notification_webhook(results):
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Daily company crawler")
+    parser.add_argument("--max-workers", type=int, default=1,
+                        help="companies to crawl concurrently (1 = sequential)")
+    parser.add_argument("--budget", type=int, default=budget.COMPANY_BUDGET,
+                        help="per-company crawl time budget in seconds (0 = unlimited)")
+    parser.add_argument("--force-full", action="store_true",
+                        help="ignore unchanged list digests and re-fetch every detail page")
+    args = parser.parse_args()
+
+    # 병렬 모드의 worker 프로세스도 환경변수로 물려받음 (common/digest.py)
+    if args.force_full:
+        os.environ["CRAWL_FORCE_FULL"] = "1"
 
     # Check if running in test mode
     test_mode = os.environ.get('TEST_MODE', '').lower() in ['true', '1', 'yes']
@@ -532,7 +650,7 @@ def main():
     print("=" * 60)
 
     # Run crawler
-    results = crawl_all_companies(purpose="all")
+    results = crawl_all_companies(purpose="all", max_workers=args.max_workers, budget_s=args.budget)
 
     # Save daily snapshots
     print("\n" + "=" * 60)
@@ -551,6 +669,8 @@ def main():
             print(f"\n[{company}]")
             if "error" in result:
                 print(f"  ❌ Error: {result['error']}")
+            elif result.get("partial"):
+                print("  ⏳ Partial (time budget exhausted)")
             else:
                 print(f"  ✅ Success")
 
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+history_db.py — SQLite index over the positions snapshot history.
+
+history_engine / slack_bot used to answer every question ("which DYNA roles
+were closed", "what changed between two dates", "the full JD of a role that
+is gone") by loading and diffing every dated snapshot in the window. The same
+history is now also kept in one local SQLite file (data/history.db):
+
+    snapshots  (company, date, positions)          one row per ingested day
+    positions  (company, id, description_hash, description)
+               one row per distinct JD, the body stored once
+    intervals  (company, id, description_hash, title, location, record,
+                pos, first_seen, last_seen)
+               consecutive snapshots in which the posting was unchanged;
+               `record` is the snapshot record minus its description, `pos`
+               its index in the first_seen snapshot (list order ties)
+
+An id that disappears, or whose JD / other fields change, ends its interval;
+a reappearance / new version starts a new one. "Open on date D" is then an
+interval with first_seen <= D <= last_seen, which the (company, first_seen)
+/ (company, last_seen) indexes answer without touching any JSON.
+
+The snapshots stay the source of truth and the DB is derived from them:
+`save_daily_snapshots()` records each new positions snapshot, and every query
+first ingests snapshot days newer than the DB (so the bot's checkout catches
+up after a `git pull` by itself). When the DB and the snapshot dates disagree
+any other way — a day backfilled or deleted, a company's history reset —
+the query functions return None, the engines fall back to the
+snapshot walk, and `rebuild` re-derives the company from its snapshots.
+HISTORY_DB moves the file; HISTORY_DB= (empty) turns the DB off.
+
+    .venv/bin/python history_db.py rebuild [company]
+    .venv/bin/python history_db.py deleted <company> [start YYYYMMDD] [end YYYYMMDD]
+    .venv/bin/python history_db.py state <company> <YYYYMMDD>
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import snapshot_store
+from analysis_engine import COMPANIES, resolve_company
+from compare_utils import _hash_text, compare_positions
+
+BASE_DIR = Path(__file__).resolve().parent
+
+HISTORY_DB = os.environ.get("HISTORY_DB", str(BASE_DIR / "data" / "history.db"))
+
+# 스키마가 바뀌면 올림 — 예전 버전의 DB는 비우고 스냅샷에서 다시 채운다
+SCHEMA_VERSION = 2
+_TABLES = ("snapshots", "positions", "intervals")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    company    TEXT NOT NULL,
+    date       TEXT NOT NULL,
+    positions  INTEGER NOT NULL,
+    PRIMARY KEY (company, date)
+);
+CREATE TABLE IF NOT EXISTS positions (
+    company           TEXT NOT NULL,
+    id                TEXT NOT NULL,
+    description_hash  TEXT NOT NULL,
+    description       TEXT,
+    PRIMARY KEY (company, id, description_hash)
+);
+CREATE TABLE IF NOT EXISTS intervals (
+    company           TEXT NOT NULL,
+    id                TEXT NOT NULL,
+    description_hash  TEXT NOT NULL,
+    title             TEXT NOT NULL DEFAULT '',
+    location          TEXT NOT NULL DEFAULT '',
+    record            TEXT NOT NULL,
+    pos               INTEGER NOT NULL DEFAULT 0,
+    first_seen        TEXT NOT NULL,
+    last_seen         TEXT NOT NULL,
+    PRIMARY KEY (company, id, first_seen)
+);
+CREATE INDEX IF NOT EXISTS intervals_first_seen ON intervals (company, first_seen);
+CREATE INDEX IF NOT EXISTS intervals_last_seen ON intervals (company, last_seen);
+"""
+
+# 이력이 스냅샷과 어긋난 회사는 한 번만 경고
+_warned = set()
+
+
+def company_key(company):
+    """DB의 company 컬럼 = 데이터 디렉터리 이름 (data/dyna -> "dyna")."""
+    return Path(company["data_dir"]).name
+
+
+def _open():
+    conn = sqlite3.connect(HISTORY_DB, timeout=30, isolation_level=None)
+    try:
+        # 봇(읽기)과 데일리 크롤러(쓰기)가 동시에 열어도 막히지 않게
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript("".join(f"DROP TABLE IF EXISTS {t};" for t in _TABLES)
+                               + _SCHEMA + f"PRAGMA user_version = {SCHEMA_VERSION};")
+        conn.executescript(_SCHEMA)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+@contextmanager
+def _connect():
+    conn = _open()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+# ==========================================
+# Ingest
+# ==========================================
+
+def _ingest(conn, key, date, records, prev_date):
+    """One snapshot day -> store new JD bodies, extend / open intervals."""
+    latest = {}
+    first_pos = {}  # id -> 스냅샷에서 처음 나온 위치 (history_engine의 meta 순서)
+    for idx, r in enumerate(records):
+        if isinstance(r, dict) and r.get("id") is not None:
+            latest[r["id"]] = r  # 중복 id는 compare_positions처럼 마지막 레코드
+            first_pos.setdefault(r["id"], idx)
+
+    for pid, r in latest.items():
+        h = r.get("description_hash") or _hash_text(r.get("description") or "")
+        conn.execute(
+            "INSERT INTO positions (company, id, description_hash, description) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (company, id, description_hash) DO NOTHING",
+            (key, pid, h, r.get("description")),
+        )
+        # 본문은 positions에 한 번만 — 레코드에는 자리(None)만 남겨 키 순서 유지
+        fields = dict(r)
+        if "description" in fields:
+            fields["description"] = None
+        record = json.dumps(fields, ensure_ascii=False)
+        extended = conn.execute(
+            "UPDATE intervals SET last_seen = ? WHERE company = ? AND id = ? "
+            "AND description_hash = ? AND record = ? AND last_seen = ?",
+            (date, key, pid, h, record, prev_date),
+        ).rowcount
+        if not extended:
+            conn.execute(
+                "INSERT INTO intervals (company, id, description_hash, title, location, record, "
+                "pos, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, pid, h, r.get("title") or "", r.get("location") or "", record,
+                 first_pos[pid], date, date),
+            )
+
+    conn.execute("INSERT INTO snapshots (company, date, positions) VALUES (?, ?, ?)",
+                 (key, date, len(latest)))
+
+
+def _ingested_dates(conn, key):
+    return [d for (d,) in conn.execute(
+        "SELECT date FROM snapshots WHERE company = ? ORDER BY date", (key,))]
+
+
+def _sync(conn, company):
+    """Ingest snapshot days newer than the DB. False when the DB can't be brought in line."""
+    key = company_key(company)
+    snap_dates = snapshot_store.list_dates(company["data_dir"], company["prefix"], "positions")
+    have = _ingested_dates(conn, key)
+    if have == snap_dates:
+        return True
+    if have != snap_dates[:len(have)]:
+        if key not in _warned:
+            _warned.add(key)
+            print(f"[WARN] history DB for {key} is out of sync with its snapshots; "
+                  f"run `history_db.py rebuild {key}`")
+        return False
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 다른 프로세스가 그 사이 먼저 넣었을 수 있음
+        have = _ingested_dates(conn, key)
+        prev = have[-1] if have else None
+        for d in snap_dates[len(have):]:
+            records = snapshot_store.read(
+                Path(company["data_dir"]) / f"{d}_{company['prefix']}_positions.json")
+            _ingest(conn, key, d, records or [], prev)
+            prev = d
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return True
+
+
+def record_snapshot(key):
+    """Bring a company's DB history up to its latest positions snapshot (daily pipeline)."""
+    if not HISTORY_DB or key not in COMPANIES:
+        return False
+    try:
+        with _connect() as conn:
+            return _sync(conn, COMPANIES[key])
+    except sqlite3.Error as e:
+        print(f"[WARN] history DB update failed for {key}: {e}")
+        return False
+
+
+def rebuild(company):
+    """Drop the company's rows and re-derive them from every positions snapshot."""
+    key = company_key(company)
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE company = ?", (key,))
+        conn.execute("COMMIT")
+        _warned.discard(key)
+        _sync(conn, company)
+        return len(_ingested_dates(conn, key))
+
+
+# ==========================================
+# Queries (None = DB unavailable / out of sync → caller walks the snapshots)
+# ==========================================
+
+@contextmanager
+def _synced(company):
+    """Yield a connection whose history matches the snapshots, or None."""
+    conn, ok = None, False
+    if HISTORY_DB:
+        try:
+            conn = _open()
+            ok = _sync(conn, company)
+        except sqlite3.Error as e:
+            print(f"[WARN] history DB unavailable ({e}); reading snapshots instead")
+    try:
+        yield conn if ok else None
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def _window(conn, key, start=None, end=None):
+    """(first, last) ingested snapshot date inside [start, end], or (None, None)."""
+    return conn.execute(
+        "SELECT MIN(date), MAX(date) FROM snapshots "
+        "WHERE company = ? AND date >= ? AND date <= ?",
+        (key, start or "", end or "99999999"),
+    ).fetchone()
+
+
+_RECORDS = ("SELECT i.record, p.description "
+            "FROM intervals i JOIN positions p USING (company, id, description_hash) ")
+
+
+def _record(row):
+    """(record without body, description) -> the snapshot record."""
+    record = json.loads(row[0])
+    if "description" in record:
+        record["description"] = row[1]
+    return record
+
+
+def _state(conn, key, date):
+    return [_record(row) for row in conn.execute(
+        _RECORDS + "WHERE i.company = ? AND i.first_seen <= ? AND i.last_seen >= ? "
+        "ORDER BY i.first_seen, i.id",
+        (key, date, date))]
+
+
+def state_on(company, date):
+    """Positions open as of `date` (latest snapshot on or before it): (snapshot_date, records)."""
+    with _synced(company) as conn:
+        if conn is None:
+            return None
+        key = company_key(company)
+        _, day = _window(conn, key, end=date)
+        if day is None:
+            return None, []
+        return day, _state(conn, key, day)
+
+
+def deleted_positions(company, start=None, end=None):
+    """history_engine.deleted_positions() from the intervals table."""
+    with _synced(company) as conn:
+        if conn is None:
+            return None
+        key = company_key(company)
+        first, last = _window(conn, key, start, end)
+        if first is None:
+            return []
+
+        rows = conn.execute(
+            "SELECT id, title, location, first_seen, pos, MIN(last_seen, :last) "
+            "FROM intervals "
+            "WHERE company = :key AND first_seen <= :last AND last_seen >= :first "
+            "AND id NOT IN (SELECT id FROM intervals WHERE company = :key "
+            "               AND first_seen <= :last AND last_seen >= :last) "
+            "ORDER BY first_seen",
+            {"key": key, "first": first, "last": last},
+        ).fetchall()
+
+    meta = {}
+    order = {}  # id -> (창 안에서 처음 보인 날, 그 스냅샷에서의 위치)
+    for pid, title, location, first_seen, pos, last_seen in rows:
+        m = meta.get(pid)
+        if m is None:
+            meta[pid] = {"id": pid, "title": title, "location": location,
+                         "first_seen": max(first_seen, first), "last_seen": last_seen}
+            order[pid] = (first_seen, pos) if first_seen >= first else None
+        elif last_seen > m["last_seen"]:
+            m.update(title=title, location=location, last_seen=last_seen)
+
+    # 창 시작 전부터 열려 있던 공고는 시작일 스냅샷에서의 위치 (잘린 구간이 있을 때만 읽음)
+    if any(o is None for o in order.values()):
+        records = snapshot_store.read(
+            Path(company["data_dir"]) / f"{first}_{company['prefix']}_positions.json")
+        start_pos = {}
+        for idx, r in enumerate(records or []):
+            if isinstance(r, dict):
+                start_pos.setdefault(r.get("id"), idx)
+        for pid, o in order.items():
+            if o is None:
+                order[pid] = (first, start_pos.get(pid, 0))
+
+    # history_engine과 같은 순서: 처음 나온 순서 → title asc → last_seen desc (stable)
+    deleted = sorted(meta.values(), key=lambda m: order[m["id"]])
+    deleted.sort(key=lambda m: m["title"])
+    deleted.sort(key=lambda m: m["last_seen"], reverse=True)
+    return deleted
+
+
+def get_position_record(company, position_id, start=None, end=None):
+    """history_engine.get_position_record() from the intervals table."""
+    with _synced(company) as conn:
+        if conn is None:
+            return None
+        key = company_key(company)
+        first, last = _window(conn, key, start, end)
+        if first is None:
+            return None, None
+        row = conn.execute(
+            "SELECT i.record, p.description, MIN(i.last_seen, ?) "
+            "FROM intervals i JOIN positions p USING (company, id, description_hash) "
+            "WHERE i.company = ? AND i.id = ? AND i.first_seen <= ? AND i.last_seen >= ? "
+            "ORDER BY i.last_seen DESC LIMIT 1",
+            (last, key, position_id, last, first),
+        ).fetchone()
+    if row is None:
+        return None, None
+    return _record(row), row[2]
+
+
+def compare(company, start_date, end_date):
+    """compare_positions() of two snapshot days, reading only the positions that differ.
+
+    A posting whose interval spans both days is unchanged by definition, so
+    only intervals that end before `end_date` or begin after `start_date` are
+    loaded and handed to compare_positions. None unless both days are ingested.
+    """
+    with _synced(company) as conn:
+        if conn is None:
+            return None
+        key = company_key(company)
+        have = {d for (d,) in conn.execute(
+            "SELECT date FROM snapshots WHERE company = ? AND date IN (?, ?)",
+            (key, start_date, end_date))}
+        if have != {start_date, end_date}:
+            return None
+        query = _RECORDS + "WHERE i.company = ? AND i.first_seen <= ? AND i.last_seen >= ? AND {}"
+        prev = [_record(row) for row in conn.execute(
+            query.format("i.last_seen < ?"), (key, start_date, start_date, end_date))]
+        curr = [_record(row) for row in conn.execute(
+            query.format("i.first_seen > ?"), (key, end_date, end_date, start_date))]
+    return compare_positions(prev, curr)
+
+
+# ==========================================
+# CLI
+# ==========================================
+
+def _main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ("rebuild", "deleted", "state"):
+        print("usage: history_db.py rebuild [company]")
+        print("       history_db.py deleted <company> [start YYYYMMDD] [end YYYYMMDD]")
+        print("       history_db.py state <company> <YYYYMMDD>")
+        return
+    if not HISTORY_DB:
+        print("[ERROR] HISTORY_DB is empty (history DB disabled)")
+        return
+
+    command, rest = args[0], args[1:]
+    if command == "rebuild":
+        keys = [resolve_company(t) for t in rest] or list(COMPANIES)
+        for token, key in zip(rest or keys, keys):
+            if not key:
+                print(f"[WARN] unknown company: {token}")
+                continue
+            started = time.monotonic()
+            days = rebuild(COMPANIES[key])
+            print(f"[INFO] {key}: {days} snapshot(s) -> {HISTORY_DB} "
+                  f"({time.monotonic() - started:.1f}s)")
+        return
+
+    key = resolve_company(rest[0]) if rest else None
+    if not key:
+        print(f"unknown company: {rest[0] if rest else ''}")
+        return
+    company = COMPANIES[key]
+    started = time.monotonic()
+    if command == "deleted":
+        items = deleted_positions(company, *rest[1:3])
+        elapsed = (time.monotonic() - started) * 1000
+        if items is None:
+            print("[WARN] history DB out of sync — run rebuild")
+            return
+        print(f"== {company['name']} — deleted positions: {len(items)} ({elapsed:.1f} ms) ==")
+        for m in items:
+            print(f"  {m['last_seen']}  {m['title']}  ({m['first_seen']} → {m['last_seen']})")
+    else:
+        if len(rest) < 2:
+            print("usage: history_db.py state <company> <YYYYMMDD>")
+            return
+        result = state_on(company, rest[1])
+        elapsed = (time.monotonic() - started) * 1000
+        if result is None:
+            print("[WARN] history DB out of sync — run rebuild")
+            return
+        day, records = result
+        print(f"== {company['name']} — {len(records)} open position(s) as of {day} ({elapsed:.1f} ms) ==")
+        for r in sorted(records, key=lambda r: r.get("title", "")):
+            print(f"  {r.get('title', '')}  · {r.get('location', '')}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -9,12 +9,16 @@ later removed still lives, verbatim, in the last snapshot it appeared in.
 This module surfaces those "deleted" (no-longer-posted) positions and their
 full record without re-crawling anything.
 
+Both queries are answered from the SQLite history index (history_db.py) when
+it is in sync with the snapshots, and by walking the snapshots otherwise.
+
 CLI-testable:
     .venv/bin/python history_engine.py <company> [start YYYYMMDD] [end YYYYMMDD]
 """
 
 import sys
 
+import history_db
 from analysis_engine import (
     COMPANIES,
     resolve_company,
@@ -57,6 +61,10 @@ def deleted_positions(company, start=None, end=None):
     job that reopened and is now live is excluded). Sorted by last_seen desc, then
     title asc. Each item: {id, title, location, first_seen, last_seen}.
     """
+    indexed = history_db.deleted_positions(company, start, end)
+    if indexed is not None:
+        return indexed
+
     loaded, _, _ = _load_history(company, start, end)
     if not loaded:
         return []
@@ -96,6 +104,10 @@ def get_position_record(company, position_id, start=None, end=None):
     Most-recent full snapshot record (description/compensation/url included) for a
     position id within [start, end]. Returns (record, last_seen_date) or (None, None).
     """
+    indexed = history_db.get_position_record(company, position_id, start, end)
+    if indexed is not None:
+        return indexed
+
     loaded, _, _ = _load_history(company, start, end)
     for date, data in reversed(loaded):
         for p in data:
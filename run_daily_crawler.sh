@@ -27,8 +27,11 @@ echo "========================================" | tee -a "$LOG_FILE"
 # Activate virtual environment and run crawler
 source "$PROJECT_DIR/.venv/bin/activate"
 
-# Run the daily crawler
-python3 "$PROJECT_DIR/daily_crawler.py" 2>&1 | tee -a "$LOG_FILE"
+# Run the daily crawler (companies crawled in parallel, one process each)
+python3 "$PROJECT_DIR/daily_crawler.py" --max-workers 7 2>&1 | tee -a "$LOG_FILE"
+
+# Phase timings (p50/p95) vs. the last 7 days — flags slow phases
+python3 "$PROJECT_DIR/company_crawler/common/metrics.py" 2>&1 | tee -a "$LOG_FILE"
 
 # Log end time
 echo "" | tee -a "$LOG_FILE"
@@ -76,5 +79,7 @@ echo "" | tee -a "$LOG_FILE"
 
 # Keep only last 30 days of logs
 find "$LOGS_DIR" -name "crawler_*.log" -mtime +30 -delete
+# Metrics are small; keep 90 days for trend comparisons
+find "$LOGS_DIR/metrics" -name "*.jsonl" -mtime +90 -delete 2>/dev/null
 
 exit 0
@@ -105,6 +105,8 @@ COMPANIES = {
 # Snapshot utilities
 # ==========================================
 
+import history_db
+import snapshot_store
 from compare_utils import compare_positions, compare_blogs, load_snapshot
 from analysis_engine import (
     resolve_company,
@@ -120,7 +122,7 @@ from history_engine import deleted_positions, get_position_record
 def find_snapshot(data_dir, prefix, file_type, date_str):
     """Find a snapshot file for a given date. e.g. 20260203_pi_positions.json"""
     path = data_dir / f"{date_str}_{prefix}_{file_type}.json"
-    if path.exists():
+    if snapshot_store.exists(path):
         return path
     return None
 
@@ -158,6 +160,13 @@ def compare_snapshots(start_date, end_date):
                 }
                 continue
 
+            if file_type == "positions":
+                # SQLite 이력 인덱스로 바뀐 공고만 읽음 (동기화 안 됐으면 None → 스냅샷 비교)
+                diff = history_db.compare(company, start_date, end_date)
+                if diff is not None:
+                    company_result[file_type] = diff
+                    continue
+
             prev_data = load_snapshot(start_file)
             curr_data = load_snapshot(end_file)
 
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+snapshot_store.py — content-addressed storage for the dated snapshots.
+
+A daily snapshot used to be a full copy of `*_positions.json` / `*_blog.json`,
+so every day stored every JD / post body again even though almost none of
+them change. Bodies now live once per company in a blob store, keyed by the
+sha256 of the text:
+
+    data/<company>/blobs/<sha[:2]>/<sha>.txt
+
+and a dated snapshot (`<YYYYMMDD>_<prefix>_<type>.json`, same name as before)
+is a manifest with the body fields replaced by references:
+
+    {"manifest": 1, "records": [{"id": ..., "title": ...,
+                                 "description": {"blob": "<sha256>"}, ...}]}
+
+`read()` (used by compare_utils.load_snapshot) rehydrates a manifest into the
+exact list the full snapshot held and passes old full snapshots through, so
+the engines read both forms without knowing. The latest `*_positions.json` /
+`*_blog.json` files stay full — the crawlers and compare modules read them.
+
+SNAPSHOT_MODE=delta stores most days as a delta instead: a manifest keyframe
+every SNAPSHOT_KEYFRAME_DAYS snapshots, and in between
+`<YYYYMMDD>_<prefix>_<type>.delta.json` against the previous snapshot:
+
+    {"delta": 1, "base": "<YYYYMMDD>", "ids": [...this day's ids, in order],
+     "removed": [...], "added": {"<index>": record},
+     "changed": {"<index>": {"set": {field: value}, "unset": [field]}}}
+
+`read()` of the nominal `.json` path of a delta day rebuilds the list from the
+nearest keyframe (reconstructed states are cached), `state_at()` answers "the
+list as of this date", and `list_dates()` reports delta days like any other,
+so analysis_engine / history_engine see the same dates either way.
+
+Migration of the existing history (rewrites every dated snapshot in place,
+after checking it reads back as the same list):
+
+    .venv/bin/python snapshot_store.py migrate [company] [--dry-run] [--delta]
+"""
+
+import os
+import sys
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Add company_crawler to path (common/snapshot_io.py)
+sys.path.insert(0, str(BASE_DIR / "company_crawler"))
+
+from common import snapshot_io
+
+# Record fields stored as blobs (JD / post bodies); everything else stays inline.
+BODY_FIELDS = ("description", "content")
+# Snapshot kinds written as manifests (pi_members is a plain name list).
+FILE_TYPES = ("positions", "blog")
+# Short bodies (empty JD, one-line excerpt-ish content) aren't worth a file.
+MIN_BLOB_CHARS = 200
+
+MANIFEST_VERSION = 1
+DELTA_VERSION = 1
+
+# "manifest" (one manifest per day) or "delta" (keyframes + daily deltas)
+SNAPSHOT_MODE = os.environ.get("SNAPSHOT_MODE", "manifest")
+KEYFRAME_DAYS = int(os.environ.get("SNAPSHOT_KEYFRAME_DAYS", "7"))
+DELTA_SUFFIX = ".delta.json"
+
+_MISSING = object()
+
+
+def blob_dir(data_dir):
+    return Path(data_dir) / "blobs"
+
+
+def is_manifest(data):
+    return isinstance(data, dict) and "manifest" in data
+
+
+def write_snapshot(records, snapshot_path, mode=None):
+    """Store bodies as blobs and write the day's manifest (or delta) for `snapshot_path`.
+
+    `snapshot_path` is always the nominal `<YYYYMMDD>_<prefix>_<type>.json`.
+    """
+    snapshot_path = Path(snapshot_path)
+    blobs = blob_dir(snapshot_path.parent)
+    records = [_dehydrate(r, blobs) for r in records]
+    _state.cache_clear()
+
+    if (mode or SNAPSHOT_MODE) == "delta":
+        delta = _delta_for(records, snapshot_path)
+        if delta is not None:
+            snapshot_io.write_json(_delta_path(snapshot_path), delta)
+            snapshot_io.unlink(snapshot_path)
+            return
+
+    snapshot_io.write_json(snapshot_path, {"manifest": MANIFEST_VERSION, "records": records})
+    snapshot_io.unlink(_delta_path(snapshot_path))
+
+
+def exists(snapshot_path):
+    """A snapshot (full, manifest or delta) is stored for this nominal path."""
+    snapshot_path = Path(snapshot_path)
+    return snapshot_io.exists(snapshot_path) or snapshot_io.exists(_delta_path(snapshot_path))
+
+
+def read(snapshot_path):
+    """Snapshot file -> list[dict] (manifest / delta rehydrated, full snapshot as-is)."""
+    snapshot_path = Path(snapshot_path)
+    if not snapshot_io.exists(snapshot_path):
+        data_dir, prefix, file_type, date = _parse(snapshot_path)
+        records = _state(str(data_dir), prefix, file_type, date)
+    else:
+        data = snapshot_io.read_json(snapshot_path)
+        if not is_manifest(data):
+            return data
+        records = data["records"]
+    blobs = str(blob_dir(snapshot_path.parent))
+    return [_rehydrate(r, blobs) for r in records]
+
+
+def list_dates(data_dir, prefix, file_type):
+    """Sorted YYYYMMDD dates with a snapshot of this type (any storage form)."""
+    dates = set()
+    for f in Path(data_dir).glob(f"[0-9]*_{prefix}_{file_type}.*"):
+        d, _, rest = snapshot_io.nominal(f).name.partition("_")
+        if len(d) == 8 and d.isdigit() and rest in (f"{prefix}_{file_type}.json",
+                                                    f"{prefix}_{file_type}{DELTA_SUFFIX}"):
+            dates.add(d)
+    return sorted(dates)
+
+
+def state_at(company, file_type, date):
+    """The list as of `date` (latest snapshot on or before it), or None if there is none."""
+    dates = [d for d in list_dates(company["data_dir"], company["prefix"], file_type) if d <= date]
+    if not dates:
+        return None
+    return read(Path(company["data_dir"]) / f"{dates[-1]}_{company['prefix']}_{file_type}.json")
+
+
+# ==========================================
+# Keyframe + delta encoding
+# ==========================================
+
+def _delta_path(snapshot_path):
+    return snapshot_path.with_name(snapshot_path.stem + DELTA_SUFFIX)
+
+
+def _parse(snapshot_path):
+    """Nominal path -> (data_dir, prefix, file_type, date)."""
+    date, rest = snapshot_path.stem.split("_", 1)
+    prefix, file_type = rest.rsplit("_", 1)
+    return snapshot_path.parent, prefix, file_type, date
+
+
+def _delta_for(records, snapshot_path):
+    """Delta against the previous snapshot, or None when this day must be a keyframe."""
+    data_dir, prefix, file_type, date = _parse(snapshot_path)
+    earlier = [d for d in list_dates(data_dir, prefix, file_type) if d < date]
+    if not earlier or not all(isinstance(r, dict) and "id" in r for r in records):
+        return None
+    base_date = earlier[-1]
+    chain = _chain_length(data_dir, prefix, file_type, base_date)
+    if chain is None or chain + 1 >= KEYFRAME_DAYS:
+        return None
+    base = _state(str(data_dir), prefix, file_type, base_date)
+
+    base_slots = _slots(base)
+    ids = [r["id"] for r in records]
+    added, changed = {}, {}
+    for idx, (slot, record) in enumerate(zip(_slot_keys(ids), records)):
+        prev = base_slots.get(slot)
+        if prev is None:
+            added[str(idx)] = record
+        elif prev != record:
+            changed[str(idx)] = {
+                "set": {k: v for k, v in record.items() if prev.get(k, _MISSING) != v},
+                "unset": [k for k in prev if k not in record],
+            }
+    current = set(_slot_keys(ids))
+    removed = [slot[0] for slot in base_slots if slot not in current]
+    return {"delta": DELTA_VERSION, "base": base_date, "ids": ids,
+            "removed": removed, "added": added, "changed": changed}
+
+
+def _chain_length(data_dir, prefix, file_type, date):
+    """Deltas between `date` and its keyframe — None if the keyframe is a legacy full snapshot."""
+    length = 0
+    while True:
+        path = Path(data_dir) / f"{date}_{prefix}_{file_type}.json"
+        if snapshot_io.exists(path):
+            return length if is_manifest(snapshot_io.read_json(path)) else None
+        date = snapshot_io.read_json(_delta_path(path))["base"]
+        length += 1
+
+
+@lru_cache(maxsize=512)
+def _state(data_dir, prefix, file_type, date):
+    """Stored (still dehydrated) records of one day, rebuilt from its keyframe.
+
+    Cached per day, so walking a date range applies every delta only once.
+    Callers must not mutate the result.
+    """
+    path = Path(data_dir) / f"{date}_{prefix}_{file_type}.json"
+    if snapshot_io.exists(path):
+        data = snapshot_io.read_json(path)
+        return data["records"] if is_manifest(data) else data
+
+    delta = snapshot_io.read_json(_delta_path(path))
+    base_slots = _slots(_state(data_dir, prefix, file_type, delta["base"]))
+    records = []
+    for idx, slot in enumerate(_slot_keys(delta["ids"])):
+        key = str(idx)
+        if key in delta["added"]:
+            records.append(delta["added"][key])
+            continue
+        record = dict(base_slots[slot])
+        change = delta["changed"].get(key)
+        if change:
+            record.update(change["set"])
+            for field in change["unset"]:
+                record.pop(field, None)
+        records.append(record)
+    return records
+
+
+def _slot_keys(ids):
+    # 같은 id가 여러 번 나오는 스냅샷(slug 충돌)도 n번째 등장끼리 짝지음
+    seen = {}
+    keys = []
+    for pid in ids:
+        n = seen.get(pid, 0)
+        seen[pid] = n + 1
+        keys.append((pid, n))
+    return keys
+
+
+def _slots(records):
+    return dict(zip(_slot_keys([r["id"] for r in records]), records))
+
+
+def _dehydrate(record, blobs):
+    if not isinstance(record, dict):
+        return record
+    out = dict(record)
+    for field in BODY_FIELDS:
+        body = out.get(field)
+        if isinstance(body, str) and len(body) >= MIN_BLOB_CHARS:
+            out[field] = {"blob": _put(blobs, body)}
+    return out
+
+
+def _rehydrate(record, blobs):
+    if not isinstance(record, dict):
+        return record
+    out = dict(record)
+    for field in BODY_FIELDS:
+        ref = out.get(field)
+        if isinstance(ref, dict) and "blob" in ref:
+            out[field] = _get(blobs, ref["blob"])
+    return out
+
+
+def _put(blobs, body):
+    key = sha256(body.encode("utf-8")).hexdigest()
+    path = blobs / key[:2] / f"{key}.txt"
+    if not snapshot_io.exists(path):
+        snapshot_io.write_text(path, body)
+    return key
+
+
+@lru_cache(maxsize=4096)
+def _get(blobs, key):
+    # 같은 본문이 수십 개 스냅샷에 나오므로 한 번 읽은 blob은 캐시
+    path = Path(blobs) / key[:2] / f"{key}.txt"
+    try:
+        return snapshot_io.read_text(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"snapshot blob missing: {path}") from None
+
+
+# ==========================================
+# Migration CLI
+# ==========================================
+
+def migrate(data_dir, dry_run=False, mode="manifest"):
+    """Rewrite the dated snapshots in `data_dir` as manifests (or keyframes + deltas).
+
+    Manifest mode only touches full snapshots; delta mode re-encodes every
+    positions / blog snapshot in date order. Returns (migrated, bytes_before,
+    bytes_after); blobs count towards after.
+    """
+    data_dir = Path(data_dir)
+    blobs = blob_dir(data_dir)
+    blobs_before = _tree_size(blobs)
+    migrated, before, after = 0, 0, 0
+
+    paths = {snapshot_io.nominal(p) for p in data_dir.glob("[0-9]*_*.json*")}
+    paths = [p for p in paths
+             if p.name.split("_")[0].isdigit() and p.stem.rsplit("_", 1)[-1] in FILE_TYPES]
+    for path in sorted(paths, key=lambda p: (p.stem.split("_", 1)[1], p.name)):
+        original = snapshot_io.read_json(path)
+        if not isinstance(original, list) and not (mode == "delta" and is_manifest(original)):
+            continue
+        size = snapshot_io.resolve(path).stat().st_size
+        if dry_run:
+            before += size
+            migrated += 1
+            continue
+
+        records = read(path)
+        write_snapshot(records, path, mode=mode)
+        _state.cache_clear()
+        if read(path) != records:
+            # 되돌리고 중단 — 손실 가능성이 있는 변환은 하지 않는다
+            snapshot_io.unlink(_delta_path(path))
+            snapshot_io.write_json(path, original)
+            raise RuntimeError(f"snapshot round-trip mismatch for {path}")
+        before += size
+        after += (snapshot_io.resolve(path) or snapshot_io.resolve(_delta_path(path))).stat().st_size
+        migrated += 1
+
+    after += _tree_size(blobs) - blobs_before
+    return migrated, before, after
+
+
+def _tree_size(root):
+    return sum(p.stat().st_size for p in Path(root).rglob("*") if p.is_file()) if Path(root).exists() else 0
+
+
+def _main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    dry_run = "--dry-run" in sys.argv
+    mode = "delta" if "--delta" in sys.argv else "manifest"
+    if not args or args[0] != "migrate":
+        print("usage: snapshot_store.py migrate [company] [--dry-run] [--delta]")
+        return
+
+    data_root = BASE_DIR / "data"
+    companies = args[1:] or sorted(p.name for p in data_root.iterdir() if p.is_dir())
+    for company in companies:
+        data_dir = data_root / company
+        if not data_dir.is_dir():
+            print(f"[WARN] No data directory: {data_dir}")
+            continue
+        migrated, before, after = migrate(data_dir, dry_run, mode)
+        if dry_run:
+            print(f"[INFO] {company}: {migrated} snapshot(s) to migrate ({before / 1e6:.1f} MB)")
+        else:
+            print(f"[INFO] {company}: migrated {migrated} snapshot(s) to {mode}, "
+                  f"{before / 1e6:.1f} MB -> {after / 1e6:.1f} MB (snapshots + new blobs)")
+
+
+if __name__ == "__main__":
+    _main()
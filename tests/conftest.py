@@ -0,0 +1,54 @@
+"""Shared test setup: crawler imports and a local stub server for the API clients.
+
+The crawlers import their helpers as `from common.x import ...` (company_crawler/
+is the working directory in production), so it goes on sys.path here too.
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+sys.path.insert(0, str(ROOT / "company_crawler"))
+
+
+@pytest.fixture
+def stub_server():
+    """127.0.0.1 HTTP server serving `tests/fixtures/<path>.json` (404 otherwise).
+
+    Yields (base_url, requests) — `requests` collects every request path with
+    its query string, so a test can check what the client asked for.
+    """
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.path)
+            path = FIXTURES / (urlsplit(self.path).path.strip("/") + ".json")
+            if not path.is_file():
+                self.send_error(404)
+                return
+            body = path.read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    try:
+        yield f"http://{host}:{port}", seen
+    finally:
+        server.shutdown()
+        server.server_close()
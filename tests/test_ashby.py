@@ -0,0 +1,103 @@
+"""common/ashby.py against a canned posting-API response (tests/fixtures/ashby/).
+
+The API path has to produce the same records the browser path scraped from
+the rendered board + detail pages, otherwise ids / description hashes break
+the history on the switch-over.
+"""
+
+import hashlib
+
+import pytest
+import requests
+
+from common import ashby
+from common.ashby_board import AshbyBoard
+
+ORG = "acme-robotics"
+
+
+@pytest.fixture
+def board_api(stub_server, monkeypatch):
+    base, seen = stub_server
+    monkeypatch.setattr(ashby, "ASHBY_API_URL", f"{base}/ashby/job-board")
+    return seen
+
+
+def test_fetch_board_drops_unlisted_jobs(board_api):
+    jobs = ashby.fetch_board(ORG)
+
+    assert [job["title"].strip() for job in jobs] == [
+        "Robot Learning Engineer", "Field Operator", "Hardware Engineer"]
+    assert board_api == [f"/ashby/job-board/{ORG}?includeCompensation=true"]
+
+
+def test_fetch_board_raises_on_empty_or_missing_board(board_api):
+    with pytest.raises(ValueError):
+        ashby.fetch_board("empty-board")
+    with pytest.raises(requests.HTTPError):
+        ashby.fetch_board("no-such-org")
+
+
+def test_posting_fields_match_the_dom_extractor(board_api):
+    fields = ashby.posting_fields(ORG, ashby.fetch_board(ORG)[0])
+
+    assert fields == {
+        "uuid": "0f5c2a4e-8b1d-4c3e-9a7f-1d2e3f4a5b6c",
+        "title": "Robot Learning Engineer",
+        "department": "Research",
+        "location": "San Francisco; Palo Alto",
+        "workplace": "OnSite",
+        "compensation": "$180K – $250K • Offers Equity",
+        "description": ("## About the role\n"
+                        "We build general-purpose robots.\n"
+                        " • Ship policies\n"
+                        "• Debug hardware\n"
+                        "\n\n## Benefits\n"
+                        "Equity"),
+        "url": f"https://jobs.ashbyhq.com/{ORG}/0f5c2a4e-8b1d-4c3e-9a7f-1d2e3f4a5b6c",
+    }
+
+
+def test_crawl_api_records_use_the_board_schema(board_api):
+    board = AshbyBoard("acme", ORG, "unused.json")
+    positions = board.crawl_api()
+
+    # 보드 목록 표기 ("... • On-site")와 같은 workplace 라벨, 보상 요약은 비어 있을 수 있음
+    assert [(p["workplace"], p["compensation"]) for p in positions] == [
+        ("On-site", "$180K – $250K • Offers Equity"),
+        ("Remote", ""),
+        ("Hybrid", ""),
+    ]
+    first = positions[0]
+    assert list(first) == ["id", "title", "department", "location", "workplace",
+                           "compensation", "description", "description_hash", "url"]
+    assert first["id"] == "0f5c2a4e-8b1d-4c3e-9a7f-1d2e3f4a5b6c"
+    assert first["description_hash"] == hashlib.sha256(
+        first["description"].encode("utf-8")).hexdigest()
+
+
+def test_title_location_board_ids_and_fields(board_api):
+    board = AshbyBoard("acme", ORG, "unused.json", id_scheme="title_location", board_fields=False)
+    positions = board.crawl_api()
+
+    assert [p["id"] for p in positions] == [
+        "robot-learning-engineer-san-francisco-palo-alto",
+        "field-operator-austin",
+        "hardware-engineer-boston",
+    ]
+    assert list(positions[0]) == ["id", "title", "location", "compensation",
+                                  "description", "description_hash", "url"]
+
+
+@pytest.mark.parametrize("html, text", [
+    # _DETAIL_JS: h2 -> '\n\n## ...\n', li -> '• ...\n', 비어 있지 않은 p -> '...\n'
+    ("<h2>Team</h2><p>Small</p>", "## Team\nSmall"),
+    ("<ul><li>One</li><li>Two <em>too</em></li></ul>", "• One\n• Two too"),
+    ("<p>A</p><p>\n</p><p>B</p>", "A\n\nB"),
+    # li 안의 p는 li 재작성으로 사라지므로 한 번만 줄바꿈
+    ("<ol><li><p>Nested</p></li></ol><p>After</p>", "• Nested\nAfter"),
+    # 태그 사이 공백 / 줄바꿈은 textContent 그대로
+    ("<div>x</div>\n<div>y</div>", "x\ny"),
+])
+def test_description_text_replays_the_detail_js(html, text):
+    assert ashby.description_text(html) == text
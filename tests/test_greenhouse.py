@@ -0,0 +1,79 @@
+"""Skild AI's Greenhouse API path against a recorded board response.
+
+tests/fixtures/greenhouse/ holds a boards-API `jobs?content=true` response
+and the job-boards.greenhouse.io detail page of each posting. The API records
+must match what the browser path builds from those pages (title from
+`h1.section-header`, location from the list card, `div.job__description`
+innerText), so ids and description hashes continue across the switch-over.
+"""
+
+import json
+
+import pytest
+from bs4 import BeautifulSoup
+
+from common import greenhouse
+from skild_ai import position_crawler as skild
+
+from conftest import FIXTURES
+
+RECORDED = FIXTURES / "greenhouse"
+
+
+@pytest.fixture
+def api_positions(stub_server, monkeypatch):
+    base, seen = stub_server
+    monkeypatch.setattr(greenhouse, "GREENHOUSE_API_URL", f"{base}/greenhouse/boards")
+    positions = skild._crawl_api()
+    assert seen == [f"/greenhouse/boards/{skild.GREENHOUSE_BOARD}/jobs?content=true"]
+    return positions
+
+
+def _browser_record(job_id, location):
+    """브라우저 경로와 같은 규칙으로 상세 페이지에서 만든 레코드."""
+    soup = BeautifulSoup((RECORDED / f"job_{job_id}.html").read_text(encoding="utf-8"), "html.parser")
+    detail = skild._read_detail_html(soup)
+    return {
+        "id": skild.normalize_id(detail["title"] + "__" + location),
+        "title": detail["title"],
+        "location": location,
+        "description": detail["description"],
+        "description_hash": skild.hash_text(detail["description"]),
+    }
+
+
+def test_api_records_continue_the_browser_history(api_positions):
+    jobs = json.loads((RECORDED / "boards" / skild.GREENHOUSE_BOARD / "jobs.json").read_text())["jobs"]
+    assert len(api_positions) == len(jobs)
+
+    for job, position in zip(jobs, api_positions):
+        expected = _browser_record(job["id"], job["location"]["name"])
+        assert {k: position[k] for k in expected} == expected
+        assert position["url"] == f"{skild.JOB_BOARD_URL}/jobs/{job['id']}"
+
+
+def test_api_ids_are_title_and_location(api_positions):
+    assert [p["id"] for p in api_positions] == [
+        "robotics-engineer-manipulation-pittsburgh-pa",
+        "software-engineer-data-infrastructure-san-mateo-ca",
+    ]
+
+
+def test_description_is_the_rendered_job_description(api_positions):
+    # escape된 content → div.job__description의 innerText (문단 사이 빈 줄, <br>은 줄바꿈)
+    assert api_positions[0]["description"] == (
+        "About Skild AI\n\n"
+        "We are building a general-purpose robotic brain.\n\n"
+        "What you will do\n\n"
+        "Train manipulation policies at scale\n"
+        "Deploy them on hardware\nand debug in the field\n\n"
+        "Teams in Pittsburgh & San Mateo\n\n"
+        "Skild AI is an equal opportunity employer."
+    )
+
+
+def test_detail_page_without_title_goes_to_the_browser():
+    # 제목이 없으면 HTTP 결과로 쓰지 않음 → fetch_details가 탭 풀에서 다시 로드
+    html = (RECORDED / "job_4012345.html").read_text(encoding="utf-8")
+    soup = BeautifulSoup(html.replace('class="section-header', 'class="x-header'), "html.parser")
+    assert skild._read_detail_html(soup) is None